@@ -0,0 +1,77 @@
+# ------------------------------------------------------------------------------
+# Program:     The LDAR Simulator (LDAR-Sim)
+# File:        emission_generation_benchmark.py
+# Purpose:     Benchmark of emission pre-generation for the granular_infrastructure example
+#              over 50 simulations
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License as published
+# by the Free Software Foundation, version 3.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+# You should have received a copy of the MIT License
+# along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+# ------------------------------------------------------------------------------
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+LDAR_SIM_ROOT = Path(__file__).resolve().parents[1] / "LDAR_Sim"
+sys.path.insert(0, str(LDAR_SIM_ROOT / "src"))
+
+import numpy as np  # noqa: E402
+
+from file_processing.input_processing.input_manager import InputManager  # noqa: E402
+from simulation.simulation_manager import SimulationManager  # noqa: E402
+
+N_SIMULATIONS = 50
+
+
+def setup_infrastructure(generator_dir: Path) -> SimulationManager:
+    parameter_files = list(
+        (LDAR_SIM_ROOT / "simulations" / "granular_infrastructure").glob("*.yaml")
+    )
+    sim_manager = SimulationManager(InputManager(), parameter_files)
+    sim_manager.generator_dir = generator_dir
+    sim_manager.preseed_random = False
+    np.random.seed(0)
+    sim_manager.setup_infrastructure()
+    return sim_manager
+
+
+if __name__ == "__main__":
+    os.chdir(LDAR_SIM_ROOT)
+    with tempfile.TemporaryDirectory() as generator_dir:
+        sim_manager = setup_infrastructure(Path(generator_dir))
+        infrastructure = sim_manager.infrastructure
+        start_date: date = sim_manager.sim_start_date
+        end_date: date = sim_manager.sim_end_date
+        n_emissions: int = 0
+        start = time.perf_counter()
+        for sim_number in range(N_SIMULATIONS):
+            np.random.seed(sim_number)
+            emissions = infrastructure.generate_emissions(
+                start_date, end_date, sim_number, sim_manager.pre_simulation_emissions
+            )
+            n_emissions += sum(
+                len(src_emissions)
+                for site in emissions[sim_number].values()
+                for eqg in site.values()
+                for comp in eqg.values()
+                for src_emissions in comp.values()
+            )
+        elapsed = time.perf_counter() - start
+    print(
+        f"granular_infrastructure, {N_SIMULATIONS} simulations ({start_date} to {end_date}): "
+        f"{n_emissions} emissions generated in {elapsed:.2f} s "
+        f"({elapsed / N_SIMULATIONS * 1000:.0f} ms per simulation)"
+    )
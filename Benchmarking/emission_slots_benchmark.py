@@ -0,0 +1,138 @@
+# ------------------------------------------------------------------------------
+# Program:     The LDAR Simulator (LDAR-Sim)
+# File:        emission_slots_benchmark.py
+# Purpose:     Benchmark of the memory used per emission and the pickle and unpickle
+#              throughput of emissions, comparing emissions holding their attributes in
+#              slots and pickled as tuples with emissions holding the same attributes in an
+#              instance dictionary pickled as a dictionary, as they were before.
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License as published
+# by the Free Software Foundation, version 3.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+# You should have received a copy of the MIT License
+# along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+# ------------------------------------------------------------------------------
+
+import gc
+import pickle
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+LDAR_SIM_ROOT = Path(__file__).resolve().parents[1] / "LDAR_Sim"
+sys.path.insert(0, str(LDAR_SIM_ROOT / "src"))
+
+from virtual_world.emission_types.emission import Emission  # noqa: E402
+from virtual_world.emission_types.intermittent_repairable_emission import (  # noqa: E402
+    IntermittentRepairableEmission,
+)
+from virtual_world.emission_types.non_repairable_emissions import (  # noqa: E402
+    NonRepairableEmission,
+)
+from virtual_world.emission_types.repairable_emission import RepairableEmission  # noqa: E402
+
+N_EMISSIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+SIM_START = date(2020, 1, 1)
+METHODS = ("M_OGI", "M_aircraft", "M_truck")
+
+
+class DictEmission:
+    """The attributes of an emission held in an instance dictionary and pickled through it"""
+
+    def __init__(self, emission: Emission) -> None:
+        for slot in emission._STATE_SLOTS:
+            setattr(self, slot, getattr(emission, slot))
+
+    def __reduce__(self):
+        return (self.__class__._reconstruct_emissions, (self.__dict__,))
+
+    @classmethod
+    def _reconstruct_emissions(cls, state: dict) -> "DictEmission":
+        emission = cls.__new__(cls)
+        emission.__dict__.update(state)
+        return emission
+
+
+def slots_copy(emission: Emission) -> Emission:
+    copy: Emission = emission.__class__.__new__(emission.__class__)
+    copy.__setstate__(emission._get_state())
+    return copy
+
+
+def gen_emissions() -> list[Emission]:
+    spat_covs: dict[str, float] = {method: 1.0 for method in METHODS}
+    emissions: list[Emission] = []
+    for emission_n in range(N_EMISSIONS):
+        start_date: date = SIM_START + timedelta(days=emission_n % 365)
+        if emission_n % 3 == 0:
+            emission = RepairableEmission(
+                emission_n, 0.5, start_date, SIM_START, True, spat_covs, spat_covs, 14, 200.0, 365
+            )
+        elif emission_n % 3 == 1:
+            emission = NonRepairableEmission(
+                emission_n, 0.5, start_date, SIM_START, False, spat_covs, spat_covs, 365
+            )
+        else:
+            emission = IntermittentRepairableEmission(
+                emission_n,
+                0.5,
+                start_date,
+                SIM_START,
+                True,
+                spat_covs,
+                spat_covs,
+                14,
+                200.0,
+                365,
+                2,
+                5,
+            )
+        emissions.append(emission)
+    return emissions
+
+
+def measure(build) -> tuple[float, list]:
+    """Bytes allocated per emission by build, and the emissions it built"""
+    gc.collect()
+    tracemalloc.start()
+    emissions: list = build()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / len(emissions), emissions
+
+
+def pickle_throughput(emissions: list) -> tuple[float, float, int]:
+    start = time.perf_counter()
+    pickled: bytes = pickle.dumps(emissions, protocol=pickle.HIGHEST_PROTOCOL)
+    dump_time: float = time.perf_counter() - start
+    start = time.perf_counter()
+    pickle.loads(pickled)
+    load_time: float = time.perf_counter() - start
+    return len(emissions) / dump_time, len(emissions) / load_time, len(pickled)
+
+
+if __name__ == "__main__":
+    emissions: list[Emission] = gen_emissions()
+    # Both copies share the values of the generated emissions, so only the objects are counted
+    dict_bytes, dict_emissions = measure(lambda: [DictEmission(emission) for emission in emissions])
+    slots_bytes, slots_emissions = measure(lambda: [slots_copy(emission) for emission in emissions])
+    print(f"{N_EMISSIONS} emissions")
+    for name, emission_list, per_emission in (
+        ("instance dictionaries", dict_emissions, dict_bytes),
+        ("slots", slots_emissions, slots_bytes),
+    ):
+        dumps_per_s, loads_per_s, size = pickle_throughput(emission_list)
+        print(
+            f"  {name:22s} {per_emission:6.0f} B per emission, "
+            f"pickle {dumps_per_s / 1e3:6.0f}k/s, unpickle {loads_per_s / 1e3:6.0f}k/s, "
+            f"{size / len(emission_list):5.0f} B pickled per emission"
+        )
@@ -0,0 +1,95 @@
+# ------------------------------------------------------------------------------
+# Program:     The LDAR Simulator (LDAR-Sim)
+# File:        follow_up_queue_benchmark.py
+# Purpose:     Benchmark of follow-up plan lookups with 100k queued follow-ups, comparing
+#              the indexed follow-up queue against draining and rebuilding the queue
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License as published
+# by the Free Software Foundation, version 3.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+# You should have received a copy of the MIT License
+# along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+# ------------------------------------------------------------------------------
+
+import random
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+LDAR_SIM_ROOT = Path(__file__).resolve().parents[1] / "LDAR_Sim"
+sys.path.insert(0, str(LDAR_SIM_ROOT / "src"))
+
+from utils.queue import IndexedPriorityQueueWithFIFO, PriorityQueueWithFIFO  # noqa: E402
+
+QUEUE_SIZES = [1_000, 10_000, 100_000]
+N_LOOKUPS = 20
+
+
+@dataclass
+class Plan:
+    site_id: str
+    rate_at_site: float
+
+
+def lookup_by_draining(plan_queue: PriorityQueueWithFIFO, site_id: str):
+    new_queue = PriorityQueueWithFIFO()
+    target_plan = None
+    while not plan_queue.empty():
+        prio, _, plan = plan_queue.get()
+        if plan.site_id == site_id:
+            target_plan = plan
+        else:
+            new_queue.put(prio, plan)
+    return new_queue, target_plan
+
+
+def fill(plan_queue, n_plans: int, rng: random.Random) -> None:
+    for i in range(n_plans):
+        plan = Plan(f"site_{i}", rng.random())
+        plan_queue.put((rng.randint(1, 3), plan.rate_at_site), plan)
+
+
+def time_draining(n_plans: int, site_ids: list[str]) -> float:
+    plan_queue = PriorityQueueWithFIFO()
+    fill(plan_queue, n_plans, random.Random(0))
+    start = time.perf_counter()
+    for site_id in site_ids:
+        plan_queue, plan = lookup_by_draining(plan_queue, site_id)
+        plan_queue.put((2, plan.rate_at_site), plan)
+    return (time.perf_counter() - start) / len(site_ids)
+
+
+def time_indexed(n_plans: int, site_ids: list[str]) -> float:
+    plan_queue = IndexedPriorityQueueWithFIFO(key=lambda plan: plan.site_id)
+    fill(plan_queue, n_plans, random.Random(0))
+    start = time.perf_counter()
+    for site_id in site_ids:
+        plan = plan_queue.remove(site_id)
+        plan_queue.put((2, plan.rate_at_site), plan)
+    return (time.perf_counter() - start) / len(site_ids)
+
+
+def main() -> None:
+    rng = random.Random(1)
+    print(f"{'queued':>8} {'drain (ms/lookup)':>18} {'indexed (ms/lookup)':>20} {'speedup':>8}")
+    for n_plans in QUEUE_SIZES:
+        site_ids = [f"site_{rng.randrange(n_plans)}" for _ in range(N_LOOKUPS)]
+        drain_time = time_draining(n_plans, site_ids)
+        # The indexed lookups are too quick to time individually, so many more are run
+        indexed_time = time_indexed(n_plans, site_ids * 1000)
+        print(
+            f"{n_plans:>8} {drain_time * 1e3:>18.3f} {indexed_time * 1e3:>20.4f}"
+            f" {drain_time / indexed_time:>8.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+# ------------------------------------------------------------------------------
+# Program:     The LDAR Simulator (LDAR-Sim)
+# File:        infrastructure_generation_benchmark.py
+# Purpose:     Benchmark of generating the sites of a large infrastructure, comparing the
+#              row by row lookups of the site types file (iterrows, a filtered site types
+#              frame and freshly generated propagating parameters for every site) with
+#              generating the sites from the site type rows and parameter sources that are
+#              resolved once. The granular_infrastructure inputs are replicated to N_SITES.
+#              Only the site loop of the infrastructure is reverted in the baseline, the
+#              equipment and source lookups made while constructing each site are shared.
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License as published
+# by the Free Software Foundation, version 3.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+# You should have received a copy of the MIT License
+# along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+# ------------------------------------------------------------------------------
+
+import os
+import random
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+LDAR_SIM_ROOT = Path(__file__).resolve().parents[1] / "LDAR_Sim"
+sys.path.insert(0, str(LDAR_SIM_ROOT / "src"))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+import virtual_world.infrastructure as infrastructure_module  # noqa: E402
+from constants.infrastructure_const import Infrastructure_Constants as IC  # noqa: E402
+from constants import param_default_const as pdc  # noqa: E402
+from file_processing.input_processing.infrastructure_processing import (  # noqa: E402
+    check_site_file,
+    read_in_infrastructure_files,
+)
+from file_processing.input_processing.input_manager import InputManager  # noqa: E402
+from simulation.simulation_manager import SimulationManager  # noqa: E402
+from virtual_world.infrastructure import Infrastructure  # noqa: E402
+from virtual_world.sites import Site  # noqa: E402
+
+N_SITES = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+
+def read_in_replicated_infrastructure_files(virtual_world, in_dir) -> dict[str, pd.DataFrame]:
+    """Read the infrastructure files, replicating the sites to N_SITES with unique IDs"""
+    infrastructure_inputs = read_in_infrastructure_files(virtual_world, in_dir)
+    sites_in: pd.DataFrame = infrastructure_inputs[IC.Virtual_World_Constants.SITES]
+    sites: pd.DataFrame = sites_in.sample(N_SITES, replace=True, random_state=0)
+    sites[IC.Sites_File_Constants.ID] = np.arange(1, N_SITES + 1)
+    infrastructure_inputs[IC.Virtual_World_Constants.SITES] = sites.reset_index(drop=True)
+    return infrastructure_inputs
+
+
+def get_equip(row: pd.Series, site_types_df: pd.DataFrame):
+    return site_types_df.loc[
+        site_types_df[IC.Virtual_World_Constants.SITE_TYPE]
+        == row[IC.Virtual_World_Constants.SITE_TYPE],
+        IC.Virtual_World_Constants.EQG,
+    ].iloc[0]
+
+
+class IterrowsInfrastructure(Infrastructure):
+    """The previous site generation, looking up the site type of every site row by row"""
+
+    def generate_infrastructure(self, virtual_world, methods, in_dir) -> None:
+        infrastructure_inputs = read_in_replicated_infrastructure_files(virtual_world, in_dir)
+        check_site_file(infrastructure_inputs)
+        sites_types_provided: bool = IC.Site_Type_File_Constants.TYPE in infrastructure_inputs
+        sites_in: pd.DataFrame = infrastructure_inputs[IC.Virtual_World_Constants.SITES]
+        sites_to_make = sites_in.sample(len(sites_in))
+
+        sites: list[Site] = []
+        for header in IC.Sites_File_Constants.OPTIONAL_SHARED_HEADERS:
+            if (
+                header not in sites_to_make.columns.to_list()
+                and sites_types_provided
+                and header
+                in infrastructure_inputs[IC.Site_Type_File_Constants.TYPE].columns.to_list()
+            ):
+                sites_to_make[header] = sites_to_make.apply(
+                    get_equip,
+                    args=(infrastructure_inputs[IC.Site_Type_File_Constants.TYPE],),
+                    axis=1,
+                )
+            elif header in sites_to_make.columns.to_list():
+                pass
+            else:
+                sites_to_make[header] = 0
+
+        for sidx, srow in sites_to_make.iterrows():
+            site_type_info = None
+            if sites_types_provided:
+                site_types_info = infrastructure_inputs[IC.Site_Type_File_Constants.TYPE]
+                site_type = srow[IC.Sites_File_Constants.TYPE]
+                site_type_info = site_types_info.loc[
+                    site_types_info[IC.Site_Type_File_Constants.TYPE] == site_type
+                ].iloc[0]
+            propagating_params = self.generate_propagating_params(
+                virtual_world=virtual_world, methods=methods
+            )
+            self.update_propagating_params(
+                propagating_params,
+                site_row_df_info=srow,
+                site_type_info=site_type_info,
+                methods=methods,
+            )
+            sites.append(
+                Site(
+                    id=srow[IC.Sites_File_Constants.ID],
+                    lat=srow[IC.Sites_File_Constants.LAT],
+                    long=srow[IC.Sites_File_Constants.LON],
+                    equipment_groups=srow[IC.Sites_File_Constants.EQG],
+                    propagating_params=propagating_params,
+                    infrastructure_inputs=infrastructure_inputs,
+                    start_date=date(*virtual_world[pdc.Virtual_World_Params.START_DATE]),
+                    methods=methods,
+                    site_type=srow[IC.Sites_File_Constants.TYPE],
+                )
+            )
+        self._sites: list[Site] = sites
+
+
+def time_generation(infrastructure_class: type, sim_manager: SimulationManager) -> float:
+    np.random.seed(0)
+    random.seed(0)
+    start = time.perf_counter()
+    infrastructure = infrastructure_class(
+        sim_manager.virtual_world, sim_manager.methods, sim_manager.in_dir
+    )
+    elapsed = time.perf_counter() - start
+    assert len(infrastructure._sites) == N_SITES
+    return elapsed
+
+
+if __name__ == "__main__":
+    os.chdir(LDAR_SIM_ROOT)
+    sim_dir: Path = LDAR_SIM_ROOT / "simulations" / "granular_infrastructure"
+    parameter_files = list(sim_dir.glob("*.yaml"))
+    sim_manager = SimulationManager(InputManager(), parameter_files)
+    sim_manager.virtual_world[pdc.Virtual_World_Params.N_SITES] = None
+    infrastructure_module.read_in_infrastructure_files = read_in_replicated_infrastructure_files
+
+    iterrows_time: float = time_generation(IterrowsInfrastructure, sim_manager)
+    precomputed_time: float = time_generation(Infrastructure, sim_manager)
+    print(f"{N_SITES} sites generated from the granular_infrastructure inputs")
+    print(f"  iterrows and site type lookups per site:   {iterrows_time:8.2f} s")
+    print(f"  precomputed site type rows and parameters: {precomputed_time:8.2f} s")
+    print(f"  speed-up: {iterrows_time / precomputed_time:.1f}x")
@@ -0,0 +1,147 @@
+# ------------------------------------------------------------------------------
+# Program:     The LDAR Simulator (LDAR-Sim)
+# File:        pregenerated_emissions_benchmark.py
+# Purpose:     Benchmark of loading the pregenerated emissions of every simulation, comparing
+#              the pickled emission objects with the memory mapped columnar emissions files.
+#              Reports the time taken to load the emissions of N_SIMS simulations of the
+#              granular_infrastructure inputs replicated to N_SITES, and the time taken to
+#              load them and take every emission from the source queues.
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License as published
+# by the Free Software Foundation, version 3.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+# You should have received a copy of the MIT License
+# along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+# ------------------------------------------------------------------------------
+
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+LDAR_SIM_ROOT = Path(__file__).resolve().parents[1] / "LDAR_Sim"
+sys.path.insert(0, str(LDAR_SIM_ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import numpy as np  # noqa: E402
+
+import virtual_world.infrastructure as infrastructure_module  # noqa: E402
+from constants import param_default_const as pdc  # noqa: E402
+from constants.file_name_constants import Generator_Files  # noqa: E402
+from file_processing.input_processing.input_manager import InputManager  # noqa: E402
+from infrastructure_generation_benchmark import (  # noqa: E402
+    read_in_replicated_infrastructure_files,
+)
+from initialization.initialize_emissions import read_in_emissions  # noqa: E402
+from simulation.simulation_manager import SimulationManager  # noqa: E402
+from virtual_world.infrastructure import Infrastructure  # noqa: E402
+from virtual_world.pregenerated_emissions import gen_emission_rows  # noqa: E402
+
+N_SITES = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+N_SIMS = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+
+def write_emissions_files(
+    sim_manager: SimulationManager, pickle_dir: Path, columnar_dir: Path
+) -> tuple[int, int, int]:
+    """Generate the emissions of every simulation once and write them in both formats"""
+    n_emissions: int = 0
+    for sim_number in range(N_SIMS):
+        np.random.seed(sim_number)
+        emissions: dict = sim_manager.infrastructure.generate_emissions(
+            sim_manager.sim_start_date,
+            sim_manager.sim_end_date,
+            sim_number,
+            sim_manager.pre_simulation_emissions,
+        )
+        with open(pickle_dir / Generator_Files.GEN_INFRA_EMISS.format(i=sim_number), "wb") as f:
+            pickle.dump(emissions, f)
+        emission_rows: np.ndarray = gen_emission_rows(
+            emissions[sim_number], sim_manager.sim_start_date
+        )
+        columnar_file: str = Generator_Files.GEN_INFRA_EMISS_ARRAY.format(i=sim_number)
+        np.save(columnar_dir / columnar_file, emission_rows)
+        n_emissions += len(emission_rows)
+    pickle_size: int = sum(f.stat().st_size for f in pickle_dir.iterdir())
+    columnar_size: int = sum(f.stat().st_size for f in columnar_dir.iterdir())
+    return n_emissions, pickle_size, columnar_size
+
+
+def take_all_emissions(infrastructure: Infrastructure, sim_number: int) -> None:
+    for site in infrastructure._sites:
+        for eqg in site._equipment_groups:
+            for comp in eqg._component:
+                for src in comp._sources:
+                    queue = src._generated_emissions[sim_number]
+                    while queue:
+                        queue.pop()
+
+
+def time_loads(
+    infrastructure: Infrastructure, generator_dir: Path, start_date: date, take_emissions: bool
+) -> float:
+    start = time.perf_counter()
+    for sim_number in range(N_SIMS):
+        read_in_emissions(infrastructure, generator_dir, sim_number, start_date)
+        if take_emissions:
+            take_all_emissions(infrastructure, sim_number)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    os.chdir(LDAR_SIM_ROOT)
+    sim_dir: Path = LDAR_SIM_ROOT / "simulations" / "granular_infrastructure"
+    sim_manager = SimulationManager(InputManager(), list(sim_dir.glob("*.yaml")))
+    sim_manager.virtual_world[pdc.Virtual_World_Params.N_SITES] = None
+    infrastructure_module.read_in_infrastructure_files = read_in_replicated_infrastructure_files
+    np.random.seed(0)
+    random.seed(0)
+    sim_manager.infrastructure = Infrastructure(
+        sim_manager.virtual_world, sim_manager.methods, sim_manager.in_dir
+    )
+
+    with tempfile.TemporaryDirectory() as generator_dir:
+        pickle_dir: Path = Path(generator_dir) / "pickle"
+        columnar_dir: Path = Path(generator_dir) / "columnar"
+        pickle_dir.mkdir()
+        columnar_dir.mkdir()
+        n_emissions, pickle_size, columnar_size = write_emissions_files(
+            sim_manager, pickle_dir, columnar_dir
+        )
+        print(
+            f"{N_SIMS} simulations of {N_SITES} sites from the granular_infrastructure inputs, "
+            f"{n_emissions / N_SIMS:.0f} emissions per simulation"
+        )
+        results: dict[str, tuple[float, float, int]] = {}
+        for name, directory, size in (
+            ("pickle", pickle_dir, pickle_size),
+            ("columnar", columnar_dir, columnar_size),
+        ):
+            load_time: float = time_loads(
+                sim_manager.infrastructure, directory, sim_manager.sim_start_date, False
+            )
+            take_time: float = time_loads(
+                sim_manager.infrastructure, directory, sim_manager.sim_start_date, True
+            )
+            results[name] = (load_time, take_time, size)
+            print(
+                f"  {name:9s} load {load_time:7.2f} s, load and create every emission "
+                f"{take_time:7.2f} s, files {size / 1e6:8.1f} MB"
+            )
+    pickle_load, pickle_take, _ = results["pickle"]
+    columnar_load, columnar_take, _ = results["columnar"]
+    print(
+        f"  load {pickle_load / columnar_load:.1f}x faster, "
+        f"load and create every emission {pickle_take / columnar_take:.1f}x faster"
+    )
@@ -0,0 +1,110 @@
+# ------------------------------------------------------------------------------
+# Program:     The LDAR Simulator (LDAR-Sim)
+# File:        priority_queue_benchmark.py
+# Purpose:     Benchmark of the survey and crew queue traffic of a 10 year program with
+#              20 crews and 5k sites, comparing the heapq based PriorityQueueWithFIFO against
+#              the previous queue.PriorityQueue based implementation
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License as published
+# by the Free Software Foundation, version 3.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+# You should have received a copy of the MIT License
+# along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+# ------------------------------------------------------------------------------
+
+import itertools
+import queue
+import random
+import sys
+import time
+from pathlib import Path
+
+LDAR_SIM_ROOT = Path(__file__).resolve().parents[1] / "LDAR_Sim"
+sys.path.insert(0, str(LDAR_SIM_ROOT / "src"))
+
+from utils.queue import PriorityQueueWithFIFO  # noqa: E402
+
+N_YEARS = 10
+N_CREWS = 20
+N_SITES = 5_000
+SURVEYS_PER_YEAR = 4
+SITES_PER_CREW_DAY = 8
+UNFINISHED_FRACTION = 0.1
+CREW_MINUTES = 8 * 60
+
+
+class LockingPriorityQueueWithFIFO(queue.PriorityQueue):
+    """The previous implementation, kept here as the baseline"""
+
+    def __init__(self):
+        super().__init__()
+        self.counter = itertools.count()
+
+    def put(self, priority, item):
+        super().put((priority, next(self.counter), item))
+
+
+def run_program(queue_cls) -> int:
+    """Replay the queue operations made by the schedule and deploy_crews over the program.
+    Returns the number of surveys done so both implementations can be checked to agree.
+    """
+    rng = random.Random(0)
+    survey_queue = queue_cls()
+    daily_due = N_SITES * SURVEYS_PER_YEAR // 365
+    surveys_done = 0
+    for day in range(365 * N_YEARS):
+        for site in range(daily_due):
+            survey_queue.put(1, (day * daily_due + site) % N_SITES)
+        # Schedule: pop the daily plan
+        daily_plan = []
+        for _ in range(N_CREWS * SITES_PER_CREW_DAY):
+            if survey_queue.empty():
+                break
+            daily_plan.append(survey_queue.get()[2])
+        # Method: assign the crew with the most time left to each site
+        crew_queue = queue_cls()
+        for crew_id in range(N_CREWS):
+            crew_queue.put((-CREW_MINUTES, crew_id), [crew_id, CREW_MINUTES])
+        for site in daily_plan:
+            if crew_queue.empty():
+                survey_queue.put(0, site)
+                continue
+            _, _, crew = crew_queue.get()
+            crew[1] -= rng.randint(30, 90)
+            if crew[1] > 0:
+                crew_queue.put((-crew[1], crew[0]), crew)
+            if rng.random() < UNFINISHED_FRACTION:
+                survey_queue.put(0, site)
+            else:
+                surveys_done += 1
+    return surveys_done
+
+
+def time_program(queue_cls) -> tuple[float, int]:
+    start = time.perf_counter()
+    surveys_done = run_program(queue_cls)
+    return time.perf_counter() - start, surveys_done
+
+
+def main() -> None:
+    locking_time, locking_surveys = time_program(LockingPriorityQueueWithFIFO)
+    heapq_time, heapq_surveys = time_program(PriorityQueueWithFIFO)
+    assert locking_surveys == heapq_surveys
+    print(f"{N_YEARS} years, {N_CREWS} crews, {N_SITES} sites, {heapq_surveys} surveys")
+    print(f"queue.PriorityQueue: {locking_time:.3f} s")
+    print(f"heapq:               {heapq_time:.3f} s")
+    print(
+        f"saved:               {locking_time - heapq_time:.3f} s"
+        f" ({locking_time / heapq_time:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
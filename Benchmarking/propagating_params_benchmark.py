@@ -0,0 +1,89 @@
+# ------------------------------------------------------------------------------
+# Program:     The LDAR Simulator (LDAR-Sim)
+# File:        propagating_params_benchmark.py
+# Purpose:     Benchmark of the propagating parameters passed down the infrastructure,
+#              comparing deep copies of the parameters for every equipment group and
+#              source with layers that share the values they do not override. Reports
+#              the build time and the pickle size of the generated sites, with the
+#              granular_infrastructure inputs replicated to N_SITES.
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License as published
+# by the Free Software Foundation, version 3.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+# You should have received a copy of the MIT License
+# along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+# ------------------------------------------------------------------------------
+
+import copy
+import os
+import pickle
+import random
+import sys
+import time
+from pathlib import Path
+
+LDAR_SIM_ROOT = Path(__file__).resolve().parents[1] / "LDAR_Sim"
+sys.path.insert(0, str(LDAR_SIM_ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import numpy as np  # noqa: E402
+
+import virtual_world.component as component_module  # noqa: E402
+import virtual_world.infrastructure as infrastructure_module  # noqa: E402
+import virtual_world.sites as sites_module  # noqa: E402
+from constants import param_default_const as pdc  # noqa: E402
+from file_processing.input_processing.input_manager import InputManager  # noqa: E402
+from infrastructure_generation_benchmark import (  # noqa: E402
+    read_in_replicated_infrastructure_files,
+)
+from simulation.simulation_manager import SimulationManager  # noqa: E402
+from virtual_world.infrastructure import Infrastructure  # noqa: E402
+from virtual_world.propagating_params import copy_propagating_params  # noqa: E402
+
+N_SITES = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+LAYERED_MODULES = (infrastructure_module, sites_module, component_module)
+
+
+def use_propagating_params_copy(copy_function) -> None:
+    for module in LAYERED_MODULES:
+        module.copy_propagating_params = copy_function
+
+
+def build_infrastructure(sim_manager: SimulationManager) -> tuple[float, int]:
+    np.random.seed(0)
+    random.seed(0)
+    start = time.perf_counter()
+    infrastructure = Infrastructure(
+        sim_manager.virtual_world, sim_manager.methods, sim_manager.in_dir
+    )
+    elapsed = time.perf_counter() - start
+    pickle_size: int = len(pickle.dumps(infrastructure._sites))
+    return elapsed, pickle_size
+
+
+if __name__ == "__main__":
+    os.chdir(LDAR_SIM_ROOT)
+    sim_dir: Path = LDAR_SIM_ROOT / "simulations" / "granular_infrastructure"
+    sim_manager = SimulationManager(InputManager(), list(sim_dir.glob("*.yaml")))
+    sim_manager.virtual_world[pdc.Virtual_World_Params.N_SITES] = None
+    infrastructure_module.read_in_infrastructure_files = read_in_replicated_infrastructure_files
+
+    use_propagating_params_copy(copy.deepcopy)
+    deepcopy_time, deepcopy_size = build_infrastructure(sim_manager)
+    use_propagating_params_copy(copy_propagating_params)
+    layered_time, layered_size = build_infrastructure(sim_manager)
+
+    print(f"{N_SITES} sites generated from the granular_infrastructure inputs")
+    print(f"  deep copies: {deepcopy_time:7.2f} s, pickle {deepcopy_size / 1e6:7.2f} MB")
+    print(f"  layers:      {layered_time:7.2f} s, pickle {layered_size / 1e6:7.2f} MB")
+    print(
+        f"  build {deepcopy_time / layered_time:.1f}x faster, "
+        f"pickle {deepcopy_size / layered_size:.1f}x smaller"
+    )
@@ -0,0 +1,106 @@
+# ------------------------------------------------------------------------------
+# Program:     The LDAR Simulator (LDAR-Sim)
+# File:        shared_weather_benchmark.py
+# Purpose:     Benchmark of sending the weather lookup to simulation worker processes,
+#              comparing pickled in-memory arrays with memory mapped shared arrays.
+#              Reports the peak RSS of the workers and the task start latency.
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License as published
+# by the Free Software Foundation, version 3.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+# You should have received a copy of the MIT License
+# along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+# ------------------------------------------------------------------------------
+
+import multiprocessing as mp
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "LDAR_Sim", "src"))
+)
+
+import numpy as np  # noqa: E402
+
+from weather.weather_lookup import WeatherLookup  # noqa: E402
+
+N_WORKERS = 8
+N_TASKS = 16
+N_YEARS = 2
+N_LAT = 10
+N_LON = 10
+
+
+def gen_weather_lookup() -> WeatherLookup:
+    rng = np.random.default_rng(0)
+    n_hours = N_YEARS * 365 * 24
+    shape = (n_hours, N_LAT, N_LON)
+    u_wind = rng.random(shape) * 10
+    v_wind = rng.random(shape) * 10
+    return WeatherLookup._reconstruct(
+        temps=rng.random(shape) * 40 - 20,
+        u_wind=u_wind,
+        v_wind=v_wind,
+        winds=np.sqrt(np.square(u_wind) + np.square(v_wind)),
+        precip=rng.random(shape),
+        time_total=np.arange(n_hours),
+        latitude=np.linspace(50, 55, N_LAT),
+        longitude=np.linspace(-115, -110, N_LON),
+        time_length=n_hours,
+        lat_length=N_LAT,
+        lon_length=N_LON,
+    )
+
+
+def weather_task(weather: WeatherLookup, submitted: float) -> tuple[float, int]:
+    started: float = time.time()
+    # Read one year of daily values at a single cell, as the weather checks of a program do
+    for day in range(365):
+        hours = range(day * 24, day * 24 + 24)
+        weather.temps[hours, 0, 0]
+        weather.winds[hours, 0, 0]
+        weather.precip[hours, 0, 0]
+    return started - submitted, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run_tasks(weather: WeatherLookup) -> tuple[float, float, int]:
+    start: float = time.perf_counter()
+    with mp.Pool(processes=N_WORKERS) as pool:
+        results = [pool.apply_async(weather_task, (weather, time.time())) for _ in range(N_TASKS)]
+        results = [result.get() for result in results]
+    elapsed: float = time.perf_counter() - start
+    latencies = [latency for latency, _ in results]
+    peak_rss_mb = max(rss for _, rss in results) / 1024
+    return elapsed, float(np.mean(latencies)), peak_rss_mb
+
+
+if __name__ == "__main__":
+    weather = gen_weather_lookup()
+    array_mb = weather.temps.nbytes / 1024**2
+    print(
+        f"{N_YEARS} years hourly on a {N_LAT}x{N_LON} grid "
+        f"({array_mb:.0f} MB per array), {N_WORKERS} workers, {N_TASKS} tasks"
+    )
+    elapsed, latency, rss = run_tasks(weather)
+    print(
+        f"In-memory arrays: total {elapsed:.2f} s, mean task start latency {latency:.3f} s, "
+        f"peak worker RSS {rss:.0f} MB"
+    )
+    with tempfile.TemporaryDirectory() as shared_dir:
+        weather.share_arrays(Path(shared_dir))
+        elapsed, latency, rss = run_tasks(weather)
+        print(
+            f"Shared arrays:    total {elapsed:.2f} s, mean task start latency {latency:.3f} s, "
+            f"peak worker RSS {rss:.0f} MB"
+        )
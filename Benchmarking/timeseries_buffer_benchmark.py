@@ -0,0 +1,105 @@
+# ------------------------------------------------------------------------------
+# Program:     The LDAR Simulator (LDAR-Sim)
+# File:        timeseries_buffer_benchmark.py
+# Purpose:     Micro-benchmark of the daily timeseries collection in LdarSim.run_simulation,
+#              comparing per-day DataFrame row appends with the preallocated buffer
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License as published
+# by the Free Software Foundation, version 3.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+# You should have received a copy of the MIT License
+# along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+# ------------------------------------------------------------------------------
+
+import os
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "LDAR_Sim", "src"))
+)
+
+import pandas as pd  # noqa: E402
+
+from constants.param_default_const import Output_Params as op  # noqa: E402
+from file_processing.output_processing.output_utils import (  # noqa: E402
+    EmisInfo,
+    TsEmisData,
+    TsMethodData,
+)
+from file_processing.output_processing.program_output_manager import (  # noqa: E402
+    ProgramOutputManager,
+)
+
+N_YEARS = 20
+N_METHODS = 10
+
+
+def gen_daily_rows(output_manager: ProgramOutputManager, method_names: list[str], n_days: int):
+    start_date = date(2000, 1, 1)
+    for day in range(n_days):
+        new_row = output_manager._init_ts_row(start_date + timedelta(days=day))
+        ts_emis_info = TsEmisData(
+            daily_emis=100.0 + day, daily_emis_mit=80.0 + day, active_leaks=day % 50
+        )
+        output_manager._update_ts_row_w_emis_info(new_row, ts_emis_info, EmisInfo())
+        ts_methods_info = [
+            TsMethodData(
+                method_name=method,
+                daily_deployment_cost=10.0 * i,
+                daily_tags=day % 3,
+                daily_flags=day % 2,
+                sites_visited=day % 7,
+                travel_time=30,
+                survey_time=120,
+            )
+            for i, method in enumerate(method_names)
+        ]
+        output_manager._update_ts_row_w_methods_info(new_row, ts_methods_info, day == 0)
+        yield day, new_row
+
+
+def run_row_appends(output_manager, method_names, n_days) -> pd.DataFrame:
+    timeseries = pd.DataFrame(columns=output_manager._init_ts_columns())
+    for _, new_row in gen_daily_rows(output_manager, method_names, n_days):
+        timeseries.loc[len(timeseries)] = new_row
+    return timeseries
+
+
+def run_preallocated(output_manager, method_names, n_days) -> pd.DataFrame:
+    ts_buffer = output_manager._init_ts_buffer(output_manager._init_ts_columns(), n_days)
+    for day, new_row in gen_daily_rows(output_manager, method_names, n_days):
+        output_manager._write_ts_row(ts_buffer, day, new_row)
+    return output_manager._build_ts_dataframe(ts_buffer)
+
+
+def time_run(run, output_manager, method_names, n_days) -> float:
+    start = time.perf_counter()
+    run(output_manager, method_names, n_days)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    method_names = [f"M{i}" for i in range(N_METHODS)]
+    n_days = (date(2000 + N_YEARS, 1, 1) - date(2000, 1, 1)).days
+    output_manager = ProgramOutputManager(
+        path=Path("."),
+        name_str="benchmark",
+        method_names=method_names,
+        output_config={op.PROGRAM_VISUALIZATIONS: {}},
+    )
+    row_append_time = time_run(run_row_appends, output_manager, method_names, n_days)
+    prealloc_time = time_run(run_preallocated, output_manager, method_names, n_days)
+    print(f"{N_YEARS} years ({n_days} days), {N_METHODS} methods")
+    print(f"Per-day DataFrame row appends: {row_append_time:.2f} s")
+    print(f"Preallocated timeseries buffer: {prealloc_time:.2f} s")
+    print(f"Speedup: {row_append_time / prealloc_time:.1f}x")
@@ -0,0 +1,112 @@
+# ------------------------------------------------------------------------------
+# Program:     The LDAR Simulator (LDAR-Sim)
+# File:        weather_window_benchmark.py
+# Purpose:     Benchmark of loading a continent-scale, multi-year ERA5 style weather file
+#              for a program covering one province and one year, comparing reading the
+#              whole file with reading the window covering the sites and simulated dates.
+#              Reports the size of the weather arrays, the peak RSS and the load time.
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the MIT License as published
+# by the Free Software Foundation, version 3.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# MIT License for more details.
+# You should have received a copy of the MIT License
+# along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+# ------------------------------------------------------------------------------
+
+import multiprocessing as mp
+import resource
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+LDAR_SIM_ROOT = Path(__file__).resolve().parents[1] / "LDAR_Sim"
+sys.path.insert(0, str(LDAR_SIM_ROOT / "src"))
+
+import numpy as np  # noqa: E402
+from netCDF4 import Dataset  # noqa: E402
+
+from weather.weather_lookup import SHARED_WEATHER_ARRAYS, WeatherLookup  # noqa: E402
+
+WEATHER_FILE = "ERA5_north_america_2deg_hourly_2019_2020.nc"
+# North America on a 2 degree grid, descending latitudes as in ERA5 downloads
+LATITUDES = np.arange(76.0, 13.0, -2.0)
+LONGITUDES = np.arange(-170.0, -49.0, 2.0)
+FILE_START = np.datetime64("2019-01-01T00", "h")
+N_HOURS = 2 * 365 * 24 + 24
+# Alberta sites and a single simulated year
+SITE_BOUNDS = (49.0, 60.0, -120.0, -110.0)
+DATE_RANGE = (date(2020, 1, 1), date(2020, 12, 31))
+CHUNK_HOURS = 24 * 30
+
+
+def write_weather_file(in_dir: Path) -> None:
+    """Write an hourly file packed to shorts, as ERA5 files are"""
+    rng = np.random.default_rng(0)
+    shape = (N_HOURS, len(LATITUDES), len(LONGITUDES))
+    with Dataset(in_dir / WEATHER_FILE, "w") as weather_data:
+        weather_data.createDimension("time", shape[0])
+        weather_data.createDimension("latitude", shape[1])
+        weather_data.createDimension("longitude", shape[2])
+        time = weather_data.createVariable("time", "i4", ("time",))
+        time.units = "hours since 1900-01-01 00:00:00.0"
+        time.calendar = "gregorian"
+        time[:] = (FILE_START - np.datetime64("1900-01-01T00", "h")).astype(int) + np.arange(
+            shape[0]
+        )
+        weather_data.createVariable("latitude", "f4", ("latitude",))[:] = LATITUDES
+        weather_data.createVariable("longitude", "f4", ("longitude",))[:] = LONGITUDES
+        for var, offset, scale in (
+            ("t2m", 250.0, 50.0),
+            ("u10", -10.0, 20.0),
+            ("v10", -10.0, 20.0),
+            ("tp", 0.0, 0.005),
+        ):
+            variable = weather_data.createVariable(var, "i2", ("time", "latitude", "longitude"))
+            variable.scale_factor = scale / 60000
+            variable.add_offset = offset + scale / 2
+            for start in range(0, shape[0], CHUNK_HOURS):
+                end = min(start + CHUNK_HOURS, shape[0])
+                variable[start:end] = offset + rng.random((end - start, *shape[1:])) * scale
+
+
+def load_weather(in_dir: Path, windowed: bool) -> tuple[float, float, float, tuple]:
+    start: float = time.perf_counter()
+    if windowed:
+        weather = WeatherLookup(
+            {"weather_file": WEATHER_FILE}, in_dir, site_bounds=SITE_BOUNDS, date_range=DATE_RANGE
+        )
+    else:
+        weather = WeatherLookup({"weather_file": WEATHER_FILE}, in_dir)
+    elapsed: float = time.perf_counter() - start
+    array_mb: float = sum(getattr(weather, name).nbytes for name in SHARED_WEATHER_ARRAYS) / 1024**2
+    peak_rss_mb: float = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return elapsed, array_mb, peak_rss_mb, weather.temps.shape
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as in_dir:
+        in_dir = Path(in_dir)
+        write_weather_file(in_dir)
+        file_mb = (in_dir / WEATHER_FILE).stat().st_size / 1024**2
+        print(
+            f"{N_HOURS} hours on a {len(LATITUDES)}x{len(LONGITUDES)} grid ({file_mb:.0f} MB file)"
+            f", sites in {SITE_BOUNDS}, simulating {DATE_RANGE[0]} to {DATE_RANGE[1]}"
+        )
+        # Each load runs in a fresh process, so the peak RSS is that of the load alone
+        ctx = mp.get_context("spawn")
+        for label, windowed in (("Whole file", False), ("Windowed  ", True)):
+            with ctx.Pool(processes=1) as pool:
+                elapsed, array_mb, rss, shape = pool.apply(load_weather, (in_dir, windowed))
+            print(
+                f"{label}: arrays {shape}, {array_mb:.0f} MB, peak RSS {rss:.0f} MB, "
+                f"load {elapsed:.2f} s"
+            )
@@ -54,6 +54,7 @@ class Input_Processing_Messages:
     SPEC_FILE_READING_ERROR = "Error reading {file_type} file: {file}"
 
     MISSING_SITES_FILE_HEADER_ERROR = "The sites file is missing the column: {header}"
+    MISSING_SITE_TYPE_ERROR = "The site type {site_type} is missing from the site type file"
 
     NO_PERSISTENT_FIELD_FOR_SOURCES_WARNING = (
         "WARNING: The persistent field has not been provided for sources."
@@ -144,6 +145,15 @@ class Runtime_Error_Messages:
         "{deploy_type} for method: {method}"
     )
 
+    INVALID_WEATHER_OUT_OF_RANGE_ERROR = (
+        "Invalid weather_out_of_range: {policy}. Expected one of: {policies}"
+    )
+    WEATHER_DATE_OUT_OF_RANGE_ERROR = (
+        "The date {date} is outside of the weather file, which covers {start} to {end}. "
+        "Provide a weather file covering the simulation, or set weather_out_of_range "
+        "to cycle or clamp"
+    )
+
 
 class Versioning_Messages:
 
@@ -35,6 +35,7 @@ class Default_Files:
 class Generator_Files:
     PRESEED_FILE = "preseed.p"
     EMISSION_PRESEED_FILE = "emis_preseed.p"
+    RNG_ENTROPY_FILE = "rng_preseed_entropy.p"
     N_SIM_SAVE_FILE = "n_sim_saved.p"
 
     HASH_FILE = "gen_infrastructure_hashes.p"
@@ -43,6 +44,11 @@ class Generator_Files:
     GENERATOR_FOLDER = "generator"
 
     GEN_INFRA_EMISS = "gen_infrastructure_emissions_{i}.p"
+    GEN_INFRA_EMISS_ARRAY = "gen_infrastructure_emissions_{i}.npy"
+
+    WEATHER_ARRAY_FILE = "weather_{name}.npy"
+    DEPLOYMENT_DAYS_FILE = "weather_deployment_days_{key}.npy"
+    DAYLIGHT_FILE = "daylight_{key}.npy"
 
 
 @dataclass
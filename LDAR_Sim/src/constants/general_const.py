@@ -83,6 +83,23 @@ class Emission_Constants:
     NATURAL = "natural"
 
 
+@dataclass
+class RNG_Purposes:
+    EMISSION_GENERATION = "emission_generation"
+    SENSOR_DETECTION = "sensor_detection"
+    COVERAGE = "coverage"
+    QUANTIFICATION = "quantification"
+    TRAVEL_TIME = "travel_time"
+
+
+@dataclass
+class Weather_Time_Policies:
+    # How simulation dates outside of the weather file are mapped onto it
+    CYCLE = "cycle"
+    CLAMP = "clamp"
+    ERROR = "error"
+
+
 @dataclass
 class Placeholder_Constants:
     PLACEHOLDER_EQUIPMENT = "Placeholder_Equipment"
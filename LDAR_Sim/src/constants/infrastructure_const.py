@@ -27,6 +27,9 @@ class Infrastructure_Constants:
         EQG = "equipment"
         SITES = "sites"
         SITE_TYPE = "site_type"
+        # Indexes of the equipment and sources files, built when the sites are generated
+        EQG_ROWS = "equipment_rows"
+        SOURCE_ROWS = "source_rows"
 
     class Sites_File_Constants:
         LAT = "lat"  # Latitude
@@ -321,6 +321,9 @@ EMIS_DATA_FINAL_COL_ORDER = [
     EMIS_DATA_COL_ACCESSORS.REPAIRABLE,
 ]
 
+# Emission IDs are integers in the simulation and are zero-filled to this width in the outputs
+EMIS_ID_WIDTH = 10
+
 TIMESERIES_COLUMNS = [
     "Date",
     "Daily Emissions (Kg Methane)",
@@ -358,6 +361,24 @@ class TIMESERIES_COL_ACCESSORS:
     METH_DAILY_SURVEY_TIME = "{method} Survey Time (Minutes)"
 
 
+# Timeseries columns holding counts or minutes, written without decimals when integral
+TIMESERIES_INTEGER_COLUMNS = [
+    TIMESERIES_COL_ACCESSORS.ACT_LEAKS,
+    TIMESERIES_COL_ACCESSORS.NEW_LEAKS,
+    TIMESERIES_COL_ACCESSORS.REP_LEAKS,
+    TIMESERIES_COL_ACCESSORS.NAT_REP_LEAKS,
+    TIMESERIES_COL_ACCESSORS.TAGGED_LEAKS,
+]
+
+TIMESERIES_METH_INTEGER_COLUMNS = [
+    TIMESERIES_COL_ACCESSORS.METH_DAILY_FLAGS,
+    TIMESERIES_COL_ACCESSORS.METH_DAILY_TAGS,
+    TIMESERIES_COL_ACCESSORS.METH_DAILY_SITES_VIS,
+    TIMESERIES_COL_ACCESSORS.METH_DAILY_TRAVEL_TIME,
+    TIMESERIES_COL_ACCESSORS.METH_DAILY_SURVEY_TIME,
+]
+
+
 @dataclass
 class COST_SUMMARY_COLUMNS_ACCESSORS:
     PROG_NAME = TS_SUMMARY_COLUMNS_ACCESSORS.PROG_NAME
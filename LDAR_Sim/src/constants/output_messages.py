@@ -64,6 +64,10 @@ class RuntimeMessages:
     COMPLETE_WEATHER_DOWNLOAD = "Weather data download complete"
 
     GEN_EMISS = "Generating emissions for Set_{i} simulations"
+    COLUMNAR_EMIS_INTERMITTENT_WARNING = (
+        "Warning: columnar emissions are not supported for intermittent sources. "
+        "LDAR-Sim will update emissions individually."
+    )
 
     GEN_PRESEED = "Generating Random seed values for simulation..."
     GEN_PRESEED_EMISS = "Generating Random Seed values for emissions..."
@@ -62,6 +62,7 @@ class Virtual_World_Params:
     END_DATE = "end_date"
     WEATHER_FILE = "weather_file"
     CONSIDER_WEATHER = "consider_weather"
+    WEATHER_OUT_OF_RANGE = "weather_out_of_range"
     INFRA = "infrastructure"
     SITE_TYPE = "site_type_file"
     SITE = "sites_file"
@@ -92,6 +93,11 @@ class Sim_Setting_Params:
     PROCESS = "processes_count"
     SIMS = "simulation_count"
     PRESEED = "preseed_random"
+    COLUMNAR_EMIS = "columnar_emissions"
+    COLUMNAR_EMIS_CACHE = "columnar_emissions_cache"
+    PERSISTENT_POOL = "persistent_worker_pool"
+    SHARED_WEATHER = "shared_weather_arrays"
+    INDEPENDENT_RNG = "independent_rng_streams"
 
 
 @dataclass
@@ -132,6 +138,7 @@ class Method_Params:
     TIME = "survey_time"
     MAX_WORKDAY = "max_workday"
     REPORTING_DELAY = "reporting_delay"
+    BATCH_DETECTION = "batch_detection"
     T_BW_SITES = "time_between_sites"
     SCHEDULING = "scheduling"
     DEPLOYMENT_MONTHS = "deployment_months"
@@ -21,7 +21,9 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 import logging
 import sys
 from pandas import DataFrame, read_csv, Series
+from numpy import minimum, ndarray, zeros
 from numpy.random import choice as random_sample
+from numpy.random import Generator
 from scipy import stats
 import json
 from pathlib import WindowsPath
@@ -32,6 +34,7 @@ from utils.unit_converter import gas_convert
 from constants.error_messages import Input_Processing_Messages as ipm
 from constants.file_processing_const import Emissions_Source_Processing_Const as esp
 import constants.general_const as gc
+from utils.rng_registry import get_rng
 
 
 # TODO add support for fitting a distribution to source data
@@ -76,6 +79,9 @@ class EmissionsSource:
     def get_a_rate(self) -> float:
         return 0.0
 
+    def get_rates(self, n_rates: int, rng: Generator = None) -> ndarray:
+        return zeros(n_rates)
+
 
 class EmissionsSourceDist(EmissionsSource):
     def __init__(
@@ -107,6 +113,18 @@ class EmissionsSourceDist(EmissionsSource):
         )
         return converted_rate
 
+    def get_rates(self, n_rates: int, rng: Generator = None) -> ndarray:
+        """Draw the rates of several emissions from the distribution in a single call."""
+        unconverted_rates: ndarray = minimum(
+            self._distribution.rvs(size=n_rates, random_state=rng), self._max_emis_rate
+        )
+        converted_rates: ndarray = gas_convert(
+            input_quantity=unconverted_rates,
+            input_metric=self._unit_amount,
+            input_increment=self._unit_time,
+        )
+        return converted_rates
+
     def generate_distribution(
         self, dist_type: str, dist_shape: str, dist_scale: str
     ) -> stats.rv_continuous:
@@ -149,6 +167,10 @@ class EmissionsSourceSample(EmissionsSource):
             sample = self._max_emis_rate
         return sample
 
+    def get_rates(self, n_rates: int, rng: Generator = None) -> ndarray:
+        """Draw the rates of several emissions from the samples in a single call."""
+        return minimum(get_rng(rng).choice(self._samples, size=n_rates), self._max_emis_rate)
+
 
 def read_in_emissions_sources_file(
     inputs_path: WindowsPath,
@@ -21,6 +21,7 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 import logging
 from pathlib import Path
 import sys
+import numpy as np
 from pandas import DataFrame, Series
 from file_processing.input_processing.file_reader import file_reader
 
@@ -65,9 +66,63 @@ def check_site_file(input_dict):
             sys.exit()
 
 
-def get_equip(row: Series, site_types_df: DataFrame):
-    return site_types_df.loc[
-        site_types_df[ic.Virtual_World_Constants.SITE_TYPE]
-        == row[ic.Virtual_World_Constants.SITE_TYPE],
-        ic.Virtual_World_Constants.EQG,
-    ].iloc[0]
+def get_first_site_types(site_types_df: DataFrame) -> DataFrame:
+    """The first row of each site type, which is the row used for all sites of the type"""
+    return site_types_df.drop_duplicates(subset=ic.Site_Type_File_Constants.TYPE, keep="first")
+
+
+def check_site_types(sites_df: DataFrame, site_types_df: DataFrame) -> None:
+    missing_types: Series = ~sites_df[ic.Sites_File_Constants.TYPE].isin(
+        site_types_df[ic.Site_Type_File_Constants.TYPE]
+    )
+    if missing_types.any():
+        logger: logging.Logger = logging.getLogger(__name__)
+        logger.error(
+            ipm.MISSING_SITE_TYPE_ERROR.format(
+                site_type=sites_df.loc[missing_types, ic.Sites_File_Constants.TYPE].iloc[0]
+            )
+        )
+        sys.exit()
+
+
+def get_site_type_values(sites_df: DataFrame, site_types_df: DataFrame, column: str) -> Series:
+    """The value of the column for the site type of each site, from the first site types"""
+    site_type_values: Series = site_types_df.set_index(ic.Site_Type_File_Constants.TYPE)[column]
+    return sites_df[ic.Sites_File_Constants.TYPE].map(site_type_values)
+
+
+def get_equipment_group_info(infrastructure_inputs: dict, equipment_group: str) -> Series:
+    """The first row of the equipment group in the equipment file. The rows are indexed by
+    equipment group on first use and the index is kept with the infrastructure inputs."""
+    equipment_group_rows: dict[str, Series] = infrastructure_inputs.get(
+        ic.Virtual_World_Constants.EQG_ROWS
+    )
+    if equipment_group_rows is None:
+        equip_groups_df: DataFrame = infrastructure_inputs[ic.Virtual_World_Constants.EQG]
+        first_rows: np.ndarray = np.flatnonzero(
+            ~equip_groups_df[ic.Equipment_Group_File_Constants.EQUIPMENT_GROUP].duplicated()
+        )
+        equipment_group_rows = {
+            row[ic.Equipment_Group_File_Constants.EQUIPMENT_GROUP]: row
+            for row in (equip_groups_df.iloc[position] for position in first_rows)
+        }
+        infrastructure_inputs[ic.Virtual_World_Constants.EQG_ROWS] = equipment_group_rows
+    return equipment_group_rows[equipment_group]
+
+
+def get_component_sources(infrastructure_inputs: dict, component: str) -> list[dict]:
+    """The rows of the sources file for the component, as records. The records are grouped
+    by component on first use and kept with the infrastructure inputs."""
+    source_rows: dict[str, list[dict]] = infrastructure_inputs.get(
+        ic.Virtual_World_Constants.SOURCE_ROWS
+    )
+    if source_rows is None:
+        sources_df: DataFrame = infrastructure_inputs[ic.Virtual_World_Constants.SOURCES]
+        columns: list[str] = sources_df.columns.to_list()
+        source_rows = {}
+        # Rows share the dtype of the whole table, as rows from iterrows do
+        for row in sources_df.to_numpy():
+            source: dict = dict(zip(columns, row))
+            source_rows.setdefault(source[ic.Sources_File_Constants.COMPONENT], []).append(source)
+        infrastructure_inputs[ic.Virtual_World_Constants.SOURCE_ROWS] = source_rows
+    return source_rows.get(component, [])
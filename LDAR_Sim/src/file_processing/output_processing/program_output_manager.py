@@ -36,8 +36,11 @@ from constants.file_name_constants import Output_Files
 from constants.output_file_constants import (
     TIMESERIES_COL_ACCESSORS as tca,
     TIMESERIES_COLUMNS,
+    TIMESERIES_INTEGER_COLUMNS,
+    TIMESERIES_METH_INTEGER_COLUMNS,
     EMIS_DATA_COL_ACCESSORS as eca,
     EMIS_INFO_COLUMNS_TO_KEEP_FOR_DURATION_ESTIMATION,
+    EMIS_ID_WIDTH,
 )
 from programs.program import Program
 from constants import error_messages
@@ -83,8 +86,7 @@ class ProgramOutputManager:
         measured_tf_df: pd.DataFrame,
     ) -> None:
         self.gen_sim_directory()
-        summary_filename = self.generate_file_names(Output_Files.EMISSIONS_SUMMARY_FILE)
-        self.save_results(overall_emission_data, summary_filename)
+        self.save_emissions_summary(overall_emission_data)
         for program_visualization in self.program_visualizations_to_make:
             visualization_function = self.PROGRAM_VISUALIZATION_FUNCTIONS_MAP.get(
                 program_visualization
@@ -138,6 +140,16 @@ class ProgramOutputManager:
         with open(filepath, "w", newline="") as f:
             data.to_csv(f, index=False, float_format="%.5f")
 
+    def save_emissions_summary(self, overall_emission_data: pd.DataFrame) -> None:
+        """Write the emissions summary, with the integer emission IDs zero-filled to
+        EMIS_ID_WIDTH digits.
+        """
+        summary_filename: str = self.generate_file_names(Output_Files.EMISSIONS_SUMMARY_FILE)
+        emis_ids: pd.Series = (
+            overall_emission_data[eca.EMIS_ID].astype(str).str.zfill(EMIS_ID_WIDTH)
+        )
+        self.save_results(overall_emission_data.assign(**{eca.EMIS_ID: emis_ids}), summary_filename)
+
     def _init_ts_row(self, current_date: date):
         new_ts_row: dict[str, Any] = {
             tca.DATE: current_date,
@@ -204,7 +216,7 @@ class ProgramOutputManager:
         new_row[tca.TAGGED_LEAKS] = total_leaks_tagged
 
     def _init_ts_columns(self) -> list[str]:
-        ts_columns = TIMESERIES_COLUMNS
+        ts_columns = TIMESERIES_COLUMNS.copy()
         for method in self._method_names:
             ts_columns.append(tca.METH_DAILY_DEPLOY_COST.format(method=method))
             ts_columns.append(tca.METH_DAILY_FLAGS.format(method=method))
@@ -214,5 +226,36 @@ class ProgramOutputManager:
             ts_columns.append(tca.METH_DAILY_SURVEY_TIME.format(method=method))
         return ts_columns
 
+    def _init_ts_buffer(self, ts_columns: list[str], n_days: int) -> dict[str, np.ndarray]:
+        """Preallocate one array per timeseries column for the whole simulation.
+        Numeric columns start as NaN so values that are never set stay empty in the outputs.
+        """
+        ts_buffer: dict[str, np.ndarray] = {}
+        for column in ts_columns:
+            if column == tca.DATE:
+                ts_buffer[column] = np.empty(n_days, dtype=object)
+            else:
+                ts_buffer[column] = np.full(n_days, np.nan)
+        return ts_buffer
+
+    def _write_ts_row(
+        self, ts_buffer: dict[str, np.ndarray], day_index: int, new_row: dict[str, Any]
+    ) -> None:
+        for column, value in new_row.items():
+            ts_buffer[column][day_index] = value
+
+    def _build_ts_dataframe(self, ts_buffer: dict[str, np.ndarray]) -> pd.DataFrame:
+        timeseries: pd.DataFrame = pd.DataFrame(ts_buffer)
+        integer_columns: list[str] = TIMESERIES_INTEGER_COLUMNS + [
+            column.format(method=method)
+            for method in self._method_names
+            for column in TIMESERIES_METH_INTEGER_COLUMNS
+        ]
+        for column in integer_columns:
+            values: pd.Series = timeseries[column]
+            if (values.dropna() % 1 == 0).all():
+                timeseries[column] = values.astype("Int64")
+        return timeseries
+
     def generate_file_names(self, concat_string: str) -> str:
         return "_".join([self.name_str, concat_string])
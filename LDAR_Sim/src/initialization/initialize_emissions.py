@@ -19,16 +19,20 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 """
 
 import logging
+import multiprocessing as mp
 from pathlib import Path
 import pickle
 import sys
 from datetime import date
 import numpy as np
 from virtual_world.infrastructure import Infrastructure
+from virtual_world.pregenerated_emissions import gen_emission_rows
 from initialization.preseed import gen_seed_timeseries
 from constants.file_name_constants import Generator_Files
 from constants.output_messages import RuntimeMessages as rm
 from constants.error_messages import Input_Processing_Messages as ipm
+from constants.general_const import RNG_Purposes
+from utils.rng_registry import RNGRegistry
 
 
 def initialize_emissions(
@@ -42,31 +46,16 @@ def initialize_emissions(
     generator_dir: Path,
     pre_simulation_emissions: bool,
     force_remake: bool = False,
+    n_processes: int = 1,
+    rng_registry: RNGRegistry = None,
+    columnar_cache: bool = False,
 ):
     n_sim_loc = generator_dir / Generator_Files.N_SIM_SAVE_FILE
     n_simulation_saved: int = 0
     # Store params used to generate the pickle files for change detection
     if not hash_file_exist or force_remake:
         # Generate emissions for all simulation sets
-        for i in range(n_sims):
-            if preseed:
-                np.random.seed(emis_preseed_val[i])
-            emissions: dict = {}
-            emis_file_loc = generator_dir / Generator_Files.GEN_INFRA_EMISS.format(i=i)
-            print(rm.GEN_EMISS.format(i=i))
-            emissions.update(
-                infrastructure.generate_emissions(
-                    sim_start_date=start_date,
-                    sim_end_date=end_date,
-                    sim_number=i,
-                    pre_simulation_emissions=pre_simulation_emissions,
-                )
-            )
-            with open(emis_file_loc, "wb") as f:
-                pickle.dump(emissions, f)
-
-        with open(n_sim_loc, "wb") as f:
-            pickle.dump(n_sims, f)
+        sims_to_generate: list[int] = list(range(n_sims))
     else:
         try:
             with open(n_sim_loc, "rb") as f:
@@ -77,31 +66,32 @@ def initialize_emissions(
             logger.error(ipm.GENERATOR_ERROR.format(file=Generator_Files.N_SIM_SAVE_FILE))
             sys.exit()
 
-        if n_simulation_saved < n_sims:
-            with open(n_sim_loc, "wb") as f:
-                pickle.dump(n_sims, f)
-
-            # More simulations are required. Generated emissions can still be re-used,
-            # but it is necessary to generate more emissions scenarios for the extra simulations
-            # Generate emissions for remaining simulation sets
-            for i in range(n_simulation_saved, n_sims):
-                if preseed:
-                    np.random.seed(emis_preseed_val[i])
-                print(rm.GEN_EMISS.format(i=i))
-                emis_file_loc = generator_dir / Generator_Files.GEN_INFRA_EMISS.format(i=i)
-                emissions: dict = {}
-                emissions.update(
-                    infrastructure.generate_emissions(
-                        sim_start_date=start_date,
-                        sim_end_date=end_date,
-                        sim_number=i,
-                        pre_simulation_emissions=pre_simulation_emissions,
-                    )
-                )
-                with open(emis_file_loc, "wb") as f:
-                    pickle.dump(emissions, f)
-
-    if preseed:
+        # More simulations may be required. Generated emissions can still be re-used,
+        # but it is necessary to generate more emissions scenarios for the extra simulations
+        sims_to_generate: list[int] = list(range(n_simulation_saved, n_sims))
+
+    if sims_to_generate:
+        generate_emissions_files(
+            infrastructure,
+            sims_to_generate,
+            get_emission_seeds(
+                sims_to_generate, preseed, emis_preseed_val, n_processes, rng_registry
+            ),
+            start_date,
+            end_date,
+            generator_dir,
+            pre_simulation_emissions,
+            n_processes,
+            rng_registry,
+            columnar_cache,
+        )
+        # Only record the simulation count once all emissions files have been written, so that
+        # an interrupted run is extended from the last complete count
+        with open(n_sim_loc, "wb") as f:
+            pickle.dump(max(n_sims, n_simulation_saved), f)
+
+    # Independent random number streams replace the daily reseeding of the global state
+    if preseed and rng_registry is None:
         seed_timeseries = gen_seed_timeseries(
             sim_end_date=end_date, sim_start_date=start_date, gen_dir=generator_dir
         )
@@ -110,8 +100,137 @@ def initialize_emissions(
     return seed_timeseries
 
 
-def read_in_emissions(infrastructure: Infrastructure, generator_dir: Path, sim_numb: int):
+def get_emission_seeds(
+    sim_numbers: list[int],
+    preseed: bool,
+    emis_preseed_val: list[int],
+    n_processes: int,
+    rng_registry: RNGRegistry = None,
+) -> list[int]:
+    """Get the seed used to generate the emissions of each simulation.
+
+    With preseeding, the emissions preseed of the simulation is used. Otherwise, the emissions of
+    sequentially generated simulations continue from the current random state, while emissions
+    generated in parallel are given seeds drawn from the current random state so that each
+    simulation has an independent stream. No seeds are needed when the simulations draw from
+    the streams of an RNG registry.
+    """
+    if rng_registry is not None:
+        return [None] * len(sim_numbers)
+    elif preseed:
+        return [emis_preseed_val[i] for i in sim_numbers]
+    elif n_processes > 1 and len(sim_numbers) > 1:
+        return np.random.randint(0, 2**32 - 1, size=len(sim_numbers), dtype=np.int64).tolist()
+    else:
+        return [None] * len(sim_numbers)
+
+
+def generate_emissions_files(
+    infrastructure: Infrastructure,
+    sim_numbers: list[int],
+    seeds: list[int],
+    start_date: date,
+    end_date: date,
+    generator_dir: Path,
+    pre_simulation_emissions: bool,
+    n_processes: int = 1,
+    rng_registry: RNGRegistry = None,
+    columnar_cache: bool = False,
+) -> None:
+    """Generate the emissions of the given simulations and write each set to its own
+    emissions file in the generator directory. When more than one process is allowed, the
+    simulations are spread over a process pool that receives the infrastructure once per worker.
+    With columnar_cache, the emissions are written as arrays rather than pickled objects.
+    """
+    tasks: list[tuple] = [
+        (
+            sim_number,
+            seed,
+            start_date,
+            end_date,
+            generator_dir,
+            pre_simulation_emissions,
+            rng_registry,
+            columnar_cache,
+        )
+        for sim_number, seed in zip(sim_numbers, seeds)
+    ]
+    n_processes = min(n_processes, len(tasks))
+    if n_processes > 1:
+        with mp.Pool(
+            processes=n_processes,
+            initializer=_init_emissions_worker,
+            initargs=(infrastructure,),
+        ) as p:
+            p.starmap(_generate_emissions_task, tasks)
+    else:
+        for task in tasks:
+            generate_emissions_file(infrastructure, *task)
+
+
+_worker_infrastructure: Infrastructure = None
+
+
+def _init_emissions_worker(infrastructure: Infrastructure) -> None:
+    global _worker_infrastructure
+    _worker_infrastructure = infrastructure
+
+
+def _generate_emissions_task(*args) -> int:
+    return generate_emissions_file(_worker_infrastructure, *args)
+
+
+def generate_emissions_file(
+    infrastructure: Infrastructure,
+    sim_number: int,
+    seed: int,
+    start_date: date,
+    end_date: date,
+    generator_dir: Path,
+    pre_simulation_emissions: bool,
+    rng_registry: RNGRegistry = None,
+    columnar_cache: bool = False,
+) -> int:
+    rng: np.random.Generator = None
+    if rng_registry is not None:
+        rng = rng_registry.spawn(sim_number).generator(RNG_Purposes.EMISSION_GENERATION)
+    elif seed is not None:
+        np.random.seed(seed)
+    print(rm.GEN_EMISS.format(i=sim_number))
+    emissions: dict = {}
+    emis_file_loc = generator_dir / Generator_Files.GEN_INFRA_EMISS.format(i=sim_number)
+    emis_array_loc = generator_dir / Generator_Files.GEN_INFRA_EMISS_ARRAY.format(i=sim_number)
+    emissions.update(
+        infrastructure.generate_emissions(
+            sim_start_date=start_date,
+            sim_end_date=end_date,
+            sim_number=sim_number,
+            pre_simulation_emissions=pre_simulation_emissions,
+            rng=rng,
+        )
+    )
+    # Only the file of the chosen format is kept, as the emissions are read from either
+    if columnar_cache:
+        np.save(emis_array_loc, gen_emission_rows(emissions[sim_number], start_date))
+        emis_file_loc.unlink(missing_ok=True)
+    else:
+        with open(emis_file_loc, "wb") as f:
+            pickle.dump(emissions, f)
+        emis_array_loc.unlink(missing_ok=True)
+    return sim_number
+
+
+def read_in_emissions(
+    infrastructure: Infrastructure, generator_dir: Path, sim_numb: int, sim_start_date: date
+):
     # Load emissions into the pregenerated infrastructure
+    emis_array_loc = generator_dir / Generator_Files.GEN_INFRA_EMISS_ARRAY.format(i=sim_numb)
+    if emis_array_loc.exists():
+        # The emissions are created from the memory mapped rows as they are activated
+        infrastructure.set_pregen_emission_rows(
+            np.load(emis_array_loc, mmap_mode="r"), sim_numb, sim_start_date
+        )
+        return infrastructure
     emissions: dict = {}
     emis_file_loc = generator_dir / Generator_Files.GEN_INFRA_EMISS.format(i=sim_numb)
     with open(emis_file_loc, "rb") as f:
@@ -1,37 +1,11 @@
 import os
 import pickle
 from virtual_world.infrastructure import Infrastructure
-import hashlib
-import json
 import numpy as np
 from constants.file_name_constants import Generator_Files
 import constants.param_default_const as pc
 from constants.output_messages import RuntimeMessages as rm
-
-
-def hash_file(file_path) -> str:
-    # Construct the hasher object
-    hasher: hashlib._Hash = hashlib.md5()
-
-    # Open the file to hash
-    with open(file_path, "rb") as f:
-        # Add bytes from the file to the hasher chunk by chunk
-        for chunk in iter(lambda: f.read(4096), b""):
-            hasher.update(chunk)
-    # Return the string containing the hex representation of the hash
-    return hasher.hexdigest()
-
-
-def hash_dict(in_dict) -> str:
-    # Convert the dictionary to a string after sorting it by keys.
-    # This ensure the same dictionary will produce the same string
-    json_str = json.dumps(in_dict, sort_keys=True)
-    # Construct the hasher object
-    hasher: hashlib._Hash = hashlib.md5()
-    # Add the bytes of the string to the hasher
-    hasher.update(json_str.encode("utf-8"))
-    # Return the string containing the hex representation of the hash
-    return hasher.hexdigest()
+from utils.generic_functions import hash_dict, hash_file
 
 
 def initialize_infrastructure(
@@ -83,6 +83,22 @@ def gen_seed_emis(n_sim: int, gen_dir) -> tuple[list[int], bool]:
     return preseed_val, force_remake
 
 
+def gen_rng_entropy(gen_dir) -> int:
+    """Return the root entropy of the random number streams, saved in the generator folder
+    so that later runs reproduce the same streams.
+    """
+    entropy_loc = gen_dir / Generator_Files.RNG_ENTROPY_FILE
+    if os.path.isfile(entropy_loc):
+        with open(entropy_loc, "rb") as f:
+            return pickle.load(f)
+    if not os.path.exists(gen_dir):
+        os.mkdir(gen_dir)
+    entropy: int = np.random.SeedSequence().entropy
+    with open(entropy_loc, "wb") as f:
+        pickle.dump(entropy, f)
+    return entropy
+
+
 def get_emis_seed(gen_dir) -> list[int]:
     preseed_loc = gen_dir / Generator_Files.EMISSION_PRESEED_FILE
     with open(preseed_loc, "rb") as f:
@@ -33,10 +33,7 @@ from file_processing.output_processing.output_utils import (
     TsEmisData,
     TsMethodData,
 )
-from constants.output_file_constants import (
-    EMIS_DATA_FINAL_COL_ORDER,
-    TIMESERIES_COL_ACCESSORS as tca,
-)
+from constants.output_file_constants import TIMESERIES_COL_ACCESSORS as tca
 from constants.output_messages import RuntimeMessages as rm
 from constants.param_default_const import Virtual_World_Params as vp
 
@@ -89,8 +86,9 @@ class LdarSim:
 
     def run_simulation(self):
         ts_columns = self._output_manager._init_ts_columns()
-        timeseries = pd.DataFrame(columns=ts_columns)
-        total_emissions_count: int = 0
+        ts_buffer: dict[str, np.ndarray] = self._output_manager._init_ts_buffer(
+            ts_columns, self._tc.get_simulation_length()
+        )
         first_day: bool = True
         while not self._tc.at_simulation_end():
             if self._preseed:
@@ -99,7 +97,6 @@ class LdarSim:
             new_row[tca.NEW_LEAKS] = self._infrastructure.activate_emissions(
                 self._tc.current_date, self._sim_number
             )
-            total_emissions_count += new_row[tca.NEW_LEAKS]
             ts_methods_info: list[TsMethodData] = self._program.do_daily_program_deployment()
             ts_emis_rep_info: EmisInfo = EmisInfo()
             ts_emis_info: TsEmisData = self._infrastructure.update_emissions_state(ts_emis_rep_info)
@@ -111,15 +108,15 @@ class LdarSim:
             )
             first_day = False
 
-            timeseries.loc[len(timeseries)] = new_row
+            self._output_manager._write_ts_row(ts_buffer, self._tc.day_index, new_row)
             self._program.update_date()
             self._tc.next_day()
 
         print(rm.SUMMARIZE_PROG.format(prog_name=self._program.name))
-        overall_emission_data: pd.DataFrame = pd.DataFrame(
-            columns=EMIS_DATA_FINAL_COL_ORDER, index=range(total_emissions_count)
+        timeseries: pd.DataFrame = self._output_manager._build_ts_dataframe(ts_buffer)
+        overall_emission_data: pd.DataFrame = self._infrastructure.gen_summary_emis_data(
+            self._tc._end_date
         )
-        self._infrastructure.gen_summary_emis_data(overall_emission_data, self._tc._end_date)
 
         self._output_manager.summarize_program_outputs(
             overall_emission_data,
@@ -20,7 +20,6 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 
 from datetime import date
 import logging
-from queue import PriorityQueue
 import sys
 from typing import Tuple
 from constants.error_messages import Input_Processing_Messages as ipm
@@ -38,13 +37,23 @@ from sensors.OGI_camera_zim import OGICameraZimSensor
 from sensors.METEC_NoWind_sensor import METECNWComponent
 from virtual_world.sites import Site
 import constants.param_default_const as pdc
+from utils.rng_registry import RNGRegistry
+from utils.queue import PriorityQueueWithFIFO
 
 
 class ComponentLevelMethod(Method):
     MEASUREMENT_SCALE = "component"
 
-    def __init__(self, name, properties, consider_weather, sites, input_dir: str):
-        super().__init__(name, properties, consider_weather, sites, input_dir)
+    def __init__(
+        self,
+        name,
+        properties,
+        consider_weather,
+        sites,
+        input_dir: str,
+        rng_registry: RNGRegistry = None,
+    ):
+        super().__init__(name, properties, consider_weather, sites, input_dir, rng_registry)
         self._emissions_tagged_daily: int = 0
 
     def update(self, current_date: date) -> TaggingFlaggingStats:
@@ -54,21 +63,13 @@ class ComponentLevelMethod(Method):
         self._emissions_tagged_daily = 0
         return tags_flags
 
-    def survey_site(
+    def _process_detections(
         self,
         crew: CrewDailyReport,
         survey_report: SiteSurveyReport,
         site_to_survey: Site,
-        weather,
         curr_date: date,
-    ) -> Tuple[SiteSurveyReport, float]:
-        survey_report, site_travel_time, last_site_survey, site_visited = super().survey_site(
-            crew=crew,
-            survey_report=survey_report,
-            site_to_survey=site_to_survey,
-            weather=weather,
-            curr_date=curr_date,
-        )
+    ) -> None:
         if survey_report.survey_complete:
             prev_tagging_survey_date: date = site_to_survey.get_latest_tagging_survey_date()
             days_since_last_survey: int = (curr_date - prev_tagging_survey_date).days
@@ -90,7 +91,6 @@ class ComponentLevelMethod(Method):
                             tagging_info=tagging_info,
                         )
                         self._emissions_tagged_daily += 1
-        return survey_report, site_travel_time, last_site_survey, site_visited
 
     def _initialize_sensor(self, sensor_info: dict, input_dir: str) -> None:
         """Will initialize a sensor of the correct type based
@@ -106,6 +106,7 @@ class ComponentLevelMethod(Method):
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.QUANTIFICATION_PARAMETERS],
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.Q_TYPE],
                 input_dir=input_dir,
+                rng_registry=self._rng_registry,
             )
         elif sensor_info[pdc.Method_Params.TYPE] == "OGI_camera_zim":
             self._sensor = OGICameraZimSensor(
@@ -113,6 +114,7 @@ class ComponentLevelMethod(Method):
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.QUANTIFICATION_PARAMETERS],
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.Q_TYPE],
                 input_dir=input_dir,
+                rng_registry=self._rng_registry,
             )
         elif sensor_info[pdc.Method_Params.TYPE] == "OGI_camera_rk":
             self._sensor = OGICameraRKSensor(
@@ -120,6 +122,7 @@ class ComponentLevelMethod(Method):
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.QUANTIFICATION_PARAMETERS],
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.Q_TYPE],
                 input_dir=input_dir,
+                rng_registry=self._rng_registry,
             )
         elif sensor_info[pdc.Method_Params.TYPE] == "METEC_no_wind":
             self._sensor = METECNWComponent(
@@ -127,6 +130,7 @@ class ComponentLevelMethod(Method):
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.QUANTIFICATION_PARAMETERS],
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.Q_TYPE],
                 input_dir=input_dir,
+                rng_registry=self._rng_registry,
             )
         else:
             logger: logging.Logger = logging.getLogger(__name__)
@@ -137,19 +141,15 @@ class ComponentLevelMethod(Method):
         """Deploy crews will send crews out to survey sites based on the provided workplan"""
         deploy_stats: CrewDeploymentStats = CrewDeploymentStats()
 
-        priority_queue = PriorityQueue()
-        day_time_remaining = self._max_work_hours
+        priority_queue = PriorityQueueWithFIFO()
         # Initialize the daily available survey time for existing crews
-        if self._daylight_sensitive:
-            day_time_remaining = self.get_daylight_hours(
-                daylight, self._max_work_hours, workplan.date
-            )
-        day_time_remaining = day_time_remaining * 60  # Convert time from hours to minutes
+        day_time_remaining = self._max_work_hours * 60  # Convert time from hours to minutes
+        # Daylight sensitive crews work the daylight hours at the first site they are sent to
+        crews_sent_out: set[int] = set()
         for crew in self._crew_reports:
-            # TODO : if method is daylight sensitive, check for max daylight
             crew.day_time_remaining = day_time_remaining
             crew.deployed = False
-            priority_queue.put((-crew.day_time_remaining, crew.crew_id, crew))
+            priority_queue.put((-crew.day_time_remaining, crew.crew_id), crew)
 
         incompleteSurveys: list[Tuple] = []
         # pop the site with the longest remaining hours to assign the next crew
@@ -162,6 +162,14 @@ class ComponentLevelMethod(Method):
                 # Get the crew with the most time remaining to work
                 _, _, assigned_crew = priority_queue.get()
                 assigned_crew: CrewDailyReport
+                if self._daylight_sensitive and assigned_crew.crew_id not in crews_sent_out:
+                    crews_sent_out.add(assigned_crew.crew_id)
+                    assigned_crew.day_time_remaining = (
+                        self.get_daylight_hours(
+                            daylight, self._max_work_hours, workplan.date, site_to_survey
+                        )
+                        * 60
+                    )
 
                 # Send the crew to attempt to survey the site
                 survey_report, travel_time, last_site_survey, site_visited = self.survey_site(
@@ -192,11 +200,8 @@ class ComponentLevelMethod(Method):
                 if assigned_crew.day_time_remaining > 0:
                     # Put the crew back into the queue if there's remaining work hours
                     priority_queue.put(
-                        (
-                            -assigned_crew.day_time_remaining,
-                            assigned_crew.crew_id,
-                            assigned_crew,
-                        )
+                        (-assigned_crew.day_time_remaining, assigned_crew.crew_id),
+                        assigned_crew,
                     )
 
                     if self.cost_type == self.PER_SITE_COST:
@@ -207,10 +212,11 @@ class ComponentLevelMethod(Method):
             # Update the survey planner. If the survey was not finished, the update will
             # indicate that the particular site needs to be requeued with higher priority
             incompleteSurveys.append((survey_report, survey_plan))
+        self._detect_pending_emissions()
+        for survey_report, survey_plan in incompleteSurveys:
             if survey_report.survey_complete:
                 self._site_survey_reports.append(survey_report)
-        for survey in incompleteSurveys:
-            workplan.add_survey_report(*survey)
+            workplan.add_survey_report(survey_report, survey_plan)
         # If the cost type for the method is per day, calculate the deployment cost for day
         # based off the number of crews being deployed
         if self.cost_type == self.PER_DAY_COST:
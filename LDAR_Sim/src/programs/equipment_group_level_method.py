@@ -28,6 +28,7 @@ from sensors.default_equipment_group_level_sensor import (
     DefaultEquipmentGroupLevelSensor,
 )
 import constants.param_default_const as pdc
+from utils.rng_registry import RNGRegistry
 
 
 class EquipmentGroupLevelMethod(SiteLevelMethod):
@@ -41,8 +42,11 @@ class EquipmentGroupLevelMethod(SiteLevelMethod):
         sites,
         follow_up_schedule: FollowUpMobileSchedule,
         input_dir: str,
+        rng_registry: RNGRegistry = None,
     ):
-        super().__init__(name, properties, consider_weather, sites, follow_up_schedule, input_dir)
+        super().__init__(
+            name, properties, consider_weather, sites, follow_up_schedule, input_dir, rng_registry
+        )
 
     def _initialize_sensor(self, sensor_info: dict, input_dir: str) -> None:
         """Will initialize a sensor of the correct type based
@@ -57,6 +61,7 @@ class EquipmentGroupLevelMethod(SiteLevelMethod):
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.QUANTIFICATION_PARAMETERS],
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.Q_TYPE],
                 input_dir=input_dir,
+                rng_registry=self._rng_registry,
             )
         elif sensor_info[pdc.Method_Params.TYPE] == "METEC_no_wind":
             self._sensor = METECNWEquipmentGroup(
@@ -64,6 +69,7 @@ class EquipmentGroupLevelMethod(SiteLevelMethod):
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.QUANTIFICATION_PARAMETERS],
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.Q_TYPE],
                 input_dir=input_dir,
+                rng_registry=self._rng_registry,
             )
         else:
             logger: logging.Logger = logging.getLogger(__name__)
@@ -21,7 +21,6 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 from datetime import date
 import logging
 import math
-from queue import PriorityQueue
 from random import choice
 import sys
 from typing import Tuple
@@ -42,6 +41,9 @@ from scheduling.schedule_dataclasses import (
     CrewDailyReport,
 )
 from scheduling.surveying_dataclasses import DetectionRecord
+from constants.general_const import RNG_Purposes
+from utils.rng_registry import RNGRegistry
+from utils.queue import PriorityQueueWithFIFO
 
 
 class Method:
@@ -51,6 +53,15 @@ class Method:
     PER_SITE_COST = "site"
     PER_DAY_COST = "day"
 
+    _travel_time_rng: np.random.Generator = None
+    # Whether detection is put off until every site of the day has been surveyed
+    _batch_detection: bool = False
+    # The days on which the weather allows the method to be deployed, set on the first check
+    _deployment_days: np.ndarray = None
+    # The day of the weather file for the date last checked
+    _weather_date: date = None
+    _weather_day: int = None
+
     # TODO ensure survey times aren't needed for methods
     def __init__(
         self,
@@ -59,10 +70,16 @@ class Method:
         consider_weather: bool,
         sites: "list[Site]",
         input_dir: str,
+        rng_registry: RNGRegistry = None,
     ) -> None:
         self._name: str = name
         self._deployment_type = properties[pdc.Method_Params.DEPLOYMENT_TYPE]
+        self._rng_registry: RNGRegistry = rng_registry
+        if rng_registry is not None:
+            self._travel_time_rng = rng_registry.generator(RNG_Purposes.TRAVEL_TIME)
         self._initialize_sensor(properties[pdc.Method_Params.SENSOR], input_dir)
+        self._batch_detection: bool = properties.get(pdc.Method_Params.BATCH_DETECTION, False)
+        self._pending_detections: list[tuple[CrewDailyReport, SiteSurveyReport, Site, date]] = []
         self._max_work_hours: int = properties.get(pdc.Method_Params.MAX_WORKDAY, 24)
         self._daylight_sensitive = properties[pdc.Method_Params.CONSIDER_DAYLIGHT]
         self._weather: bool = consider_weather
@@ -124,6 +141,7 @@ class Method:
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.QUANTIFICATION_PARAMETERS],
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.Q_TYPE],
                 input_dir=input_dir,
+                rng_registry=self._rng_registry,
             )
         else:
             logger: logging.Logger = logging.getLogger(__name__)
@@ -213,20 +231,16 @@ class Method:
         """Deploy crews will send crews out to survey sites based on the provided workplan"""
         deploy_stats: CrewDeploymentStats = CrewDeploymentStats()
 
-        priority_queue = PriorityQueue()
-        day_time_remaining = self._max_work_hours
+        priority_queue = PriorityQueueWithFIFO()
         # Initialize the daily available survey time for existing crews
-        if self._daylight_sensitive:
-            day_time_remaining = self.get_daylight_hours(
-                daylight, self._max_work_hours, workplan.date
-            )
-        day_time_remaining = day_time_remaining * 60  # Convert time from hours to minutes
+        day_time_remaining = self._max_work_hours * 60  # Convert time from hours to minutes
+        # Daylight sensitive crews work the daylight hours at the first site they are sent to
+        crews_sent_out: set[int] = set()
         # TODO Add logic to not deploy all crews if not necessary?
         for crew in self._crew_reports:
-            # TODO : if method is daylight sensitive, check for max daylight
             crew.day_time_remaining = day_time_remaining
             crew.deployed = False
-            priority_queue.put((-crew.day_time_remaining, crew.crew_id, crew))
+            priority_queue.put((-crew.day_time_remaining, crew.crew_id), crew)
 
         incompleteSurveys: list[Tuple] = []
         # pop the site with the longest remaining hours to assign the next crew
@@ -239,6 +253,14 @@ class Method:
                 # Get the crew with the most time remaining to work
                 _, _, assigned_crew = priority_queue.get()
                 assigned_crew: CrewDailyReport
+                if self._daylight_sensitive and assigned_crew.crew_id not in crews_sent_out:
+                    crews_sent_out.add(assigned_crew.crew_id)
+                    assigned_crew.day_time_remaining = (
+                        self.get_daylight_hours(
+                            daylight, self._max_work_hours, workplan.date, site_to_survey
+                        )
+                        * 60
+                    )
 
                 # Send the crew to attempt to survey the site
                 survey_report, travel_time, last_site_survey, site_visited = self.survey_site(
@@ -269,15 +291,12 @@ class Method:
                 if assigned_crew.day_time_remaining > 0:
                     # Put the crew back into the queue if there's remaining work hours
                     priority_queue.put(
-                        (
-                            -assigned_crew.day_time_remaining,
-                            assigned_crew.crew_id,
-                            assigned_crew,
-                        )
+                        (-assigned_crew.day_time_remaining, assigned_crew.crew_id),
+                        assigned_crew,
                     )
-            # Update the survey planner. If the survey was not finished, the update will
-            # indicate that the particular site needs to be requeued with higher priority
             incompleteSurveys.append((survey_report, survey_plan))
+        self._detect_pending_emissions()
+        for survey_report, survey_plan in incompleteSurveys:
             if survey_report.survey_complete:
                 detection_record: DetectionRecord = DetectionRecord(
                     site_id=survey_report.site_id,
@@ -291,14 +310,13 @@ class Method:
                 self._detection_records[workplan.date] = current_records
 
                 if self.cost_type == self.PER_SITE_COST:
-                    site_survey_cost = site_to_survey.get_survey_cost(self._name)
+                    site_survey_cost = survey_plan.get_site().get_survey_cost(self._name)
                     if site_survey_cost == 0 and self.cost > 0:
                         site_survey_cost = self.cost
                     deploy_stats.deployment_cost += site_survey_cost
-        for survey in incompleteSurveys:
             # Update the survey planner. If the survey was not finished, the update will
             # indicate that the particular site needs to be requeued with higher priority
-            workplan.add_survey_report(*survey)
+            workplan.add_survey_report(survey_report, survey_plan)
         # If the cost type for the method is per day, calculate the deployment cost for day
         # based off the number of crews being deployed
         if self.cost_type == self.PER_DAY_COST:
@@ -381,11 +399,7 @@ class Method:
                 survey_report.time_surveyed = site_survey_time
                 if crew.day_time_remaining <= site_travel_time:
                     last_site_survey = True
-                self._sensor.detect_emissions(
-                    site=site_to_survey,
-                    meth_name=self._name,
-                    survey_report=survey_report,
-                )
+                self._detect_emissions(crew, survey_report, site_to_survey, curr_date)
             # Cannot finish the whole site but can survey
             # TODO determine reasonable fraction of site that can be surveyed to make it worth going
             elif crew.day_time_remaining > (2 * site_travel_time):
@@ -411,6 +425,59 @@ class Method:
                 last_site_survey = True
         return survey_report, site_travel_time, last_site_survey, site_visit
 
+    def _detect_emissions(
+        self,
+        crew: CrewDailyReport,
+        survey_report: SiteSurveyReport,
+        site_to_survey: Site,
+        curr_date: date,
+    ) -> None:
+        """Detect emissions at a site once its survey is complete.
+
+        If the method's batch_detection parameter is set, the site is instead left for
+        _detect_pending_emissions to detect along with the rest of the day's sites, with one
+        sensor call. Batching draws the day's coverage, detection and quantification values kind
+        by kind rather than site by site. With the shared global random state this changes
+        which values each site gets, so results differ from unbatched runs with the same seed.
+        With independent_rng_streams each kind has its own stream, and only sensors that draw
+        their detection curve for every roll (OGI_camera_rk) give different results.
+        """
+        if self._batch_detection:
+            self._pending_detections.append((crew, survey_report, site_to_survey, curr_date))
+            return
+        self._sensor.detect_emissions(
+            site=site_to_survey,
+            meth_name=self._name,
+            survey_report=survey_report,
+        )
+        self._process_detections(crew, survey_report, site_to_survey, curr_date)
+
+    def _detect_pending_emissions(self) -> None:
+        """Detect emissions at all sites surveyed since the last call, in a single sensor call"""
+        if not self._batch_detection or not self._pending_detections:
+            return
+        pending_detections = self._pending_detections
+        self._pending_detections = []
+        self._sensor.detect_emissions_many(
+            sites=[site for _, _, site, _ in pending_detections],
+            meth_name=self._name,
+            survey_reports=[survey_report for _, survey_report, _, _ in pending_detections],
+        )
+        for crew, survey_report, site_to_survey, curr_date in pending_detections:
+            self._process_detections(crew, survey_report, site_to_survey, curr_date)
+
+    def _process_detections(
+        self,
+        crew: CrewDailyReport,
+        survey_report: SiteSurveyReport,
+        site_to_survey: Site,
+        curr_date: date,
+    ) -> None:
+        """Hook for methods that act on the detections at a site as soon as they are known,
+        such as tagging emissions at components. Does nothing by default.
+        """
+        return
+
     def _determine_if_site_survey_can_be_completed(
         self,
         survey_report: SiteSurveyReport,
@@ -433,7 +500,11 @@ class Method:
         elif isinstance(self._travel_times, float):
             return round(self._travel_times)
         elif isinstance(self._travel_times, list):
-            return round(choice(self._travel_times))
+            if self._travel_time_rng is None:
+                return round(choice(self._travel_times))
+            return round(
+                self._travel_times[self._travel_time_rng.integers(len(self._travel_times))]
+            )
         else:
             logger: logging.Logger = logging.getLogger(__name__)
             logger.error(f"Unrecognized travel time format for method {self._name}")
@@ -454,72 +525,30 @@ class Method:
         )
         return report
 
-    def get_daylight_hours(self, daylight, max_hours: int, curr_date) -> int:
-        """Get the amount of daylight hours"""
-        daylight_hours = daylight.get_daylight(curr_date)
+    def get_daylight_hours(self, daylight, max_hours: int, curr_date, site: Site = None) -> int:
+        """Get the amount of daylight hours at the site"""
+        daylight_hours = daylight.get_daylight(curr_date, site)
         work_hours = daylight_hours
         if max_hours < daylight_hours:
             work_hours = max_hours
         return work_hours
 
-    def get_weather_val(self, weather) -> float:
-        # TODO: update this later to consider averaging the hourly weather conditions
-        return weather[Method.HOUR]
-
-    def get_weather_segment(
-        self, weather, lat, long, timerange
-    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        return (
-            weather.temps[timerange, lat, long],
-            weather.winds[timerange, lat, long],
-            weather.precip[timerange, lat, long],
-        )
-
     def check_weather(self, weather, curr_date, site: Site) -> bool:
         """
-        Check the weather conditions for the given site on the given day
-
-        # TODO : change this such that the matrix is set once for given method
+        Check the weather conditions for the given site on the given day.
+        The method's deployment days are computed once, on the first check,
+        and the day of the weather file once for each date.
         """
-
-        # TODO change to getters
-        lat = site.get_weather_lat()
-        long = site.get_weather_long()
-        bool_temp: bool = False
-        bool_wind: bool = False
-        bool_precip: bool = False
-        time = curr_date.timetuple().tm_yday - 1  # 0 indexed.
-        timerange = range(time * 24, time * 24 + 24)
-        temp_seg, wind_seg, precip_seg = self.get_weather_segment(weather, lat, long, timerange)
-        temp_val = self.get_weather_val(temp_seg)
-        wind_val = self.get_weather_val(wind_seg)
-        precip_val = self.get_weather_val(precip_seg)
-
-        if (
-            self._weather_envs[pdc.Method_Params.TEMP][0]
-            <= temp_val
-            <= self._weather_envs[pdc.Method_Params.TEMP][1]
-        ):
-            bool_temp = True
-        if (
-            self._weather_envs[pdc.Method_Params.WIND][0]
-            <= wind_val
-            <= self._weather_envs[pdc.Method_Params.WIND][1]
-        ):
-            bool_wind = True
-        if (
-            self._weather_envs[pdc.Method_Params.PRECIP][0]
-            <= precip_val
-            <= self._weather_envs[pdc.Method_Params.PRECIP][1]
-        ):
-            bool_precip = True
-
-        # if weather permits
-        if bool_precip and bool_wind and bool_temp:
-            return True
-        # if weather conditions are not good
-        else:
-            return False
+        if self._deployment_days is None:
+            self._deployment_days = weather.deployment_days(self._weather_envs, Method.HOUR)
+        if curr_date != self._weather_date:
+            self._weather_day = weather.day_index(curr_date)
+            self._weather_date = curr_date
+        return bool(
+            self._deployment_days[
+                self._weather_day, site.get_weather_lat(), site.get_weather_long()
+            ]
+        )
 
     def get_name(self) -> str:
         return self._name
@@ -39,6 +39,7 @@ from scheduling.workplan import Workplan
 
 
 import constants.param_default_const as pdc
+from utils.rng_registry import RNGRegistry
 
 
 class Program:
@@ -66,9 +67,11 @@ class Program:
         consider_weather: bool,
         prog_params: dict[str, Any],
         input_dir: str,
+        rng_registry: RNGRegistry = None,
     ) -> None:
         self.name: str = name
         self._input_dir: str = input_dir
+        self._rng_registry: RNGRegistry = rng_registry
         self._survey_schedules: dict[str, GenericSchedule] = {}
         self.method_names: list[str] = [method for method in methods]
         self._init_methods_and_schedules(
@@ -106,7 +109,12 @@ class Program:
             properties: dict
 
             method: Method = ComponentLevelMethod(
-                method_name, properties, consider_weather, sites, self._input_dir
+                method_name,
+                properties,
+                consider_weather,
+                sites,
+                self._input_dir,
+                self._get_method_rng_registry(method_name),
             )
 
             follow_up_method_list.append(method)
@@ -149,6 +157,11 @@ class Program:
                 other_methods[method] = properties
         return follow_up_methods, other_methods
 
+    def _get_method_rng_registry(self, method_name: str) -> RNGRegistry:
+        if self._rng_registry is None:
+            return None
+        return self._rng_registry.spawn(method_name)
+
     def _gen_method(
         self,
         method_name: str,
@@ -176,6 +189,7 @@ class Program:
                 sites=sites,
                 follow_up_schedule=follow_up_schedule,
                 input_dir=self._input_dir,
+                rng_registry=self._get_method_rng_registry(method_name),
             )
         elif method_survey_level == EquipmentGroupLevelMethod.MEASUREMENT_SCALE:
             meth_pref_follow_up = properties[pdc.Method_Params.FOLLOW_UP][
@@ -195,10 +209,16 @@ class Program:
                 sites=sites,
                 follow_up_schedule=follow_up_schedule,
                 input_dir=self._input_dir,
+                rng_registry=self._get_method_rng_registry(method_name),
             )
         elif method_survey_level == ComponentLevelMethod.MEASUREMENT_SCALE:
             return ComponentLevelMethod(
-                method_name, properties, consider_weather, sites, self._input_dir
+                method_name,
+                properties,
+                consider_weather,
+                sites,
+                self._input_dir,
+                self._get_method_rng_registry(method_name),
             )
 
     def do_daily_program_deployment(self) -> list[TsMethodData]:
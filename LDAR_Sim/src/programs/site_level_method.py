@@ -36,6 +36,7 @@ from sensors.default_site_level_sensor import DefaultSiteLevelSensor
 from sensors.METEC_NoWind_sensor import METECNWSite
 import constants.param_default_const as pdc
 import sys
+from utils.rng_registry import RNGRegistry
 
 
 class SiteLevelMethod(Method):
@@ -52,8 +53,9 @@ class SiteLevelMethod(Method):
         sites,
         follow_up_schedule: FollowUpMobileSchedule,
         input_dir: str,
+        rng_registry: RNGRegistry = None,
     ) -> None:
-        super().__init__(name, properties, consider_weather, sites, input_dir)
+        super().__init__(name, properties, consider_weather, sites, input_dir, rng_registry)
         interaction_priority: str = properties[pdc.Method_Params.FOLLOW_UP][
             pdc.Method_Params.INTERACTION_PRIORITY
         ]
@@ -336,6 +338,7 @@ class SiteLevelMethod(Method):
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.QUANTIFICATION_PARAMETERS],
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.Q_TYPE],
                 input_dir=input_dir,
+                rng_registry=self._rng_registry,
             )
         elif sensor_info[pdc.Method_Params.TYPE] == "METEC_no_wind":
             self._sensor = METECNWSite(
@@ -343,6 +346,7 @@ class SiteLevelMethod(Method):
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.QUANTIFICATION_PARAMETERS],
                 sensor_info[pdc.Method_Params.QE][pdc.Method_Params.Q_TYPE],
                 input_dir=input_dir,
+                rng_registry=self._rng_registry,
             )
         else:
             logger: logging.Logger = logging.getLogger(__name__)
@@ -21,7 +21,7 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 from datetime import date
 from scheduling.follow_up_survey_planner import FollowUpSurveyPlanner
 from scheduling.generic_schedule import GenericSchedule
-from utils.queue import PriorityQueueWithFIFO
+from utils.queue import IndexedPriorityQueueWithFIFO
 from virtual_world.sites import Site
 from constants.param_default_const import Deployment_Types as dt
 from scheduling.workplan import Workplan
@@ -53,6 +53,8 @@ class FollowUpMobileSchedule(GenericSchedule):
             est_meth_daily_surveys,
             method_avail_crews,
         )
+        # Follow-up plans are indexed by site ID so they can be re-prioritized in place
+        self._survey_queue = IndexedPriorityQueueWithFIFO(key=lambda plan: plan.site_id)
         self._site_IDs_in_queue: dict[str, bool] = {site.get_id(): False for site in sites}
         return
 
@@ -60,18 +62,8 @@ class FollowUpMobileSchedule(GenericSchedule):
         return self._site_IDs_in_queue
 
     def get_plan_from_queue(self, site_id: str) -> FollowUpSurveyPlanner:
-        new_queue: PriorityQueueWithFIFO = PriorityQueueWithFIFO()
-        target_plan: FollowUpSurveyPlanner = None
-        while not self._survey_queue.empty():
-            prio, _, plan = self._survey_queue.get()
-            prio: int
-            plan: FollowUpSurveyPlanner
-            if plan.site_id == site_id:
-                target_plan = plan
-            else:
-                new_queue.put(prio, plan)
-        self._survey_queue: PriorityQueueWithFIFO = new_queue
-        return target_plan
+        """Remove and return the queued survey plan of the given site, None if not queued"""
+        return self._survey_queue.remove(site_id)
 
     def requeue_survey_plan(self, prio: int, survey_plan: FollowUpSurveyPlanner) -> None:
         self._survey_queue.put(priority=(prio, survey_plan.rate_at_site), item=survey_plan)
@@ -130,7 +122,8 @@ class FollowUpMobileSchedule(GenericSchedule):
             else:
                 planner.add_to_surveys_done(current_date)
                 completed_sites.append(site_id)
-                self._site_IDs_in_queue[planner.site_id] = False
+                self._site_IDs_in_queue[site_id] = False
+                self._add_completed_to_survey_calendar(planner, current_date)
 
         for site in completed_sites:
             completed_report = reports.pop(site)
@@ -18,16 +18,16 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 ------------------------------------------------------------------------------
 """
 
+from collections import deque
 from datetime import date
 import logging
 import sys
 
-from numpy import average, isnan
+from numpy import average
 from scheduling.surveying_dataclasses import DetectionRecord
 from scheduling.survey_planner import SurveyPlanner
 from constants.error_messages import Runtime_Error_Messages as rem
 import constants.param_default_const as pdc
-import pandas as pd
 
 
 class FollowUpSurveyPlanner(SurveyPlanner):
@@ -75,6 +75,30 @@ class FollowUpSurveyPlanner(SurveyPlanner):
         return False
 
 
+class _RollingMean:
+    """Mean of the last `window` values added, updated in constant time with a running sum.
+    The mean is 0 until `window` values have been added.
+    """
+
+    def __init__(self, window: int) -> None:
+        self._window: int = window
+        self._values: deque[float] = deque(maxlen=window)
+        self._sum: float = 0
+
+    def add(self, value: float) -> None:
+        if self._values and len(self._values) == self._window:
+            # The deque drops the oldest value on append
+            self._sum -= self._values[0]
+        self._values.append(value)
+        self._sum += value
+
+    @property
+    def mean(self) -> float:
+        if self._window <= 0 or len(self._values) < self._window:
+            return 0
+        return self._sum / self._window
+
+
 class StationaryFollowUpSurveyPlanner(FollowUpSurveyPlanner):
     def __init__(
         self,
@@ -86,6 +110,10 @@ class StationaryFollowUpSurveyPlanner(FollowUpSurveyPlanner):
         super().__init__(detection_record, detect_date)
         self._small_window: int = small_window
         self._long_window: int = long_window
+        self._small_rolling_mean: _RollingMean = _RollingMean(small_window)
+        self._long_rolling_mean: _RollingMean = _RollingMean(long_window)
+        self._small_rolling_mean.add(detection_record.rate_detected)
+        self._long_rolling_mean.add(detection_record.rate_detected)
         self.rate_at_site: float = 0
         self.rate_at_site_long: float = 0
 
@@ -98,24 +126,11 @@ class StationaryFollowUpSurveyPlanner(FollowUpSurveyPlanner):
     ) -> None:
         if redund_filter == pdc.Method_Params.ROLLING_AVRG:
             self._detected_rates.append(new_detection.rate_detected)
-            series_detect_rates = pd.Series(self._detected_rates)
-            self.rate_at_site = (
-                series_detect_rates.rolling(
-                    window=self._small_window, min_periods=self._small_window
-                )
-                .mean()
-                .iloc[-1]
-            )
-            self.rate_at_site_long = (
-                series_detect_rates.rolling(window=self._long_window, min_periods=self._long_window)
-                .mean()
-                .iloc[-1]
-            )
+            self._small_rolling_mean.add(new_detection.rate_detected)
+            self._long_rolling_mean.add(new_detection.rate_detected)
+            self.rate_at_site = self._small_rolling_mean.mean
+            self.rate_at_site_long = self._long_rolling_mean.mean
             self._latest_detection_date = detect_date
-            if isnan(self.rate_at_site):
-                self.rate_at_site = 0
-            if isnan(self.rate_at_site_long):
-                self.rate_at_site_long = 0
         else:
             logger: logging.Logger = logging.getLogger(__name__)
             logger.error(
@@ -19,7 +19,8 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 ------------------------------------------------------------------------------
 """
 
-from datetime import date
+from datetime import date, timedelta
+import heapq
 from scheduling.workplan import Workplan
 from virtual_world.sites import Site
 from scheduling.schedule_dataclasses import SiteSurveyReport, MinimalSurveyReport
@@ -56,6 +57,7 @@ class GenericSchedule:
         self._survey_plans: list[ScheduledSurveyPlanner] = self._set_survey_plans(
             sim_start_date, sim_end_date, sites
         )
+        self._set_survey_calendar(sim_start_date)
 
     def _set_survey_plans(
         self, sim_start_date, sim_end_date, sites: list[Site]
@@ -82,6 +84,33 @@ class GenericSchedule:
             )
         return survey_plans
 
+    def _set_survey_calendar(self, sim_start_date: date) -> None:
+        """Index the survey plans by the next date on which each could be queued, so that
+        the daily workplan only has to check the survey plans that are due.
+        The calendar is a heap of (date, survey plan position) entries.
+        """
+        self._survey_calendar: list[tuple[date, int]] = []
+        self._survey_plan_positions: dict[int, int] = {}
+        for position, survey_plan in enumerate(self._survey_plans):
+            self._survey_plan_positions[id(survey_plan)] = position
+            self._add_to_survey_calendar(position, sim_start_date)
+
+    def _add_to_survey_calendar(self, position: int, from_date: date) -> None:
+        queue_date: date = self._survey_plans[position].get_next_queue_date(from_date)
+        if queue_date is not None:
+            heapq.heappush(self._survey_calendar, (queue_date, position))
+
+    def _add_completed_to_survey_calendar(
+        self, survey_plan: ScheduledSurveyPlanner, current_date: date
+    ) -> None:
+        """Add the survey plan of a completed survey back to the survey calendar.
+        Survey plans that are not scheduled by the calendar are ignored.
+        """
+        position: int = self._survey_plan_positions.get(id(survey_plan))
+        if position is not None:
+            # The workplan for the current date is already made
+            self._add_to_survey_calendar(position, current_date + timedelta(days=1))
+
     def add_to_survey_queue(self, survey_plan: ScheduledSurveyPlanner) -> None:
         """Add the supplied site to the survey queue to surveyed
 
@@ -131,10 +160,17 @@ class GenericSchedule:
         Returns:
             The list sites that the method should do on the given day
         """
-        for survey_plan in self._survey_plans:
+        due_positions: list[int] = []
+        while self._survey_calendar and self._survey_calendar[0][0] <= current_date:
+            due_positions.append(heapq.heappop(self._survey_calendar)[1])
+        # Queue in the order of the survey plans, as if every plan had been checked
+        for position in sorted(due_positions):
+            survey_plan: ScheduledSurveyPlanner = self._survey_plans[position]
             survey_plan.update_date(current_date)
             if survey_plan.queue_site_for_survey():
                 self.add_to_survey_queue(survey_plan)
+            else:
+                self._add_to_survey_calendar(position, current_date + timedelta(days=1))
         sites_to_survey: list[ScheduledSurveyPlanner] = self.get_daily_sites_to_survey()
         return Workplan(site_survey_plan_list=sites_to_survey, date=current_date)
 
@@ -158,6 +194,7 @@ class GenericSchedule:
             else:
                 planner.add_to_surveys_done(current_date)
                 completed_sites.append(site_id)
+                self._add_completed_to_survey_calendar(planner, current_date)
         for site in completed_sites:
             completed_report = reports.pop(site)
             survey_reports.extend(
@@ -20,6 +20,7 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 
 from dataclasses import dataclass
 from datetime import date, timedelta
+from typing import Union
 import pandas as pd
 import calendar
 import math
@@ -240,6 +241,50 @@ class ScheduledSurveyPlanner(SurveyPlanner):
                 return True
         return False
 
+    def get_next_queue_date(self, from_date: date) -> Union[date, None]:
+        """Returns the earliest date, on or after the given date, on which
+        queue_site_for_survey would queue the site if the surveys done so far do not change.
+        Returns None if the site is already queued or will not be queued again in the simulation.
+        """
+        if self._queued:
+            return None
+        for year in self._surveys_this_year:
+            if year < from_date.year or year not in self._deployment_years:
+                continue
+            earliest_date: date = self._get_earliest_queue_date(year)
+            if earliest_date is None:
+                continue
+            queue_date: date = self._get_first_deployable_date(max(earliest_date, from_date))
+            if queue_date is not None:
+                return queue_date
+        return None
+
+    def _get_earliest_queue_date(self, year: int) -> Union[date, None]:
+        """Returns the planned date of the next survey required in the given year,
+        or None if all of the surveys required that year are done.
+        """
+        survey_counter: Survey_Counter = self._surveys_this_year[year]
+        if survey_counter.Required_surveys <= survey_counter.Surveys_done:
+            return None
+        planned_date: date = self._survey_plan[survey_counter.Surveys_done]
+        if planned_date.day <= calendar.monthrange(year, planned_date.month)[1]:
+            return date(year, planned_date.month, planned_date.day)
+        # Planned day does not exist in the given year (Feb 29th)
+        if planned_date.month == 12:
+            return None
+        return date(year, planned_date.month + 1, 1)
+
+    def _get_first_deployable_date(self, from_date: date) -> Union[date, None]:
+        """Returns the first date on or after the given date, in the same year,
+        that falls in a deployment month. None if there is no such date.
+        """
+        if from_date.month in self._deployment_months:
+            return from_date
+        for month in sorted(self._deployment_months):
+            if month > from_date.month:
+                return date(from_date.year, month, 1)
+        return None
+
     def unflag_for_queue(self) -> None:
         """Sets the queued flagged to false, use case is for when surveys are
         done and site is no longer a part of a queue
@@ -300,6 +345,12 @@ class StationarySurveyPlanner(ScheduledSurveyPlanner):
         """Not needed for stationary, placeholder to reduce computation when not needed"""
         return None
 
+    def _get_earliest_queue_date(self, year: int) -> Union[date, None]:
+        """Stationary sites are queued every day of a year that has required surveys"""
+        if self._surveys_this_year[year].Required_surveys > 0:
+            return date(year, 1, 1)
+        return None
+
     def queue_site_for_survey(self) -> bool:
         """Method to determine if the site for which this survey plan was generated
         should be queued to be surveyed. Will return True if the site should be
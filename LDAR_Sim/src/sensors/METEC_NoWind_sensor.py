@@ -25,6 +25,11 @@ from sensors.default_site_level_sensor import DefaultSiteLevelSensor
 from sensors.default_component_level_sensor import DefaultComponentLevelSensor
 from sensors.default_equipment_group_level_sensor import DefaultEquipmentGroupLevelSensor
 from constants.general_const import Conversion_Constants as CC
+from utils.rng_registry import RNGRegistry
+
+
+def _prob_detect(mdl: list[float], rates: np.ndarray) -> np.ndarray:
+    return 1 / (1 + np.exp(mdl[0] - mdl[1] * (rates * CC.GS_TO_KGHR)))
 
 
 class METECNWSite(DefaultSiteLevelSensor):
@@ -34,12 +39,14 @@ class METECNWSite(DefaultSiteLevelSensor):
         quantification_parameters: list[float],
         quantification_type: str = QuantificationTypes.DEFAULT.value,
         input_dir: str = None,
+        rng_registry: RNGRegistry = None,
     ) -> None:
         super().__init__(
             mdl,
             quantification_parameters,
             quantification_type,
             input_dir=input_dir,
+            rng_registry=rng_registry,
         )
         self._mdl = mdl
 
@@ -47,7 +54,11 @@ class METECNWSite(DefaultSiteLevelSensor):
         prob_detect = 1 / (1 + np.exp(self._mdl[0] - self._mdl[1] * (emis_rate * CC.GS_TO_KGHR)))
         if prob_detect >= 1:
             return True
-        return np.random.binomial(1, prob_detect) and self.check_min_threshold(emis_rate)
+        return self._detection_roll(prob_detect) and self.check_min_threshold(emis_rate)
+
+    def detect_many(self, rates: np.ndarray) -> np.ndarray:
+        rates = np.asarray(rates, dtype=float)
+        return self._detection_rolls(_prob_detect(self._mdl, rates), rates)
 
 
 class METECNWEquipmentGroup(DefaultEquipmentGroupLevelSensor):
@@ -57,15 +68,22 @@ class METECNWEquipmentGroup(DefaultEquipmentGroupLevelSensor):
         quantification_parameters: list[float],
         quantification_type: str = QuantificationTypes.DEFAULT.value,
         input_dir: str = None,
+        rng_registry: RNGRegistry = None,
     ) -> None:
-        super().__init__(mdl, quantification_parameters, quantification_type, input_dir)
+        super().__init__(
+            mdl, quantification_parameters, quantification_type, input_dir, rng_registry
+        )
         self._mdl = mdl
 
     def _rate_detected(self, emis_rate: float) -> bool:
         prob_detect = 1 / (1 + np.exp(self._mdl[0] - self._mdl[1] * (emis_rate * CC.GS_TO_KGHR)))
         if prob_detect >= 1:
             return True
-        return np.random.binomial(1, prob_detect) and self.check_min_threshold(emis_rate)
+        return self._detection_roll(prob_detect) and self.check_min_threshold(emis_rate)
+
+    def detect_many(self, rates: np.ndarray) -> np.ndarray:
+        rates = np.asarray(rates, dtype=float)
+        return self._detection_rolls(_prob_detect(self._mdl, rates), rates)
 
 
 class METECNWComponent(DefaultComponentLevelSensor):
@@ -75,12 +93,19 @@ class METECNWComponent(DefaultComponentLevelSensor):
         quantification_parameters: list[float],
         quantification_type: str = QuantificationTypes.DEFAULT.value,
         input_dir: str = None,
+        rng_registry: RNGRegistry = None,
     ) -> None:
-        super().__init__(mdl, quantification_parameters, quantification_type, input_dir)
+        super().__init__(
+            mdl, quantification_parameters, quantification_type, input_dir, rng_registry
+        )
         self._mdl = mdl
 
     def _rate_detected(self, emis_rate: float) -> bool:
         prob_detect = 1 / (1 + np.exp(self._mdl[0] - self._mdl[1] * (emis_rate * CC.GS_TO_KGHR)))
         if prob_detect >= 1:
             return True
-        return np.random.binomial(1, prob_detect) and self.check_min_threshold(emis_rate)
+        return self._detection_roll(prob_detect) and self.check_min_threshold(emis_rate)
+
+    def detect_many(self, rates: np.ndarray) -> np.ndarray:
+        rates = np.asarray(rates, dtype=float)
+        return self._detection_rolls(_prob_detect(self._mdl, rates), rates)
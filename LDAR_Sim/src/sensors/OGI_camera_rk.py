@@ -24,6 +24,7 @@ import numpy as np
 from constants.sensor_constants import QuantificationTypes
 from sensors.default_component_level_sensor import DefaultComponentLevelSensor
 from constants.general_const import Conversion_Constants as CC
+from utils.rng_registry import RNGRegistry, get_rng
 
 
 class OGICameraRKSensor(DefaultComponentLevelSensor):
@@ -36,22 +37,25 @@ class OGICameraRKSensor(DefaultComponentLevelSensor):
         quantification_parameters: list[float],
         quantification_type: str = QuantificationTypes.DEFAULT.value,
         input_dir: str = None,
+        rng_registry: RNGRegistry = None,
     ) -> None:
         super().__init__(
             mdl,
             quantification_parameters,
             quantification_type,
             input_dir=input_dir,
+            rng_registry=rng_registry,
         )
         self._mdl = mdl
 
     def _rate_detected(self, emis_rate: float) -> bool:
-        k = np.random.normal(4.9, 0.3)
+        random_source = get_rng(self._detection_rng)
+        k = random_source.normal(4.9, 0.3)
         # check if users are providing their own overwrite to the curve
         if len(self._mdl) < 2:
-            x0 = np.random.normal(OGICameraRKSensor.MDL_CONST1, OGICameraRKSensor.MDL_CONST2)
+            x0 = random_source.normal(OGICameraRKSensor.MDL_CONST1, OGICameraRKSensor.MDL_CONST2)
         else:
-            x0 = np.random.normal(self._mdl[0], self._mdl[1])
+            x0 = random_source.normal(self._mdl[0], self._mdl[1])
         x0 = math.log10(x0 * CC.GS_TO_GH)
         if emis_rate == 0:
             return False
@@ -59,4 +63,27 @@ class OGICameraRKSensor(DefaultComponentLevelSensor):
         x = math.log10(emis_rate * CC.GS_TO_GH)
         prob_detect = 1 / (1 + math.exp(-k * (x - x0)))
 
-        return np.random.binomial(1, prob_detect) and self.check_min_threshold(emis_rate)
+        return self._detection_roll(prob_detect) and self.check_min_threshold(emis_rate)
+
+    def detect_many(self, rates: np.ndarray) -> np.ndarray:
+        """Vectorised _rate_detected. The detection curves of all of the rates are drawn before
+        the rolls, rather than a curve then a roll for each rate in turn, so the values drawn
+        differ from calling _rate_detected for each rate.
+        """
+        rates = np.asarray(rates, dtype=float)
+        random_source = get_rng(self._detection_rng)
+        k = random_source.normal(4.9, 0.3, len(rates))
+        # check if users are providing their own overwrite to the curve
+        if len(self._mdl) < 2:
+            x0 = random_source.normal(
+                OGICameraRKSensor.MDL_CONST1, OGICameraRKSensor.MDL_CONST2, len(rates)
+            )
+        else:
+            x0 = random_source.normal(self._mdl[0], self._mdl[1], len(rates))
+        x0 = np.log10(x0 * CC.GS_TO_GH)
+        detected: np.ndarray = np.zeros(len(rates), dtype=bool)
+        emitting: np.ndarray = rates != 0
+        x = np.log10(rates[emitting] * CC.GS_TO_GH)
+        prob_detect = 1 / (1 + np.exp(-k[emitting] * (x - x0[emitting])))
+        detected[emitting] = self._detection_rolls(prob_detect, rates[emitting])
+        return detected
@@ -25,6 +25,7 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 import numpy as np
 from constants.sensor_constants import QuantificationTypes
 from sensors.default_component_level_sensor import DefaultComponentLevelSensor
+from utils.rng_registry import RNGRegistry
 
 MDL_CONST1 = 0.24
 MDL_CONST2 = 0.39
@@ -38,12 +39,14 @@ class OGICameraZimSensor(DefaultComponentLevelSensor):
         quantification_parameters: list[float],
         quantification_type: str = QuantificationTypes.DEFAULT.value,
         input_dir: str = None,
+        rng_registry: RNGRegistry = None,
     ) -> None:
         super().__init__(
             mdl,
             quantification_parameters,
             quantification_type,
             input_dir=input_dir,
+            rng_registry=rng_registry,
         )
         self._mdl = mdl
 
@@ -56,4 +59,12 @@ class OGICameraZimSensor(DefaultComponentLevelSensor):
             prob_detect = self._mdl[0] * (GS_TO_SCFH * emis_rate) ** self._mdl[1]
         if prob_detect >= 1:
             return True
-        return np.random.binomial(1, prob_detect) and self.check_min_threshold(emis_rate)
+        return self._detection_roll(prob_detect) and self.check_min_threshold(emis_rate)
+
+    def detect_many(self, rates: np.ndarray) -> np.ndarray:
+        rates = np.asarray(rates, dtype=float)
+        if len(self._mdl) < 2:
+            prob_detect = MDL_CONST1 * (GS_TO_SCFH * rates) ** MDL_CONST2
+        else:
+            prob_detect = self._mdl[0] * (GS_TO_SCFH * rates) ** self._mdl[1]
+        return self._detection_rolls(prob_detect, rates)
@@ -18,13 +18,15 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 ------------------------------------------------------------------------------
 """
 
-from typing import Union
+from typing import Callable, Iterator, Union
+import numpy as np
 from constants.sensor_constants import QuantificationTypes
 from scheduling.schedule_dataclasses import EquipmentGroupSurveyReport, SiteSurveyReport
 from sensors.default_sensor import DefaultSensor
 from virtual_world.emission_types.emission import Emission
 from virtual_world.sites import Site
 from constants.param_default_const import Levels
+from utils.rng_registry import RNGRegistry
 
 
 class DefaultEquipmentGroupLevelSensor(DefaultSensor):
@@ -36,36 +38,79 @@ class DefaultEquipmentGroupLevelSensor(DefaultSensor):
         quantification_parameters: list[float],
         quantification_type: str = QuantificationTypes.DEFAULT.value,
         input_dir: str = None,
+        rng_registry: RNGRegistry = None,
     ) -> None:
         super().__init__(
             mdl,
             quantification_parameters,
             quantification_type,
             input_dir=input_dir,
+            rng_registry=rng_registry,
         )
 
     def detect_emissions(self, site: Site, meth_name: str, survey_report: SiteSurveyReport) -> bool:
         # TODO update and test this functionality
         detectable_emissions: dict[str, dict[str, list[Emission]]] = site.get_detectable_emissions(
-            method_name=meth_name
+            method_name=meth_name, rng=self._coverage_rng
         )
+        return self._report_detections(
+            site, detectable_emissions, survey_report, self._rate_detected, self._measure_rate
+        )
+
+    def detect_emissions_many(
+        self, sites: list[Site], meth_name: str, survey_reports: list[SiteSurveyReport]
+    ) -> list[bool]:
+        all_detectable_emissions: list[dict[str, dict[str, list[Emission]]]] = [
+            site.get_detectable_emissions(method_name=meth_name, rng=self._coverage_rng)
+            for site in sites
+        ]
+        eqg_rates: list[float] = [
+            self._get_eqg_rate(eq_emis_list)
+            for detectable_emissions in all_detectable_emissions
+            for eq_emis_list in detectable_emissions.values()
+        ]
+        rates: np.ndarray = np.array(eqg_rates)
+        detected: np.ndarray = self.detect_many(rates)
+        measured_rates: np.ndarray = self._measure_rate_many(rates[detected])
+        detections: Iterator[bool] = iter(detected.tolist())
+        measurements: Iterator[float] = iter(measured_rates.tolist())
+        return [
+            self._report_detections(
+                site,
+                detectable_emissions,
+                survey_report,
+                lambda _: next(detections),
+                lambda _: next(measurements),
+            )
+            for site, detectable_emissions, survey_report in zip(
+                sites, all_detectable_emissions, survey_reports
+            )
+        ]
+
+    def _get_eqg_rate(self, eq_emis_list: dict[str, list[Emission]]) -> float:
+        return sum(
+            [emission.get_rate() for emis_list in eq_emis_list.values() for emission in emis_list]
+        )
+
+    def _report_detections(
+        self,
+        site: Site,
+        detectable_emissions: dict[str, dict[str, list[Emission]]],
+        survey_report: SiteSurveyReport,
+        rate_detected: Callable[[float], bool],
+        measure_rate: Callable[[float], float],
+    ) -> bool:
         eqg_survey_reports: list[EquipmentGroupSurveyReport] = []
         site_level_emission_rate: float = 0.0
         site_level_measured_rate: float = 0.0
 
         for eqg, eq_emis_list in detectable_emissions.items():
-            eqg_level_emis_rate: float = sum(
-                [
-                    emission.get_rate()
-                    for emis_list in eq_emis_list.values()
-                    for emission in emis_list
-                ]
-            )
+            eqg_level_emis_rate: float = self._get_eqg_rate(eq_emis_list)
 
-            eqg_emissions_detected: bool = self._rate_detected(eqg_level_emis_rate)
+            eqg_emissions_detected: bool = rate_detected(eqg_level_emis_rate)
 
             if eqg_emissions_detected:
-                eqg_level_measured_rate: float = self._measure_rate(eqg_level_emis_rate)
+                eqg_level_measured_rate: float = measure_rate(eqg_level_emis_rate)
             else:
                 eqg_level_measured_rate: float = 0.0
 
@@ -19,20 +19,33 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 """
 
 from typing import Union
+import numpy as np
 from sensors import quantification
 from virtual_world.sites import Site
 from constants.sensor_constants import QuantificationTypes
 from scheduling.schedule_dataclasses import SiteSurveyReport
+from constants.general_const import RNG_Purposes
+from utils.rng_registry import RNGRegistry, get_rng
 
 
 class DefaultSensor:
+    # Streams used for detection and coverage rolls. None falls back to the global RNG
+    _detection_rng: np.random.Generator = None
+    _coverage_rng: np.random.Generator = None
+
     def __init__(
         self,
         mdl: Union[list[float], float],
         quantification_parameters: list[float],
         quantification_type: str = QuantificationTypes.DEFAULT.value,
         input_dir: str = None,
+        rng_registry: RNGRegistry = None,
     ) -> None:
+        quantification_rng: np.random.Generator = None
+        if rng_registry is not None:
+            self._detection_rng = rng_registry.generator(RNG_Purposes.SENSOR_DETECTION)
+            self._coverage_rng = rng_registry.generator(RNG_Purposes.COVERAGE)
+            quantification_rng = rng_registry.generator(RNG_Purposes.QUANTIFICATION)
         # TODO revisit this implementation
         self._min_threshold: float = None
         if isinstance(mdl, (float, int)):
@@ -47,34 +60,80 @@ class DefaultSensor:
             quantification_parameters,
             quantification_type=quantification_type,
             input_dir=input_dir,
+            rng=quantification_rng,
         )
 
     def initialize_quantification_predictor(
-        self, quantification_parameters: list[float], quantification_type: str, input_dir: str
+        self,
+        quantification_parameters: list[float],
+        quantification_type: str,
+        input_dir: str,
+        rng: np.random.Generator = None,
     ):
         if quantification_type == QuantificationTypes.DEFAULT.value:
             self._quantification_predictor = quantification.DefaultQuantificationPredictor(
-                *quantification_parameters
+                *quantification_parameters, rng=rng
             )
         elif quantification_type == QuantificationTypes.UNIFORM.value:
             self._quantification_predictor = quantification.UniformQuantificationPredictor(
-                *quantification_parameters
+                *quantification_parameters, rng=rng
             )
         elif quantification_type == QuantificationTypes.SAMPLING.value:
             self._quantification_predictor = quantification.SamplingQuantificationPredictor(
-                *quantification_parameters, input_dir=input_dir
+                *quantification_parameters, input_dir=input_dir, rng=rng
             )
 
     def _rate_detected(self, emis_rate: float) -> bool:
         return emis_rate >= self._mdl
 
+    def detect_many(self, rates: np.ndarray) -> np.ndarray:
+        """Vectorised _rate_detected. Returns whether each of the given rates is detected.
+        Sensors that override _rate_detected override this as well.
+        """
+        return np.asarray(rates, dtype=float) >= self._mdl
+
     def detect_emissions(self, site: Site, meth_name: str, survey_report: SiteSurveyReport):
         return
 
+    def detect_emissions_many(
+        self, sites: list[Site], meth_name: str, survey_reports: list[SiteSurveyReport]
+    ) -> list[bool]:
+        """Detect emissions at several surveyed sites at once, filling in each survey report.
+        Results match calling detect_emissions for each site in turn, as long as detection and
+        quantification draw from their own streams.
+        """
+        return [
+            self.detect_emissions(site, meth_name, survey_report)
+            for site, survey_report in zip(sites, survey_reports)
+        ]
+
+    def _detection_roll(self, prob_detect: float) -> int:
+        return get_rng(self._detection_rng).binomial(1, prob_detect)
+
+    def _detection_rolls(self, prob_detect: np.ndarray, rates: np.ndarray) -> np.ndarray:
+        """Vectorised form of the roll made against a probability of detection curve.
+        Rates with a probability of 1 or more are always detected. The others are rolled for in
+        order, which draws the same numbers as one _detection_roll per rate.
+        """
+        detected: np.ndarray = prob_detect >= 1
+        to_roll: np.ndarray = ~detected
+        if to_roll.any():
+            rolls = get_rng(self._detection_rng).binomial(1, prob_detect[to_roll]).astype(bool)
+            detected[to_roll] = rolls & self._check_min_threshold_many(rates[to_roll])
+        return detected
+
     def check_min_threshold(self, emis_rate: float) -> bool:
         if self._min_threshold is not None:
             return emis_rate >= self._min_threshold
         return True
 
+    def _check_min_threshold_many(self, rates: np.ndarray) -> np.ndarray:
+        if self._min_threshold is not None:
+            return rates >= self._min_threshold
+        return np.ones(len(rates), dtype=bool)
+
     def _measure_rate(self, true_rate: float) -> float:
         return self._quantification_predictor.predict(true_rate)
+
+    def _measure_rate_many(self, true_rates: np.ndarray) -> np.ndarray:
+        return self._quantification_predictor.quantify_many(true_rates)
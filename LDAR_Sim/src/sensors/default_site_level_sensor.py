@@ -18,13 +18,15 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 ------------------------------------------------------------------------------
 """
 
-from typing import Union
+from typing import Callable, Iterator, Union
+import numpy as np
 from constants.sensor_constants import QuantificationTypes
 from scheduling.schedule_dataclasses import SiteSurveyReport
 from sensors.default_sensor import DefaultSensor
 from virtual_world.emission_types.emission import Emission
 from virtual_world.sites import Site
 from constants.param_default_const import Levels
+from utils.rng_registry import RNGRegistry
 
 
 class DefaultSiteLevelSensor(DefaultSensor):
@@ -36,19 +38,53 @@ class DefaultSiteLevelSensor(DefaultSensor):
         quantification_parameters: list[float],
         quantification_type: str = QuantificationTypes.DEFAULT.value,
         input_dir: str = None,
+        rng_registry: RNGRegistry = None,
     ) -> None:
         super().__init__(
             mdl,
             quantification_parameters,
             quantification_type,
             input_dir=input_dir,
+            rng_registry=rng_registry,
         )
 
     def detect_emissions(self, site: Site, meth_name: str, survey_report: SiteSurveyReport) -> bool:
         detectable_emissions: dict[str, dict[str, list[Emission]]] = site.get_detectable_emissions(
-            method_name=meth_name
+            method_name=meth_name, rng=self._coverage_rng
         )
-        site_level_emission_rate: float = sum(
+        return self._report_detections(
+            detectable_emissions, meth_name, survey_report, self._rate_detected, self._measure_rate
+        )
+
+    def detect_emissions_many(
+        self, sites: list[Site], meth_name: str, survey_reports: list[SiteSurveyReport]
+    ) -> list[bool]:
+        all_detectable_emissions: list[dict[str, dict[str, list[Emission]]]] = [
+            site.get_detectable_emissions(method_name=meth_name, rng=self._coverage_rng)
+            for site in sites
+        ]
+        site_rates: list[float] = [
+            self._get_site_rate(detectable_emissions)
+            for detectable_emissions in all_detectable_emissions
+        ]
+        rates: np.ndarray = np.array(site_rates)
+        detected: np.ndarray = self.detect_many(rates)
+        measured_rates: np.ndarray = self._measure_rate_many(rates[detected])
+        detections: Iterator[bool] = iter(detected.tolist())
+        measurements: Iterator[float] = iter(measured_rates.tolist())
+        return [
+            self._report_detections(
+                detectable_emissions,
+                meth_name,
+                survey_report,
+                lambda _: next(detections),
+                lambda _: next(measurements),
+            )
+            for detectable_emissions, survey_report in zip(all_detectable_emissions, survey_reports)
+        ]
+
+    def _get_site_rate(self, detectable_emissions: dict[str, dict[str, list[Emission]]]) -> float:
+        return sum(
             [
                 emission.get_rate()
                 for eq_emis_list in detectable_emissions.values()
@@ -57,10 +93,20 @@ class DefaultSiteLevelSensor(DefaultSensor):
             ]
         )
 
-        emissions_detected: bool = self._rate_detected(site_level_emission_rate)
+    def _report_detections(
+        self,
+        detectable_emissions: dict[str, dict[str, list[Emission]]],
+        meth_name: str,
+        survey_report: SiteSurveyReport,
+        rate_detected: Callable[[float], bool],
+        measure_rate: Callable[[float], float],
+    ) -> bool:
+        site_level_emission_rate: float = self._get_site_rate(detectable_emissions)
+
+        emissions_detected: bool = rate_detected(site_level_emission_rate)
 
         if emissions_detected:
-            site_level_measured_rate: float = self._measure_rate(site_level_emission_rate)
+            site_level_measured_rate: float = measure_rate(site_level_emission_rate)
             for eq_emis_list in detectable_emissions.values():
                 for emis_list in eq_emis_list.values():
                     for emission in emis_list:
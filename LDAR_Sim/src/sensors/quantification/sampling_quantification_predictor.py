@@ -23,6 +23,7 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 import constants.error_messages as em
+from utils.rng_registry import get_rng
 
 
 class SamplingQuantificationPredictor:
@@ -37,9 +38,18 @@ class SamplingQuantificationPredictor:
         __init__(quantification_file, quantification_column): Initializes the
         SamplingQuantificationPredictor object.
         predict(true_rate): Predicts the quantification shift based on the true rate.
+        quantify_many(true_rates): Predicts the quantified rates for an array of true rates.
     """
 
-    def __init__(self, quantification_file: str, quantification_column: str, input_dir: Path):
+    _rng: np.random.Generator = None
+
+    def __init__(
+        self,
+        quantification_file: str,
+        quantification_column: str,
+        input_dir: Path,
+        rng: np.random.Generator = None,
+    ):
         """
         Initializes the SamplingQuantificationPredictor object.
 
@@ -47,8 +57,11 @@ class SamplingQuantificationPredictor:
             quantification_file (str): The path to the file containing quantification errors.
             quantification_column (str): The name of the column in the file
             containing quantification errors to sample from.
+            rng (numpy.random.Generator, optional): The stream quantification errors are drawn
+            from. Defaults to the global numpy random state.
         """
         self._set_quantification_errors(quantification_file, quantification_column, input_dir)
+        self._rng: np.random.Generator = rng
 
     def _set_quantification_errors(
         self, quantification_file: str, quantification_column: str, input_dir: Path
@@ -84,5 +97,22 @@ class SamplingQuantificationPredictor:
         Returns:
             float: The predicted quantified rate.
         """
-        quantification_shift: float = np.random.choice(self._quantification_errors)
+        quantification_shift: float = get_rng(self._rng).choice(self._quantification_errors)
         return max(true_rate * (1 + (quantification_shift / 100)), 0)
+
+    def quantify_many(self, true_rates: np.ndarray) -> np.ndarray:
+        """
+        Predicts the quantified rates for several true rates, sampling the quantification
+        shifts of all of the rates from the quantification errors in one call.
+
+        Args:
+            true_rates (numpy.ndarray): The true rates.
+
+        Returns:
+            numpy.ndarray: The predicted quantified rates.
+        """
+        true_rates = np.asarray(true_rates, dtype=float)
+        quantification_shifts: np.ndarray = get_rng(self._rng).choice(
+            self._quantification_errors, size=len(true_rates)
+        )
+        return np.maximum(true_rates * (1 + (quantification_shifts / 100)), 0)
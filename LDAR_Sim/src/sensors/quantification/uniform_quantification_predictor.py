@@ -19,6 +19,7 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 """
 
 import numpy as np
+from utils.rng_registry import get_rng
 
 
 class UniformQuantificationPredictor:
@@ -33,12 +34,17 @@ class UniformQuantificationPredictor:
     Methods:
         predict(true_rate):
             Predicts the quantified rate for a given true rate.
+        quantify_many(true_rates):
+            Predicts the quantified rates for an array of true rates.
     """
 
+    _rng: np.random.Generator = None
+
     def __init__(
         self,
         quantification_95_percent_ci_lower_range: float,
         quantification_95_percent_ci_upper_range: float,
+        rng: np.random.Generator = None,
     ):
         """
         Initializes a new instance of the UniformQuantificationPredictor class.
@@ -48,11 +54,13 @@ class UniformQuantificationPredictor:
             quantification 95% confidence interval.
             quantification_95_percent_ci_upper_range (float): The upper range of the
             quantification 95% confidence interval.
-
+            rng (numpy.random.Generator, optional): The stream quantification errors are drawn
+            from. Defaults to the global numpy random state.
         """
 
         self._lower_range = quantification_95_percent_ci_lower_range
         self._upper_range = quantification_95_percent_ci_upper_range
+        self._rng: np.random.Generator = rng
 
     def predict(self, true_rate: float) -> float:
         """
@@ -64,5 +72,24 @@ class UniformQuantificationPredictor:
         Returns:
             float: The predicted quantified rate.
         """
-        quantification_shift: float = np.random.uniform(self._lower_range, self._upper_range)
+        quantification_shift: float = get_rng(self._rng).uniform(
+            self._lower_range, self._upper_range
+        )
         return max(true_rate * (1 + (quantification_shift / 100)), 0)
+
+    def quantify_many(self, true_rates: np.ndarray) -> np.ndarray:
+        """
+        Predicts the quantified rates for several true rates, drawing the quantification
+        shifts of all of the rates from the uniform range in one call.
+
+        Args:
+            true_rates (numpy.ndarray): The true rates.
+
+        Returns:
+            numpy.ndarray: The predicted quantified rates.
+        """
+        true_rates = np.asarray(true_rates, dtype=float)
+        quantification_shifts: np.ndarray = get_rng(self._rng).uniform(
+            self._lower_range, self._upper_range, size=len(true_rates)
+        )
+        return np.maximum(true_rates * (1 + (quantification_shifts / 100)), 0)
@@ -19,18 +19,23 @@
 #
 # ------------------------------------------------------------------------------
 
-import copy
 
+from dataclasses import dataclass
 from math import floor
 import os
 from pathlib import Path
+import random
+from typing import Any
 
+import numpy as np
 
 from ldar_sim import LdarSim
 from programs.program import Program
 
 from constants import param_default_const as pdc
 from constants.output_messages import RuntimeMessages as rm
+from initialization.initialize_emissions import read_in_emissions
+from utils.rng_registry import RNGRegistry
 from virtual_world.infrastructure import Infrastructure
 
 
@@ -67,15 +72,10 @@ def simulate(
     input_dir: Path,
     output_dir: Path,
     preseed_timeseries,
-    lock,
     prog_measured_df,
+    rng_registry: RNGRegistry = None,
 ):
-    if lock is not None:
-        with lock:
-            infra = copy.deepcopy(infrastructure)
-    else:
-        infra = copy.deepcopy(infrastructure)
-    gc.collect()
+    infra: Infrastructure = infrastructure.program_copy()
     program: Program = Program(
         prog_name,
         weather,
@@ -87,8 +87,12 @@ def simulate(
         virtual_world[pdc.Virtual_World_Params.CONSIDER_WEATHER],
         prog_param,
         input_dir=input_dir,
+        rng_registry=rng_registry.spawn(prog_name) if rng_registry is not None else None,
+    )
+    infra.setup(
+        program.get_method_names(),
+        columnar_emissions=sim_settings[pdc.Sim_Setting_Params.COLUMNAR_EMIS],
     )
-    infra.setup(program.get_method_names())
     print(rm.SIM_PROG.format(prog_name=prog_name))
     simulation: LdarSim = LdarSim(
         sim_num,
@@ -108,6 +112,81 @@ def simulate(
     return
 
 
+@dataclass
+class SimulationWorkerContext:
+    """Inputs shared by every (simulation, program) task of a persistent worker pool.
+    Sent to each worker once when the pool starts instead of with every task.
+    """
+
+    daylight: Any
+    weather: Any
+    programs: dict[str, tuple]
+    sim_settings: dict
+    virtual_world: dict
+    output_params: dict
+    infrastructure: Infrastructure
+    input_dir: Path
+    output_dir: Path
+    generator_dir: Path
+    preseed_timeseries: dict
+    np_random_state: tuple
+    random_state: tuple
+    rng_registry: RNGRegistry = None
+    loaded_sim: int = None
+
+
+_worker_context: SimulationWorkerContext = None
+
+
+def init_simulation_worker(worker_context: SimulationWorkerContext) -> None:
+    global _worker_context
+    _worker_context = worker_context
+
+
+def simulate_task(task: tuple[int, str]) -> tuple[int, str]:
+    """Run one program of one simulation in a persistent pool worker.
+
+    Args:
+        task (tuple[int, str]): The simulation number and the program name.
+
+    Returns:
+        tuple[int, str]: The completed task.
+    """
+    sim_num, prog_name = task
+    ctx: SimulationWorkerContext = _worker_context
+    if ctx.loaded_sim != sim_num:
+        read_in_emissions(
+            ctx.infrastructure,
+            ctx.generator_dir,
+            sim_num,
+            date(*ctx.virtual_world[pdc.Virtual_World_Params.START_DATE]),
+        )
+        ctx.loaded_sim = sim_num
+    # Every task starts from the random state of the parent process, as with a freshly
+    # forked pool, so results do not depend on which worker runs the task
+    np.random.set_state(ctx.np_random_state)
+    random.setstate(ctx.random_state)
+    meth_params, prog_param, prog_measured_df = ctx.programs[prog_name]
+    simulate(
+        ctx.daylight,
+        ctx.weather,
+        sim_num,
+        prog_name,
+        meth_params,
+        prog_param,
+        ctx.sim_settings,
+        ctx.virtual_world,
+        ctx.output_params,
+        ctx.infrastructure,
+        ctx.input_dir,
+        ctx.output_dir,
+        ctx.preseed_timeseries,
+        prog_measured_df,
+        ctx.rng_registry.spawn(sim_num) if ctx.rng_registry is not None else None,
+    )
+    return task
+
+
 def remove_non_preseed_files(directory):
     """
     Remove all files in the given directory except for 'preseed.p'.
@@ -23,12 +23,14 @@ import gc
 import logging
 import multiprocessing as mp
 import os
+import random
 import shutil
 import sys
 from datetime import date
 from pathlib import Path
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 from constants import param_default_const as pdc
 from constants.error_messages import Runtime_Error_Messages as rem
@@ -43,16 +45,23 @@ from file_processing.output_processing.summary_visualization_manager import (
 from initialization.args import get_abs_path
 from initialization.initialize_emissions import initialize_emissions, read_in_emissions
 from initialization.initialize_infrastructure import initialize_infrastructure
-from initialization.preseed import gen_seed_emis
+from initialization.preseed import gen_rng_entropy, gen_seed_emis
 from log_utils.logging_config import setup_logging_to_output
-from simulation.simulation_helpers import batch_simulations, simulate
+from simulation.simulation_helpers import (
+    SimulationWorkerContext,
+    batch_simulations,
+    init_simulation_worker,
+    simulate,
+    simulate_task,
+)
 from utils.generic_functions import check_ERA5_file
 from utils.prog_method_measured_func import (
     filter_deployment_tf_by_program_methods,
     set_up_tf_method_deployed_df,
 )
+from utils.rng_registry import RNGRegistry
 from virtual_world.infrastructure import Infrastructure
-from weather.daylight_calculator import DaylightCalculatorAve
+from weather.daylight_calculator import DaylightCalculatorAll
 from weather.weather_lookup import WeatherLookup as WL
 
 
@@ -101,6 +110,7 @@ class SimulationManager:
 
     def setup_properties(self) -> None:
         self.emis_preseed_val: list[int] = None
+        self.rng_registry: RNGRegistry = None
         self.generator_dir = self.in_dir / Generator_Files.GENERATOR_FOLDER
         self.force_remake_gen: bool = False
         self.infrastructure: Infrastructure = None
@@ -168,6 +178,9 @@ class SimulationManager:
             self.emis_preseed_val, self.force_remake_gen = gen_seed_emis(
                 self.simulation_count, self.generator_dir
             )
+        if self.sim_params[pdc.Sim_Setting_Params.INDEPENDENT_RNG]:
+            entropy: int = gen_rng_entropy(self.generator_dir) if self.preseed_random else None
+            self.rng_registry = RNGRegistry(entropy)
 
     def setup_infrastructure(self) -> None:
 
@@ -202,19 +215,33 @@ class SimulationManager:
             self.sim_end_date,
             self.generator_dir,
             pre_simulation_emissions=self.pre_simulation_emissions,
+            n_processes=self.sim_params[pdc.Sim_Setting_Params.PROCESS],
+            rng_registry=self.rng_registry,
+            columnar_cache=self.sim_params[pdc.Sim_Setting_Params.COLUMNAR_EMIS_CACHE],
         )
 
     def setup_weather(self) -> None:
         print(rm.INIT_WEATHER)
-        self.weather = WL(self.virtual_world, self.in_dir)
+        self.weather = WL(
+            self.virtual_world,
+            self.in_dir,
+            cache_dir=self.generator_dir,
+            site_bounds=self.infrastructure.get_site_bounds(),
+            date_range=(self.sim_start_date, self.sim_end_date),
+        )
+        if self.sim_params[pdc.Sim_Setting_Params.SHARED_WEATHER]:
+            self.weather.share_arrays(self.generator_dir)
         self.infrastructure.set_weather_index(self.weather)
 
     def setup_daylight(self) -> None:
         print(rm.INIT_DAYLIGHT)
-        self.daylight = DaylightCalculatorAve(
-            self.infrastructure.get_site_avrg_lat_lon(),
+        cell_lat_lons, site_cells = self.infrastructure.get_daylight_cells(self.weather)
+        self.daylight = DaylightCalculatorAll(
+            cell_lat_lons,
+            site_cells,
             self.sim_start_date,
             self.sim_end_date,
+            cache_dir=self.generator_dir,
         )
 
     def calc_simulation_years(self) -> None:
@@ -226,6 +253,8 @@ class SimulationManager:
         sim_counts: list[int] = batch_simulations(self.simulation_count)
         if DEBUG:
             self._run_simulations_debug(sim_counts=sim_counts)
+        elif self.sim_params[pdc.Sim_Setting_Params.PERSISTENT_POOL]:
+            self._run_simulations_persistent_pool(sim_counts=sim_counts)
         else:
             self._run_simulation_multiprocessing(sim_counts=sim_counts)
 
@@ -249,44 +278,91 @@ class SimulationManager:
         n_processes: int = self.sim_params[pdc.Sim_Setting_Params.PROCESS]
         if len(self.programs) < n_processes:
             n_processes = len(self.programs)
-        with mp.Manager() as manager:
-            lock = manager.Lock()
-            for batch_count, sim_count in enumerate(sim_counts):
-                for simulation in range(sim_count):
-                    simulation_number: int = batch_count * 5 + simulation
-                    print(rm.SIM_SET.format(simulation_number=simulation_number))
-                    program_data: list[Tuple] = self._setup_programs(
-                        simulation_number=simulation_number, lock=lock
+        for batch_count, sim_count in enumerate(sim_counts):
+            for simulation in range(sim_count):
+                simulation_number: int = batch_count * 5 + simulation
+                print(rm.SIM_SET.format(simulation_number=simulation_number))
+                program_data: list[Tuple] = self._setup_programs(
+                    simulation_number=simulation_number
+                )
+                with mp.Pool(processes=n_processes) as p:
+                    _ = p.starmap(
+                        simulate,
+                        program_data,
                     )
-                    with mp.Pool(processes=n_processes) as p:
-                        _ = p.starmap(
-                            simulate,
-                            program_data,
-                        )
-                    gc.collect()
-                    print(rm.FIN_SIM_SET.format(simulation_number=simulation_number))
+                gc.collect()
+                print(rm.FIN_SIM_SET.format(simulation_number=simulation_number))
+            print(rm.BATCH_CLEAN.format(batch_count=batch_count))
+            self.summary_stats_manager.gen_summary_outputs(
+                batch_count != 0 and (not self.keep_all_program_outputs)
+            )
+
+    def _run_simulations_persistent_pool(self, sim_counts: list[int]) -> None:
+        """Run all simulations on a single pool that lives for the whole run. The
+        (simulation, program) tasks of each batch are spread over all workers; a batch is
+        completed before its summary outputs are generated.
+        """
+        n_processes: int = min(
+            self.sim_params[pdc.Sim_Setting_Params.PROCESS], max(sim_counts) * len(self.programs)
+        )
+        worker_context = SimulationWorkerContext(
+            daylight=self.daylight,
+            weather=self.weather,
+            programs={program: self._get_program_inputs(program) for program in self.programs},
+            sim_settings=self.sim_params,
+            virtual_world=self.virtual_world,
+            output_params=self.output_params,
+            infrastructure=self.infrastructure,
+            input_dir=self.in_dir,
+            output_dir=self.out_dir,
+            generator_dir=self.generator_dir,
+            preseed_timeseries=self.seed_timeseries,
+            np_random_state=np.random.get_state(),
+            random_state=random.getstate(),
+            rng_registry=self.rng_registry,
+        )
+        with mp.Pool(
+            processes=n_processes,
+            initializer=init_simulation_worker,
+            initargs=(worker_context,),
+        ) as p:
+            for batch_count, sim_count in enumerate(sim_counts):
+                tasks: list[tuple[int, str]] = [
+                    (batch_count * 5 + simulation, program)
+                    for simulation in range(sim_count)
+                    for program in self.programs
+                ]
+                for _ in p.imap_unordered(simulate_task, tasks):
+                    pass
+                gc.collect()
                 print(rm.BATCH_CLEAN.format(batch_count=batch_count))
                 self.summary_stats_manager.gen_summary_outputs(
                     batch_count != 0 and (not self.keep_all_program_outputs)
                 )
 
+    def _get_program_inputs(self, program: str) -> tuple[dict, dict, pd.DataFrame]:
+        meth_params = {}
+        prog_measured_df = filter_deployment_tf_by_program_methods(
+            self.site_measurement_matrix, self.programs[program][pdc.Program_Params.METHODS]
+        )
+        for meth in self.programs[program][pdc.Program_Params.METHODS]:
+            meth_params[meth] = self.methods[meth]
+        return meth_params, self.programs[program], prog_measured_df
+
     def _setup_programs(
         self,
         simulation_number: int,
-        lock=None,
     ) -> None:
         # read in pregen emissions
         infra: Infrastructure = read_in_emissions(
-            self.infrastructure, self.generator_dir, simulation_number
+            self.infrastructure, self.generator_dir, simulation_number, self.sim_start_date
         )
+        sim_rng_registry: RNGRegistry = None
+        if self.rng_registry is not None:
+            sim_rng_registry = self.rng_registry.spawn(simulation_number)
         prog_data: list = []
         for program in self.programs:
-            meth_params = {}
-            prog_measured_df = filter_deployment_tf_by_program_methods(
-                self.site_measurement_matrix, self.programs[program][pdc.Program_Params.METHODS]
-            )
-            for meth in self.programs[program][pdc.Program_Params.METHODS]:
-                meth_params[meth] = self.methods[meth]
+            meth_params, prog_params, prog_measured_df = self._get_program_inputs(program)
             prog_data.append(
                 (
                     self.daylight,
@@ -294,7 +370,7 @@ class SimulationManager:
                     simulation_number,
                     program,
                     meth_params,
-                    self.programs[program],
+                    prog_params,
                     self.sim_params,
                     self.virtual_world,
                     self.output_params,
@@ -302,8 +378,8 @@ class SimulationManager:
                     self.in_dir,
                     self.out_dir,
                     self.seed_timeseries,
-                    lock,
                     prog_measured_df,
+                    sim_rng_registry,
                 )
             )
         return prog_data
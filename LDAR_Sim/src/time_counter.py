@@ -35,14 +35,23 @@ class TimeCounter:
         self._start_date = date(*start_date)
         self._end_date = date(*end_date)
         self.current_date = self._start_date
+        self.day_index: int = 0
         return
 
+    def get_simulation_length(self) -> int:
+        """
+        Number of days in the simulation, including the end date
+
+        """
+        return (self._end_date - self._start_date).days + 1
+
     def next_day(self):
         """
         Go to the next day in the simulation
 
         """
         self.current_date += timedelta(days=1)
+        self.day_index += 1
         return
 
     def at_simulation_end(self) -> bool:
@@ -18,6 +18,8 @@
 #
 # ------------------------------------------------------------------------------
 
+import hashlib
+import json
 import logging
 import os
 import sys
@@ -70,3 +72,38 @@ def find_closest_index_numpy(arr, x):
             return idx - 1
         else:
             return idx
+
+
+def hash_file(file_path) -> str:
+    # Construct the hasher object
+    hasher: hashlib._Hash = hashlib.md5()
+
+    # Open the file to hash
+    with open(file_path, "rb") as f:
+        # Add bytes from the file to the hasher chunk by chunk
+        for chunk in iter(lambda: f.read(4096), b""):
+            hasher.update(chunk)
+    # Return the string containing the hex representation of the hash
+    return hasher.hexdigest()
+
+
+def hash_dict(in_dict) -> str:
+    # Convert the dictionary to a string after sorting it by keys.
+    # This ensure the same dictionary will produce the same string
+    json_str = json.dumps(in_dict, sort_keys=True)
+    # Construct the hasher object
+    hasher: hashlib._Hash = hashlib.md5()
+    # Add the bytes of the string to the hasher
+    hasher.update(json_str.encode("utf-8"))
+    # Return the string containing the hex representation of the hash
+    return hasher.hexdigest()
+
+
+def save_array_atomic(array_file: Path, array: np.ndarray) -> None:
+    """Save the array as a .npy file, writing it to a temporary file first and renaming it,
+    so other processes never load a partially written file.
+    """
+    array_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file: Path = array_file.with_name(f"{array_file.stem}_{os.getpid()}.tmp.npy")
+    np.save(tmp_file, array)
+    os.replace(tmp_file, array_file)
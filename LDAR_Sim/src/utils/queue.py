@@ -2,7 +2,7 @@
 ------------------------------------------------------------------------------
 Program:     The LDAR Simulator (LDAR-Sim)
 File:        queue
-Purpose: Module for extending the python queue module
+Purpose: Module for the priority queues used to order surveys and crews
 
 This program is free software: you can redistribute it and/or modify
 it under the terms of the MIT License as published
@@ -18,16 +18,104 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 ------------------------------------------------------------------------------
 """
 
-import queue
+import heapq
 import itertools
+from typing import Any, Callable, Hashable
 
 
-class PriorityQueueWithFIFO(queue.PriorityQueue):
+class PriorityQueueWithFIFO:
+    """A heapq based priority queue where items queued with the same priority are returned
+    in the order they were added. It is only ever used from a single thread, so the locking
+    done by queue.PriorityQueue on every put and get is not needed.
+    """
+
     def __init__(self):
-        super().__init__()
+        self._heap: list[tuple] = []
         self.counter = itertools.count()
 
-    def put(self, priority, item):
+    def put(self, priority, item) -> None:
         # Add a tie-breaker using a secondary counter
-        entry = (priority, next(self.counter), item)
-        super().put(entry)
+        heapq.heappush(self._heap, (priority, next(self.counter), item))
+
+    def get(self) -> tuple:
+        """Remove and return the (priority, counter, item) entry of the highest priority item"""
+        if not self._heap:
+            raise IndexError("get from an empty priority queue")
+        return heapq.heappop(self._heap)
+
+    def empty(self) -> bool:
+        return not self._heap
+
+    def qsize(self) -> int:
+        return len(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class IndexedPriorityQueueWithFIFO:
+    """A heapq based priority queue with the same FIFO tie-breaking as PriorityQueueWithFIFO,
+    where every item is indexed by a key (e.g. the site ID of a survey plan). Items can be
+    looked up, removed or re-prioritized by key in O(log n) without draining the queue.
+
+    Removed entries are marked as such and left in the heap until they reach the top.
+    """
+
+    _REMOVED = object()
+
+    def __init__(self, key: Callable[[Any], Hashable]):
+        self._key: Callable[[Any], Hashable] = key
+        self._heap: list[list] = []
+        self._entries: dict[Hashable, list] = {}
+        self.counter = itertools.count()
+
+    def put(self, priority, item) -> None:
+        """Add the item to the queue. If an item with the same key is already queued,
+        it is replaced and placed behind the items already queued with the new priority.
+        """
+        item_key: Hashable = self._key(item)
+        if item_key in self._entries:
+            self._mark_removed(item_key)
+        entry: list = [priority, next(self.counter), item]
+        self._entries[item_key] = entry
+        heapq.heappush(self._heap, entry)
+        self._compact()
+
+    def get(self) -> tuple:
+        """Remove and return the (priority, counter, item) entry of the highest priority item"""
+        while self._heap:
+            priority, count, item = heapq.heappop(self._heap)
+            if item is not self._REMOVED:
+                del self._entries[self._key(item)]
+                return priority, count, item
+        raise IndexError("get from an empty priority queue")
+
+    def remove(self, item_key: Hashable) -> Any:
+        """Remove and return the item queued under the given key, or None if there is none"""
+        if item_key not in self._entries:
+            return None
+        return self._mark_removed(item_key)
+
+    def empty(self) -> bool:
+        return not self._entries
+
+    def qsize(self) -> int:
+        return len(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item_key: Hashable) -> bool:
+        return item_key in self._entries
+
+    def _mark_removed(self, item_key: Hashable) -> Any:
+        entry: list = self._entries.pop(item_key)
+        item = entry[-1]
+        entry[-1] = self._REMOVED
+        return item
+
+    def _compact(self) -> None:
+        # Rebuild the heap once removed entries make up most of it, to bound its size
+        if len(self._heap) > 2 * len(self._entries) + 32:
+            self._heap = [entry for entry in self._heap if entry[-1] is not self._REMOVED]
+            heapq.heapify(self._heap)
@@ -0,0 +1,84 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        rng_registry
+Purpose: Registry of independent random number streams spawned from a single
+SeedSequence. Each simulation, program and method gets its own child streams,
+one per purpose, so draws made by one part of the model never shift the
+draws made by another.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import zlib
+from typing import Union
+
+import numpy as np
+
+
+def _stable_key(key: Union[int, str]) -> int:
+    """Map a registry key to a non-negative integer that does not change between runs.
+    Python's built-in string hashing is salted per process, so strings are hashed with crc32.
+    """
+    if isinstance(key, (int, np.integer)) and key >= 0:
+        return int(key)
+    return zlib.crc32(str(key).encode("utf-8"))
+
+
+class RNGRegistry:
+    """Hands out numpy Generators derived from a root SeedSequence.
+
+    Child registries are addressed by keys (e.g. simulation number, program name, method name)
+    rather than by the order in which they are spawned. The stream given to a simulation is
+    therefore the same whether it runs first, last or in another process.
+    """
+
+    def __init__(self, entropy: int = None, spawn_key: tuple[int, ...] = ()) -> None:
+        self._seed_sequence = np.random.SeedSequence(entropy, spawn_key=spawn_key)
+        self._generators: dict[str, np.random.Generator] = {}
+
+    def __reduce__(self):
+        # Generators are rebuilt from the seed sequence on the other side
+        return (RNGRegistry, (self.entropy, self.spawn_key))
+
+    @property
+    def entropy(self) -> int:
+        return self._seed_sequence.entropy
+
+    @property
+    def spawn_key(self) -> tuple[int, ...]:
+        return self._seed_sequence.spawn_key
+
+    def spawn(self, *keys: Union[int, str]) -> "RNGRegistry":
+        """Return the child registry addressed by the given keys."""
+        return RNGRegistry(self.entropy, self.spawn_key + tuple(_stable_key(key) for key in keys))
+
+    def generator(self, purpose: str) -> np.random.Generator:
+        """Return the Generator used for the given purpose, creating it on first use."""
+        if purpose not in self._generators:
+            self._generators[purpose] = np.random.default_rng(
+                np.random.SeedSequence(
+                    self.entropy, spawn_key=self.spawn_key + (_stable_key(purpose),)
+                )
+            )
+        return self._generators[purpose]
+
+
+def get_rng(rng: np.random.Generator = None):
+    """Return the given Generator, or the global numpy random module when no Generator is given.
+    Both expose the same sampling methods, so callers can draw from either.
+    """
+    if rng is None:
+        return np.random
+    return rng
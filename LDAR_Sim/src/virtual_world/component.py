@@ -18,12 +18,12 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 ------------------------------------------------------------------------------
 """
 
-from copy import deepcopy
 from datetime import date
 import logging
 import re
-from typing import Any
+from typing import Any, Iterator
 import sys
+import numpy as np
 import pandas as pd
 from file_processing.output_processing.output_utils import (
     EmisInfo,
@@ -32,6 +32,7 @@ from file_processing.output_processing.output_utils import (
 from file_processing.input_processing.emissions_source_processing import (
     EmissionsSource,
 )
+from file_processing.input_processing.infrastructure_processing import get_component_sources
 from scheduling.schedule_dataclasses import TaggingInfo
 from constants.output_file_constants import EMIS_DATA_COL_ACCESSORS as eca
 from virtual_world.emission_types.emission import Emission
@@ -40,9 +41,22 @@ from virtual_world.emission_types.non_repairable_emissions import NonRepairableE
 from constants.infrastructure_const import Infrastructure_Constants as IC
 from constants.error_messages import Initialization_Messages as im
 from virtual_world.sources import Source
+from virtual_world.propagating_params import copy_propagating_params
+from virtual_world.emission_array import EmissionArray
 
 
 class Component:
+    __slots__ = (
+        "_equip_type",
+        "_component_ID",
+        "_sources",
+        "_active_emissions",
+        "_inactive_emissions",
+        "emis_sum_dtypes",
+        "_emis_array",
+        "_comp_order",
+    )
+
     def __init__(self, equip_type, equip_id, infrastructure_inputs, prop_params) -> None:
         STR_FILTER = r"_equipment"
         pattern: re.Pattern[str] = re.compile(re.escape(STR_FILTER), re.IGNORECASE)
@@ -53,6 +67,9 @@ class Component:
         self._active_emissions: list[Emission] = []
         self._inactive_emissions: list[Emission] = []
         self.emis_sum_dtypes: dict[str, str] = {}
+        # Set when the infrastructure hands the daily update over to a columnar emission array
+        self._emis_array: EmissionArray = None
+        self._comp_order: int = None
 
     def __reduce__(self):
         args = (
@@ -62,6 +79,8 @@ class Component:
             self._active_emissions,
             self._inactive_emissions,
             self.emis_sum_dtypes,
+            self._emis_array,
+            self._comp_order,
         )
         return (self.__class__._reconstruct, args)
 
@@ -74,6 +93,8 @@ class Component:
         active_emissions,
         inactive_emissions,
         emis_sum_dtypes,
+        emis_array=None,
+        comp_order=None,
     ):
         instance = cls.__new__(cls)
         instance._equip_type = equip_type
@@ -82,13 +103,43 @@ class Component:
         instance._active_emissions = active_emissions
         instance._inactive_emissions = inactive_emissions
         instance.emis_sum_dtypes = emis_sum_dtypes
+        instance._emis_array = emis_array
+        instance._comp_order = comp_order
         return instance
 
+    def program_copy(self) -> "Component":
+        """Copy of the component for a single program. The component properties are shared,
+        the sources and emission lists hold copies of the emissions.
+        """
+        return self._reconstruct(
+            self._equip_type,
+            self._component_ID,
+            [source.program_copy() for source in self._sources],
+            [emission.program_copy() for emission in self._active_emissions],
+            [emission.program_copy() for emission in self._inactive_emissions],
+            self.emis_sum_dtypes,
+        )
+
     def set_emis_sum_dtypes(self, methods: list[str]):
         self.emis_sum_dtypes = Emission.EMIS_SUMMARY_DTYPES
         method_spat_dtypes = {method: "bool" for method in methods}
         self.emis_sum_dtypes.update(method_spat_dtypes)
 
+    def has_intermittent_sources(self) -> bool:
+        return any(not source._persistent for source in self._sources)
+
+    def set_emission_array(self, emis_array: EmissionArray, comp_order: int) -> None:
+        """Hand the daily update of the component's emissions over to a columnar
+        emission array shared by the infrastructure.
+
+        Args:
+            emis_array (EmissionArray): The emission array of the infrastructure.
+            comp_order (int): The position of the component in the infrastructure.
+        """
+        self._emis_array = emis_array
+        self._comp_order = comp_order
+        emis_array.add_emissions(self._active_emissions, self, comp_order)
+
     # def _get_methods_for_dtype(self, prop_params) -> dict[str, str]:
     #     # Loop through any method specific param to get the existing methods
 
@@ -100,12 +151,9 @@ class Component:
 
     def _create_sources(self, infrastructure_inputs, prop_params) -> None:
         if self._equip_type != "Placeholder" and "sources" in infrastructure_inputs:
-            sources_info: pd.DataFrame = infrastructure_inputs["sources"]
-            sources: pd.DataFrame = sources_info.loc[
-                sources_info[IC.Sources_File_Constants.COMPONENT] == self._equip_type
-            ]
-            for idx, source in sources.iterrows():
-                src_prop_params = deepcopy(prop_params)
+            sources: list[dict] = get_component_sources(infrastructure_inputs, self._equip_type)
+            for source in sources:
+                src_prop_params = copy_propagating_params(prop_params)
                 src_id = source[IC.Sources_File_Constants.SOURCE]
                 self._sources.append(Source(src_id, source, src_prop_params))
         elif self._equip_type == "Placeholder":
@@ -156,6 +204,7 @@ class Component:
         emission_rate_source_dictionary: dict[str, EmissionsSource],
         repair_delay_dataframe: pd.DataFrame,
         pre_simulation_emissions: bool,
+        rng: np.random.Generator = None,
     ) -> dict:
         equip_emissions = {}
         for src in self._sources:
@@ -167,6 +216,7 @@ class Component:
                     emission_rate_source_dictionary,
                     repair_delay_dataframe,
                     pre_simulation_emissions=pre_simulation_emissions,
+                    rng=rng,
                 )
             )
 
@@ -189,6 +239,8 @@ class Component:
 
         new_emissions_count += len(new_emissions_list)
         self._active_emissions.extend(new_emissions_list)
+        if self._emis_array is not None:
+            self._emis_array.add_emissions(new_emissions_list, self, self._comp_order)
         return new_emissions_count
 
     def update_emissions_state(self, emis_rep_info: EmisInfo, emis_data: TsEmisData) -> None:
@@ -207,12 +259,21 @@ class Component:
         self._active_emissions = updated_active_emissions
         emis_data.active_leaks += len(self._active_emissions)
 
+    def deactivate_emissions(self, emissions: list[Emission]) -> None:
+        """Move emissions that were repaired or expired by the emission array
+        from the active to the inactive emissions list."""
+        retired: set[Emission] = set(emissions)
+        self._active_emissions = [
+            emission for emission in self._active_emissions if emission not in retired
+        ]
+        self._inactive_emissions.extend(emissions)
+
     def tag_emissions(self, tagging_info: TaggingInfo) -> None:
         # TODO improve this logic
         emission_rate = tagging_info.measured_rate / len(self._active_emissions)
         for emission in self._active_emissions:
             if isinstance(emission, RepairableEmission):
-                emission.tag_leak(
+                newly_tagged: bool = emission.tag_leak(
                     measured_rate=emission_rate,
                     cur_date=tagging_info.curr_date,
                     t_since_ldar=tagging_info.t_since_LDAR,
@@ -220,6 +281,8 @@ class Component:
                     crew_id=tagging_info.crew,
                     tagging_rep_delay=tagging_info.report_delay,
                 )
+                if newly_tagged and self._emis_array is not None:
+                    self._emis_array.tag_emission(emission, tagging_info.report_delay)
                 emission.update_detection_records(
                     company=tagging_info.company, detect_date=tagging_info.curr_date
                 )
@@ -235,11 +298,13 @@ class Component:
                     company=tagging_info.company, detect_date=tagging_info.curr_date
                 )
 
-    def get_detectable_emissions(self, method_name: str) -> Emission:
+    def get_detectable_emissions(
+        self, method_name: str, rng: np.random.Generator = None
+    ) -> Emission:
         detectable_emissions: list[Emission] = []
         for emis in self._active_emissions:
-            if emis.check_spatial_cov(method_name) and emis.is_emitting():
-                if emis.check_temporal_cov(method_name):
+            if emis.check_spatial_cov(method_name, rng=rng) and emis.is_emitting():
+                if emis.check_temporal_cov(method_name, rng=rng):
                     detectable_emissions.append(emis)
 
         return detectable_emissions
@@ -248,26 +313,21 @@ class Component:
         for src in self._sources:
             src.set_pregen_emissions(equipment_emissions[src.get_id()], sim_number)
 
+    def set_pregen_emission_rows(
+        self, source_rows: Iterator[np.ndarray], sim_number: int, sim_start_date: date
+    ) -> None:
+        for src in self._sources:
+            src.set_pregen_emission_rows(source_rows, sim_number, sim_start_date)
+
     def get_id(self) -> str:
         return self._component_ID
 
     def gen_emis_data(
-        self, emis_df: pd.DataFrame, site_id: str, eqg_id: str, row_index: int, end_date: date
-    ) -> int:
-        upd_row_index = row_index
-        for emission in self._active_emissions:
-            summary_dict: dict[str, Any] = emission.get_summary_dict(end_date)
-            summary_dict.update(
-                {eca.SITE_ID: site_id, eca.EQG: eqg_id, eca.COMP: self._component_ID}
-            )
-            emis_df.loc[upd_row_index] = summary_dict
-            upd_row_index += 1
-
-        for emission in self._inactive_emissions:
+        self, emis_records: list[dict[str, Any]], site_id: str, eqg_id: str, end_date: date
+    ) -> None:
+        for emission in self._active_emissions + self._inactive_emissions:
             summary_dict: dict[str, Any] = emission.get_summary_dict(end_date)
             summary_dict.update(
                 {eca.SITE_ID: site_id, eca.EQG: eqg_id, eca.COMP: self._component_ID}
             )
-            emis_df.loc[upd_row_index] = summary_dict
-            upd_row_index += 1
-        return upd_row_index
+            emis_records.append(summary_dict)
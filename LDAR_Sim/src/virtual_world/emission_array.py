@@ -0,0 +1,229 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        emission_array.py
+Purpose: Columnar (NumPy structured array) backend for the daily update of
+active emissions.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import numpy as np
+
+from constants.general_const import Conversion_Constants as cc
+from file_processing.output_processing.output_utils import EmisInfo, TsEmisData
+from virtual_world.emission_types.emission import Emission
+from virtual_world.emission_types.repairable_emission import RepairableEmission
+
+EMIS_ARRAY_DTYPE = np.dtype(
+    [
+        ("rate", "f8"),
+        ("active_days", "i8"),
+        ("days_active_b4_sim", "i8"),
+        ("status", "i1"),
+        ("repairable", "?"),
+        ("tagged", "?"),
+        ("days_since_tagged", "i8"),
+        ("repair_delay", "f8"),
+        ("tagging_rep_delay", "i8"),
+        ("nrd", "i8"),
+        ("comp_order", "i8"),
+    ]
+)
+
+ROW_RETIRED = 0
+ROW_ACTIVE = 1
+
+
+class EmissionArray:
+    """Structured array holding the mutable daily state of every active persistent emission
+    in an infrastructure. The emission objects stay owned by their components and are used for
+    detection, tagging and the summary outputs; their counters are written back when they are
+    repaired or expire, or when sync_emissions is called.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self) -> None:
+        self._data: np.ndarray = np.zeros(self.INITIAL_CAPACITY, dtype=EMIS_ARRAY_DTYPE)
+        self._size: int = 0
+        self._n_retired: int = 0
+        self._emissions: list[Emission] = []
+        self._owners: list = []
+        self._rows: dict[Emission, int] = {}
+
+    def __reduce__(self):
+        args = (
+            self._data,
+            self._size,
+            self._n_retired,
+            self._emissions,
+            self._owners,
+            self._rows,
+        )
+        return (self.__class__._reconstruct, args)
+
+    @classmethod
+    def _reconstruct(cls, data, size, n_retired, emissions, owners, rows):
+        instance = cls.__new__(cls)
+        instance._data = data
+        instance._size = size
+        instance._n_retired = n_retired
+        instance._emissions = emissions
+        instance._owners = owners
+        instance._rows = rows
+        return instance
+
+    def __len__(self) -> int:
+        return self._size - self._n_retired
+
+    def _grow(self, n_new: int) -> None:
+        capacity: int = len(self._data)
+        if self._size + n_new <= capacity:
+            return
+        while self._size + n_new > capacity:
+            capacity *= 2
+        grown: np.ndarray = np.zeros(capacity, dtype=EMIS_ARRAY_DTYPE)
+        grown[: self._size] = self._data[: self._size]
+        self._data = grown
+
+    def _compact(self) -> None:
+        live: np.ndarray = self._data[: self._size]
+        keep: np.ndarray = np.flatnonzero(live["status"] == ROW_ACTIVE)
+        n_keep: int = len(keep)
+        self._data[:n_keep] = live[keep]
+        self._emissions = [self._emissions[row] for row in keep]
+        self._owners = [self._owners[row] for row in keep]
+        self._rows = {emission: row for row, emission in enumerate(self._emissions)}
+        self._size = n_keep
+        self._n_retired = 0
+
+    def add_emissions(self, emissions: list[Emission], owner, comp_order: int) -> None:
+        """Register newly activated emissions of a component.
+
+        Args:
+            emissions (list[Emission]): The emissions activated today, in activation order.
+            owner (Component): The component at which the emissions occur.
+            comp_order (int): The position of the component in the infrastructure traversal,
+            used to process repairs in the same order as the object based update.
+        """
+        if not emissions:
+            return
+        self._grow(len(emissions))
+        for emission in emissions:
+            row: int = self._size
+            record = self._data[row]
+            record["rate"] = emission._rate
+            record["active_days"] = emission._active_days
+            record["days_active_b4_sim"] = emission._days_active_b4_sim
+            record["status"] = ROW_ACTIVE
+            record["repairable"] = emission._repairable
+            record["comp_order"] = comp_order
+            if isinstance(emission, RepairableEmission):
+                record["tagged"] = emission._tagged
+                record["days_since_tagged"] = emission._days_since_tagged
+                record["repair_delay"] = emission._repair_delay
+                record["tagging_rep_delay"] = emission._tagging_rep_delay
+                record["nrd"] = emission._nrd
+            else:
+                record["nrd"] = emission._duration
+            self._emissions.append(emission)
+            self._owners.append(owner)
+            self._rows[emission] = row
+            self._size += 1
+
+    def tag_emission(self, emission: Emission, tagging_rep_delay: int) -> None:
+        row: int = self._rows[emission]
+        self._data["tagged"][row] = True
+        self._data["tagging_rep_delay"][row] = tagging_rep_delay
+
+    def update_emissions_state(self, emis_rep_info: EmisInfo, emis_data: TsEmisData) -> None:
+        """Vectorised equivalent of Component.update_emissions_state for all registered
+        emissions. Repairs, natural repairs and expiries are applied to the emission objects
+        through their own state transition methods.
+        """
+        live: np.ndarray = self._data[: self._size]
+        active: np.ndarray = live["status"] == ROW_ACTIVE
+        live["active_days"][active] += 1
+        repairable: np.ndarray = live["repairable"]
+        tagged: np.ndarray = active & repairable & live["tagged"]
+        live["days_since_tagged"][tagged] += 1
+        days_emitting: np.ndarray = live["active_days"] + live["days_active_b4_sim"]
+
+        repaired: np.ndarray = tagged & (
+            live["days_since_tagged"] >= live["repair_delay"] + live["tagging_rep_delay"]
+        )
+        nat_repaired: np.ndarray = (
+            active & repairable & ~live["tagged"] & (days_emitting >= live["nrd"])
+        )
+        expired: np.ndarray = active & ~repairable & (days_emitting >= live["nrd"])
+        retired: np.ndarray = repaired | nat_repaired | expired
+        still_active: np.ndarray = active & ~retired
+
+        daily_emis: np.ndarray = live["rate"] * cc.GRAMS_PER_SECOND_TO_KG_PER_DAY
+        mitigable: np.ndarray = still_active & repairable
+        non_mitigable: np.ndarray = still_active & ~repairable
+        # Totals are only added when there are emissions of the type, matching the object path
+        if mitigable.any():
+            emis_data.daily_emis_mit += float(np.sum(daily_emis[mitigable]))
+        if non_mitigable.any():
+            emis_data.daily_emis_non_mit += float(np.sum(daily_emis[non_mitigable]))
+        if still_active.any():
+            emis_data.daily_emis += float(np.sum(daily_emis[still_active]))
+        emis_data.active_leaks += int(np.count_nonzero(still_active))
+
+        if retired.any():
+            self._retire(np.flatnonzero(retired), repaired, nat_repaired, emis_rep_info)
+
+    def _retire(
+        self,
+        rows: np.ndarray,
+        repaired: np.ndarray,
+        nat_repaired: np.ndarray,
+        emis_rep_info: EmisInfo,
+    ) -> None:
+        # Stable sort so emissions at the same component keep their activation order
+        rows = rows[np.argsort(self._data["comp_order"][rows], kind="stable")]
+        retired_by_owner: dict = {}
+        for row in rows:
+            emission: Emission = self._emissions[row]
+            self._sync_emission(row)
+            if repaired[row]:
+                emission.check_if_repaired(emis_rep_info)
+            elif nat_repaired[row]:
+                emission.natural_repair(emis_rep_info)
+            else:
+                emission.expire(emis_rep_info)
+            retired_by_owner.setdefault(self._owners[row], []).append(emission)
+            del self._rows[emission]
+        self._data["status"][rows] = ROW_RETIRED
+        for owner, emissions in retired_by_owner.items():
+            owner.deactivate_emissions(emissions)
+
+        self._n_retired += len(rows)
+        if self._n_retired > self.INITIAL_CAPACITY and self._n_retired > len(self):
+            self._compact()
+
+    def _sync_emission(self, row: int) -> None:
+        record = self._data[row]
+        emission: Emission = self._emissions[row]
+        emission._active_days = int(record["active_days"])
+        if isinstance(emission, RepairableEmission):
+            emission._days_since_tagged = int(record["days_since_tagged"])
+
+    def sync_emissions(self) -> None:
+        """Write the counters of the emissions that are still active back to their objects."""
+        for row in range(self._size):
+            if self._data["status"][row] == ROW_ACTIVE:
+                self._sync_emission(row)
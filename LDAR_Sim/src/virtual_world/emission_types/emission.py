@@ -18,18 +18,43 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 ------------------------------------------------------------------------------
 """
 
+import copyreg
 from datetime import date
+from operator import attrgetter
 from typing import Any
 
-from numpy.random import binomial
+from numpy.random import binomial, Generator
 from file_processing.output_processing.output_utils import EmisInfo
 from constants.general_const import Conversion_Constants as cc, Emission_Constants as ec
 from constants.output_file_constants import EMIS_DATA_COL_ACCESSORS as eca
 
 
 class Emission:
+    # Emissions are created by the million, so their attributes are held in slots rather than
+    # a dictionary per emission. Subclasses list the attributes they add in their own slots.
+    __slots__ = (
+        "_emissions_id",
+        "_rate",
+        "_start_date",
+        "_repairable",
+        "_estimated_date_began",
+        "_estimated_days_active",
+        "_active_days",
+        "_measured_rate",
+        "_flagged_by",
+        "_init_detect_by",
+        "_init_detect_date",
+        "_tech_spat_cov_probs",
+        "_tech_temp_cov_probs",
+        "_tech_spat_covs",
+        "_status",
+    )
+    # The slots of the class and its bases, in the order of the pickled state
+    _STATE_SLOTS: tuple[str, ...] = __slots__
+    _get_state_values = attrgetter(*__slots__)
+
     EMIS_SUMMARY_DTYPES = {
-        eca.EMIS_ID: "object",
+        eca.EMIS_ID: "int64",
         eca.STATUS: "object",
         eca.DAYS_ACT: "int32",
         eca.T_VOL_EMIT: "float64",
@@ -56,7 +81,7 @@ class Emission:
         tech_spat_cov_probs: dict[str, float],
         tech_temp_cov_probs: dict[str, float],
     ) -> None:
-        self._emissions_id: str = f"{str(emission_n).zfill(10)}"
+        self._emissions_id: int = int(emission_n)
         self._rate: float = rate
         self._start_date: date = start_date
         self._repairable: bool = repairable
@@ -73,18 +98,43 @@ class Emission:
         self._tech_spat_covs: dict[str, int] = {}
         self._status = ec.INACTIVE
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._STATE_SLOTS = tuple(
+            slot for klass in reversed(cls.__mro__) for slot in klass.__dict__.get("__slots__", ())
+        )
+        cls._get_state_values = attrgetter(*cls._STATE_SLOTS)
+
     def __reduce__(self):
-        return (self.__class__._reconstruct_emissions, (self.__dict__,))
+        # Pickled as the class and a tuple of the slot values, which is restored by __setstate__
+        return (copyreg.__newobj__, (self.__class__,), self._get_state())
+
+    def _get_state(self) -> tuple:
+        """The values of the slots of the emission, in the order of _STATE_SLOTS"""
+        return self._get_state_values(self)
 
     def __setstate__(self, state):
-        self.__dict__.update(state)
+        # Emissions pickled before they had slots hold a dictionary of their attributes
+        items = state.items() if isinstance(state, dict) else zip(self._STATE_SLOTS, state)
+        for slot, value in items:
+            setattr(self, slot, value)
 
+    # Reconstructs emissions pickled before the emissions had slots
     @classmethod
     def _reconstruct_emissions(cls, state):
         emission = cls.__new__(cls)
         emission.__setstate__(state)
         return emission
 
+    def program_copy(self) -> "Emission":
+        """Copy of the emission for a single program. Only the spatial coverage rolls are held
+        in a mutable container, all other state is replaced rather than modified in place.
+        """
+        emission = self.__class__.__new__(self.__class__)
+        emission.__setstate__(self._get_state())
+        emission._tech_spat_covs = dict(self._tech_spat_covs)
+        return emission
+
     def update(self, emis_rep_info: EmisInfo) -> bool:
         """
         Increments duration values
@@ -95,16 +145,18 @@ class Emission:
         else:
             return False
 
-    def check_spatial_cov(self, method) -> int:
+    def check_spatial_cov(self, method, rng: Generator = None) -> int:
         name_str: str = f"{method} Spatial Coverage"
         if name_str not in self._tech_spat_covs:
             cov_prob: float = self._tech_spat_cov_probs[method]
-            self._tech_spat_covs[name_str] = binomial(1, cov_prob)
+            self._tech_spat_covs[name_str] = (
+                binomial(1, cov_prob) if rng is None else rng.binomial(1, cov_prob)
+            )
         return self._tech_spat_covs[name_str]
 
-    def check_temporal_cov(self, method) -> int:
+    def check_temporal_cov(self, method, rng: Generator = None) -> int:
         cov_prob: float = self._tech_temp_cov_probs[method]
-        roll = binomial(1, cov_prob)
+        roll = binomial(1, cov_prob) if rng is None else rng.binomial(1, cov_prob)
         return roll
 
     def activate() -> bool:
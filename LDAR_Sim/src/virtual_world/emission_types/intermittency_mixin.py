@@ -25,7 +25,21 @@ from file_processing.output_processing.output_utils import EmisInfo
 from typing_extensions import override
 
 
+# The mixin has no slots of its own, as only one base of a class can add slots. The emission
+# classes it is mixed into hold its attributes in these slots.
+INTERMITTENCY_SLOTS: tuple[str, ...] = (
+    "_active_duration",
+    "_inactive_duration",
+    "_days_emitting",
+    "_non_emitting_period_day_count",
+    "_emitting_period_day_count",
+    "_emitting",
+)
+
+
 class IntermittencyMixin:
+    __slots__ = ()
+
     def __init__(
         self,
         active_duration: int,
@@ -20,11 +20,16 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 
 from datetime import date
 
-from virtual_world.emission_types.intermittency_mixin import IntermittencyMixin
+from virtual_world.emission_types.intermittency_mixin import (
+    INTERMITTENCY_SLOTS,
+    IntermittencyMixin,
+)
 from virtual_world.emission_types.non_repairable_emissions import NonRepairableEmission
 
 
 class IntermittentNonRepairableEmission(IntermittencyMixin, NonRepairableEmission):
+    __slots__ = INTERMITTENCY_SLOTS
+
     def __init__(
         self,
         emission_number: int,
@@ -51,12 +56,7 @@ class IntermittentNonRepairableEmission(IntermittencyMixin, NonRepairableEmissio
             duration,
         )
 
-    def __reduce__(self):
-        return self._reconstruct_intermittent_non_repairable_emission, (self.__dict__,)
-
-    def __setstate__(self, state):
-        self.__dict__.update(state)
-
+    # Reconstructs emissions pickled before the emissions had slots
     @classmethod
     def _reconstruct_intermittent_non_repairable_emission(cls, state):
         instance = cls.__new__(cls)
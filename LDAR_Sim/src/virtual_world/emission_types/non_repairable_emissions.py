@@ -31,6 +31,16 @@ from constants.general_const import Emission_Constants as ec
 
 
 class NonRepairableEmission(Emission):
+    __slots__ = (
+        "_record",
+        "_recorded_by_company",
+        "_recorded_by_crew",
+        "_expiry_date",
+        "_duration",
+        "_days_active_b4_sim",
+        "_estimated_days_active_after_detection",
+    )
+
     def __init__(
         self,
         emission_n: int,
@@ -60,12 +70,7 @@ class NonRepairableEmission(Emission):
         self._days_active_b4_sim = days_active_b4_sim if days_active_b4_sim > 0 else 0
         self._estimated_days_active_after_detection: int = 0
 
-    def __reduce__(self):
-        return self._reconstruct_nonfugitive_emission, (self.__dict__,)
-
-    def __setstate__(self, state):
-        self.__dict__.update(state)
-
+    # Reconstructs emissions pickled before the emissions had slots
     @classmethod
     def _reconstruct_nonfugitive_emission(cls, state):
         instance = cls.__new__(cls)
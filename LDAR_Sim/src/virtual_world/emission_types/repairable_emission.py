@@ -31,6 +31,19 @@ from virtual_world.emission_types.emission import Emission
 
 
 class RepairableEmission(Emission):
+    __slots__ = (
+        "_tagged",
+        "_days_since_tagged",
+        "_tagged_by_company",
+        "_tagged_by_crew",
+        "_repair_delay",
+        "_repair_cost",
+        "_tagging_rep_delay",
+        "_nrd",
+        "_repair_date",
+        "_days_active_b4_sim",
+    )
+
     def __init__(
         self,
         emission_n: int,
@@ -66,12 +79,7 @@ class RepairableEmission(Emission):
         days_active_b4_sim: int = (simulation_sd - start_date).days
         self._days_active_b4_sim = days_active_b4_sim if days_active_b4_sim > 0 else 0
 
-    def __reduce__(self):
-        return self._reconstruct_fugitive_emission, (self.__dict__,)
-
-    def __setstate__(self, state):
-        self.__dict__.update(state)
-
+    # Reconstructs emissions pickled before the emissions had slots
     @classmethod
     def _reconstruct_fugitive_emission(cls, state):
         instance = cls.__new__(cls)
@@ -19,7 +19,9 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 """
 
 from datetime import date
+from typing import Iterator
 
+import numpy as np
 import pandas as pd
 from file_processing.output_processing.output_utils import (
     EmisInfo,
@@ -32,10 +34,20 @@ from scheduling.schedule_dataclasses import TaggingInfo
 from virtual_world.emission_types.emission import Emission
 from constants.infrastructure_const import Infrastructure_Constants as IC
 from virtual_world.component import Component
+from virtual_world.propagating_params import set_method_specific_param
+from virtual_world.emission_array import EmissionArray
 from constants.param_default_const import Common_Params as cp
 
 
 class Equipment_Group:
+    __slots__ = (
+        "_id",
+        "_meth_survey_times",
+        "_meth_survey_costs",
+        "_component",
+        "_components_by_id",
+    )
+
     def __init__(self, id, infrastructure_inputs, prop_params, info) -> None:
         self._id: str = id
         self._meth_survey_times = None
@@ -48,6 +60,7 @@ class Equipment_Group:
             prop_params=prop_params,
             info=info,
         )
+        self._set_components_by_id()
 
     def __reduce__(self):
         args = (
@@ -65,8 +78,23 @@ class Equipment_Group:
         instance._meth_survey_times = meth_survey_times
         instance._meth_survey_costs = meth_survey_costs
         instance._component = component
+        instance._set_components_by_id()
         return instance
 
+    def program_copy(self) -> "Equipment_Group":
+        return self._reconstruct(
+            self._id,
+            self._meth_survey_times,
+            self._meth_survey_costs,
+            [component.program_copy() for component in self._component],
+        )
+
+    def _set_components_by_id(self) -> None:
+        # Index the components by ID, so that tagging emissions does not scan the list
+        self._components_by_id: dict[str, Component] = {}
+        for component in self._component:
+            self._components_by_id.setdefault(component.get_id(), component)
+
     def _update_prop_params(self, info: dict, prop_params: dict) -> None:
         meth_specific_params: dict = prop_params.pop(cp.METH_SPECIFIC)
 
@@ -74,7 +102,7 @@ class Equipment_Group:
             for method in meth_specific_params[param].keys():
                 eqg_val = info.get(method + param, None)
                 if eqg_val is not None:
-                    meth_specific_params[param][method] = eqg_val
+                    set_method_specific_param(meth_specific_params, param, method, eqg_val)
 
         for param in prop_params.keys():
             eqg_val = info.get(param, None)
@@ -109,7 +137,7 @@ class Equipment_Group:
         )
 
     def _clean_propagating_parameters_from_equipment_info(self, info: pd.Series) -> pd.Series:
-        info_labels_to_drop: list[str] = (
+        info_labels_to_drop: list[str] = list(
             IC.Equipment_Group_File_Constants.PROPAGATING_PARAMETER_COLUMNS
         )
 
@@ -134,6 +162,7 @@ class Equipment_Group:
         emission_rate_source_dictionary: dict[str, EmissionsSource],
         repair_delay_dataframe: pd.DataFrame,
         pre_simulation_emissions: bool,
+        rng: np.random.Generator = None,
     ) -> dict:
         eqg_emissions = {}
         for eqmt in self._component:
@@ -145,6 +174,7 @@ class Equipment_Group:
                     emission_rate_source_dictionary,
                     repair_delay_dataframe,
                     pre_simulation_emissions=pre_simulation_emissions,
+                    rng=rng,
                 )
             )
 
@@ -169,16 +199,17 @@ class Equipment_Group:
             comp.update_emissions_state(emis_rep_info, emis_data)
 
     def tag_emissions_at_component(self, component: str, tagging_info: TaggingInfo) -> None:
-        target_comp: Component | None = next(
-            (comp for comp in self._component if comp.get_id() == component),
-            None,
-        )
+        target_comp: Component = self._components_by_id[component]
         target_comp.tag_emissions(tagging_info)
 
-    def get_detectable_emissions(self, method_name: str) -> dict[str, list[Emission]]:
+    def get_detectable_emissions(
+        self, method_name: str, rng: np.random.Generator = None
+    ) -> dict[str, list[Emission]]:
         detectable_emissions: dict[str, Emission] = {}
         for equip in self._component:
-            detectable_emissions[equip.get_id()] = equip.get_detectable_emissions(method_name)
+            detectable_emissions[equip.get_id()] = equip.get_detectable_emissions(
+                method_name, rng=rng
+            )
 
         return detectable_emissions
 
@@ -186,6 +217,12 @@ class Equipment_Group:
         for component in self._component:
             component.set_pregen_emissions(eqg_emissions[component.get_id()], sim_number)
 
+    def set_pregen_emission_rows(
+        self, source_rows: Iterator[np.ndarray], sim_number: int, sim_start_date: date
+    ) -> None:
+        for component in self._component:
+            component.set_pregen_emission_rows(source_rows, sim_number, sim_start_date)
+
     def get_survey_time(self, method_name) -> float:
         survey_time: float = self._meth_survey_times[method_name]
         return survey_time
@@ -197,11 +234,9 @@ class Equipment_Group:
     def get_id(self) -> str:
         return self._id
 
-    def gen_emis_data(self, emis_df: pd.DataFrame, site_id: str, row_index: int, end_date: date):
-        upd_row_index = row_index
+    def gen_emis_data(self, emis_records: list[dict], site_id: str, end_date: date) -> None:
         for equip in self._component:
-            upd_row_index = equip.gen_emis_data(emis_df, site_id, self._id, upd_row_index, end_date)
-        return upd_row_index
+            equip.gen_emis_data(emis_records, site_id, self._id, end_date)
 
     def get_survey_cost(self, method_name) -> float:
         return self._meth_survey_costs[method_name]
@@ -210,6 +245,15 @@ class Equipment_Group:
         for component in self._component:
             component.set_emis_sum_dtypes(methods)
 
+    def has_intermittent_sources(self) -> bool:
+        return any(component.has_intermittent_sources() for component in self._component)
+
+    def set_emission_array(self, emis_array: EmissionArray, comp_order: int) -> int:
+        for component in self._component:
+            component.set_emission_array(emis_array, comp_order)
+            comp_order += 1
+        return comp_order
+
     @property
     def component(self):
         return self._component
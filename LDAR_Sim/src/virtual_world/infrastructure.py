@@ -19,6 +19,7 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 """
 
 from datetime import date
+from typing import Iterator
 import numpy as np
 import pandas as pd
 from utils.generic_functions import find_closest_index_numpy
@@ -37,10 +38,23 @@ from constants.infrastructure_const import (
     Deployment_TF_Sites_Constants as DTSC,
 )
 from virtual_world.sites import Site
+from virtual_world.propagating_params import (
+    copy_propagating_params,
+    set_method_specific_param,
+)
+from virtual_world.emission_array import EmissionArray
+from virtual_world.pregenerated_emissions import iter_source_rows
+from constants.output_messages import RuntimeMessages as rm
+from constants.output_file_constants import (
+    EMIS_DATA_COL_ACCESSORS as eca,
+    EMIS_DATA_FINAL_COL_ORDER,
+)
 from file_processing.input_processing.infrastructure_processing import (
     read_in_infrastructure_files,
     check_site_file,
-    get_equip,
+    check_site_types,
+    get_first_site_types,
+    get_site_type_values,
 )
 from weather.weather_lookup import WeatherLookup as WL
 
@@ -58,6 +72,7 @@ class Infrastructure:
             inputs_path=in_dir, virtual_world=virtual_world
         )
         self._sites: list[Site] = []
+        self._emis_array: EmissionArray = None
         self.generate_infrastructure(
             virtual_world=virtual_world,
             methods=methods,
@@ -65,17 +80,38 @@ class Infrastructure:
         )
 
     def __reduce__(self):
-        args = (self.emission_rate_source_dictionary, self.repair_delay_dataframe, self._sites)
+        args = (
+            self.emission_rate_source_dictionary,
+            self.repair_delay_dataframe,
+            self._sites,
+            self._emis_array,
+        )
         return (self.__class__._reconstruct, args)
 
     @classmethod
-    def _reconstruct(cls, emission_rate_dict, repair_df, sites):
+    def _reconstruct(cls, emission_rate_dict, repair_df, sites, emis_array=None):
         instance = cls.__new__(cls)
         instance.emission_rate_source_dictionary = emission_rate_dict
         instance.repair_delay_dataframe = repair_df
         instance._sites = sites
+        instance._emis_array = emis_array
         return instance
 
+    def program_copy(self) -> "Infrastructure":
+        """Copy of the infrastructure for a single program. The site, equipment group,
+        component and source properties, along with the emission rate sources and repair delays,
+        are shared with the original and never modified during a simulation. Only the state
+        a program changes, the emissions and the lists and queues holding them, is copied.
+
+        Returns:
+            Infrastructure: The copy on which to run a program.
+        """
+        return self._reconstruct(
+            self.emission_rate_source_dictionary,
+            self.repair_delay_dataframe,
+            [site.program_copy() for site in self._sites],
+        )
+
     def generate_propagating_params(self, virtual_world, methods) -> dict:
         prop_params_dict: dict = {}
         for (
@@ -111,43 +147,95 @@ class Infrastructure:
             ][meth] = True
         return prop_params_dict
 
-    def update_propagating_params(
-        self,
+    @staticmethod
+    def _get_propagating_param_sources(
+        site_columns: list[str], site_type_columns: list[str], methods: list[str]
+    ) -> list[tuple[str, str, bool, int]]:
+        """
+        Resolve which column of the sites or site types file sets each propagating parameter,
+        in the order _set_propagating_params applies them, so later sources take precedence.
+        Values from the site types file are applied first, so the sites file takes precedence.
+
+        Returns:
+            list[tuple[str, str, bool, int]]: The parameter, the method (None for parameters
+            that are not method specific), whether the value comes from the sites file rather
+            than the site types file, and the position of the column.
+        """
+        param_sources: list[tuple[str, str, bool, int]] = []
+        for columns, from_site, prop_params, meth_spec_prop_params in (
+            (
+                site_type_columns,
+                False,
+                IC.Site_Type_File_Constants.PROPAGATING_PARAMS,
+                IC.Site_Type_File_Constants.METH_SPEC_PROP_PARAMS,
+            ),
+            (
+                site_columns,
+                True,
+                IC.Sites_File_Constants.PROPAGATING_PARAMS,
+                IC.Sites_File_Constants.METH_SPEC_PROP_PARAMS,
+            ),
+        ):
+            positions: dict[str, int] = {
+                column: position for position, column in enumerate(columns)
+            }
+            for param in prop_params:
+                if param in positions:
+                    param_sources.append((param, None, from_site, positions[param]))
+            for method in methods:
+                for param in meth_spec_prop_params:
+                    if method + param in positions:
+                        param_sources.append((param, method, from_site, positions[method + param]))
+        return param_sources
+
+    @staticmethod
+    def _set_propagating_params(
         prop_params: dict,
-        site_row_df_info: pd.Series,
-        site_type_info: pd.Series,
-        methods: list[str],
+        param_sources: list[tuple[str, str, bool, int]],
+        site_row: np.ndarray,
+        site_type_row: np.ndarray,
     ) -> None:
-        if site_type_info is not None:
-            # Updating propagating parameters with site type info
-            for param in IC.Site_Type_File_Constants.PROPAGATING_PARAMS:
-                site_type_val = site_type_info.get(param, None)
-                if site_type_val is not None:
-                    prop_params[param] = site_type_val
+        """
+        Set the propagating parameters of a site from its row of the sites file and the row of
+        its site type, with the sources from _get_propagating_param_sources.
 
-            for method in methods:
-                for param in IC.Site_Type_File_Constants.METH_SPEC_PROP_PARAMS:
-                    site_type_val = site_type_info.get(method + param, None)
-                    if site_type_val is not None:
-                        prop_params[pdc.Common_Params.METH_SPECIFIC][param][method] = site_type_val
-
-        # Updating propagating parameters with site info
-        for param in IC.Sites_File_Constants.PROPAGATING_PARAMS:
-            site_val = site_row_df_info.get(param, None)
-            if site_val is not None:
-                prop_params[param] = site_val
-
-        # Update method specific propagating params with site info
-        for method in methods:
-            for param in IC.Sites_File_Constants.METH_SPEC_PROP_PARAMS:
-                site_val = site_row_df_info.get(method + param, None)
-                if site_val is not None:
-                    prop_params[pdc.Common_Params.METH_SPECIFIC][param][method] = site_val
+        Args:
+            prop_params (dict): The propagating parameters of the site, updated in place.
+            param_sources (list[tuple[str, str, bool, int]]): The source of each parameter.
+            site_row (np.ndarray): The row of the site in the sites file.
+            site_type_row (np.ndarray): The row of the site type in the site types file.
+        """
+        for param, method, from_site, position in param_sources:
+            val = site_row[position] if from_site else site_type_row[position]
+            if val is None:
+                continue
+            if method is None:
+                prop_params[param] = val
+            else:
+                set_method_specific_param(
+                    prop_params[pdc.Common_Params.METH_SPECIFIC], param, method, val
+                )
 
     def set_pregen_emissions(self, emissions, sim_number) -> None:
         for site in self._sites:
             site.set_pregen_emissions(emissions[site.get_id()], sim_number)
 
+    def set_pregen_emission_rows(
+        self, emission_rows: np.ndarray, sim_number: int, sim_start_date: date
+    ) -> None:
+        """Give every source the queue of its emissions from the rows of the pregenerated
+        emissions of a simulation. The emissions are created as they are activated.
+
+        Args:
+            emission_rows (np.ndarray): The rows of the pregenerated emissions, as written by
+            gen_emission_rows.
+            sim_number (int): The simulation number.
+            sim_start_date (date): The simulation start date.
+        """
+        source_rows: Iterator[np.ndarray] = iter_source_rows(emission_rows)
+        for site in self._sites:
+            site.set_pregen_emission_rows(source_rows, sim_number, sim_start_date)
+
     # Generate Emissions for all infrastructure
     def generate_emissions(
         self,
@@ -155,6 +243,7 @@ class Infrastructure:
         sim_end_date,
         sim_number,
         pre_simulation_emissions: bool = True,
+        rng: np.random.Generator = None,
     ) -> dict:
         infrastructure_emissions: dict = {}
         for site in self._sites:
@@ -166,6 +255,7 @@ class Infrastructure:
                     self.emission_rate_source_dictionary,
                     self.repair_delay_dataframe,
                     pre_simulation_emissions=pre_simulation_emissions,
+                    rng=rng,
                 )
             )
         return {sim_number: infrastructure_emissions}
@@ -186,6 +276,9 @@ class Infrastructure:
 
     def update_emissions_state(self, emis_rep_info: EmisInfo) -> TsEmisData:
         emis_data = TsEmisData()
+        if self._emis_array is not None:
+            self._emis_array.update_emissions_state(emis_rep_info, emis_data)
+            return emis_data
         for site in self._sites:
             site.update_emissions_state(emis_rep_info, emis_data)
         return emis_data
@@ -220,52 +313,60 @@ class Infrastructure:
         # even if n_samples is None, the sample function is still used to shuffle
         sites_to_make = sites_in.sample(n_samples)
 
-        sites: list[Site] = []
+        site_types_in: pd.DataFrame = None
+        if sites_types_provided:
+            site_types_in = get_first_site_types(
+                infrastructure_inputs[IC.Site_Type_File_Constants.TYPE]
+            )
+            check_site_types(sites_to_make, site_types_in)
 
         for header in IC.Sites_File_Constants.OPTIONAL_SHARED_HEADERS:
             if (
                 header not in sites_to_make.columns.to_list()
                 and sites_types_provided
-                and header
-                in infrastructure_inputs[IC.Site_Type_File_Constants.TYPE].columns.to_list()
+                and header in site_types_in.columns.to_list()
             ):
-                sites_to_make[header] = sites_to_make.apply(
-                    get_equip,
-                    args=(infrastructure_inputs[IC.Site_Type_File_Constants.TYPE],),
-                    axis=1,
-                )
+                sites_to_make[header] = get_site_type_values(sites_to_make, site_types_in, header)
             elif header in sites_to_make.columns.to_list():
                 pass
             else:
                 sites_to_make[header] = 0
 
-        for sidx, srow in sites_to_make.iterrows():
-            site_type_info = None
-            if sites_types_provided:
-                site_types_info = infrastructure_inputs[IC.Site_Type_File_Constants.TYPE]
-                site_type = srow[IC.Sites_File_Constants.TYPE]
-                site_type_info = site_types_info.loc[
-                    site_types_info[IC.Site_Type_File_Constants.TYPE] == site_type
-                ].iloc[0]
-            propagating_params = self.generate_propagating_params(
-                virtual_world=virtual_world, methods=methods
-            )
-            self.update_propagating_params(
-                propagating_params,
-                site_row_df_info=srow,
-                site_type_info=site_type_info,
-                methods=methods,
+        default_params: dict = self.generate_propagating_params(
+            virtual_world=virtual_world, methods=methods
+        )
+        param_sources: list[tuple] = self._get_propagating_param_sources(
+            sites_to_make.columns.to_list(),
+            site_types_in.columns.to_list() if sites_types_provided else [],
+            methods,
+        )
+        site_columns: dict[str, int] = {
+            column: position for position, column in enumerate(sites_to_make.columns)
+        }
+        site_type_rows: dict = {}
+        if sites_types_provided:
+            site_type_rows = dict(
+                zip(site_types_in[IC.Site_Type_File_Constants.TYPE], site_types_in.to_numpy())
             )
+        start_date: date = date(*virtual_world[pdc.Virtual_World_Params.START_DATE])
+
+        sites: list[Site] = []
+        # Rows share the dtype of the whole table, as rows from iterrows do
+        for site_row in sites_to_make.to_numpy():
+            site_type = site_row[site_columns[IC.Sites_File_Constants.TYPE]]
+            site_type_row = site_type_rows.get(site_type)
+            propagating_params: dict = copy_propagating_params(default_params)
+            self._set_propagating_params(propagating_params, param_sources, site_row, site_type_row)
             new_site = Site(
-                id=srow[IC.Sites_File_Constants.ID],
-                lat=srow[IC.Sites_File_Constants.LAT],
-                long=srow[IC.Sites_File_Constants.LON],
-                equipment_groups=srow[IC.Sites_File_Constants.EQG],
+                id=site_row[site_columns[IC.Sites_File_Constants.ID]],
+                lat=site_row[site_columns[IC.Sites_File_Constants.LAT]],
+                long=site_row[site_columns[IC.Sites_File_Constants.LON]],
+                equipment_groups=site_row[site_columns[IC.Sites_File_Constants.EQG]],
                 propagating_params=propagating_params,
                 infrastructure_inputs=infrastructure_inputs,
-                start_date=date(*virtual_world[pdc.Virtual_World_Params.START_DATE]),
+                start_date=start_date,
                 methods=methods,
-                site_type=srow[IC.Sites_File_Constants.TYPE],
+                site_type=site_type,
             )
 
             sites.append(new_site)
@@ -332,14 +433,78 @@ class Infrastructure:
         lon_ave = np.mean(lon_list)
         return (lat_ave, lon_ave)
 
-    def gen_summary_emis_data(self, emis_df: pd.DataFrame, end_date: date) -> None:
-        row_index: int = 0
+    def get_daylight_cells(self, weather: WL = None) -> tuple[np.ndarray, dict[str, int]]:
+        """
+        Group the sites by the weather cell they are in, or by their location when the
+        weather has not been set up, for the daylight calculation.
+
+        Returns:
+            tuple[np.ndarray, dict[str, int]]: The (lat, lon) of each cell, and the cell
+            of each site by site ID.
+        """
+        if weather is not None:
+            # The site weather indices are in the order of the weather file
+            cell_lats: np.ndarray = np.empty(weather.lat_length)
+            cell_lats[weather.lat_sort] = weather.latitude
+            cell_lons: np.ndarray = np.empty(weather.lon_length)
+            cell_lons[weather.lon_sort] = weather.longitude
+        cells: dict[tuple, int] = {}
+        cell_lat_lons: list[tuple[float, float]] = []
+        site_cells: dict[str, int] = {}
         for site in self._sites:
-            row_index = site.gen_emis_data(emis_df, row_index, end_date)
+            cell_key: tuple = (site.get_weather_lat(), site.get_weather_long())
+            if cell_key not in cells:
+                cells[cell_key] = len(cell_lat_lons)
+                if weather is not None:
+                    cell_lat_lons.append((cell_lats[cell_key[0]], cell_lons[cell_key[1]]))
+                else:
+                    cell_lat_lons.append(tuple(float(coord) for coord in site.get_loc()))
+            site_cells[site.get_id()] = cells[cell_key]
+        return np.array(cell_lat_lons, dtype=float).reshape(-1, 2), site_cells
+
+    def get_site_bounds(self) -> tuple[float, float, float, float]:
+        """The bounding box of the site locations, as (min lat, max lat, min lon, max lon)"""
+        lats, lons = np.array([site.get_loc() for site in self._sites], dtype=float).T
+        return (lats.min(), lats.max(), lons.min(), lons.max())
 
-    def setup(self, methods: list[str]) -> None:
+    def gen_summary_emis_data(self, end_date: date) -> pd.DataFrame:
+        """Build the emissions summary of the simulation with a single DataFrame construction.
+        Values are kept as objects so that the written summary is unchanged, except for the
+        emission IDs, which are int64 until they are formatted by the program output manager.
+
+        Args:
+            end_date (date): The simulation end date.
+
+        Returns:
+            pd.DataFrame: One row per emission, in EMIS_DATA_FINAL_COL_ORDER.
+        """
+        if self._emis_array is not None:
+            self._emis_array.sync_emissions()
+        emis_records: list[dict] = []
+        for site in self._sites:
+            site.gen_emis_data(emis_records, end_date)
+        emis_data = pd.DataFrame(emis_records, columns=EMIS_DATA_FINAL_COL_ORDER, dtype=object)
+        emis_data[eca.EMIS_ID] = emis_data[eca.EMIS_ID].astype(np.int64)
+        return emis_data
+
+    def setup(self, methods: list[str], columnar_emissions: bool = False) -> None:
         for site in self._sites:
             site.setup(methods)
+        if columnar_emissions:
+            self.enable_columnar_emissions()
+
+    def enable_columnar_emissions(self) -> None:
+        """Switch the daily emissions update from the per emission objects to a
+        single columnar emission array. Intermittent emissions are not supported by the
+        emission array, if any source is intermittent the object based update is kept.
+        """
+        if any(site.has_intermittent_sources() for site in self._sites):
+            print(rm.COLUMNAR_EMIS_INTERMITTENT_WARNING)
+            return
+        self._emis_array = EmissionArray()
+        comp_order: int = 0
+        for site in self._sites:
+            comp_order = site.set_emission_array(self._emis_array, comp_order)
 
     def set_weather_index(self, weather: WL):
         for site in self._sites:
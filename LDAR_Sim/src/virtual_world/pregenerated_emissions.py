@@ -0,0 +1,280 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        pregenerated_emissions.py
+Purpose: Columnar (NumPy structured array) file format for the emissions pregenerated
+for a simulation, and the queues that create the emissions of a source from its rows.
+
+The emissions of a simulation are written as one row per emission to a .npy file, which
+the simulations open as a read-only memory mapped array. Emission objects are only created
+when a source activates them.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, timedelta
+from typing import Iterator
+
+import numpy as np
+
+from virtual_world import emission_types
+from virtual_world.emission_types.intermittency_mixin import IntermittencyMixin
+
+# The site, equipment group, component and source of an emission are numbered in the order
+# the infrastructure is traversed. Start days are counted from the simulation start date.
+# Values that are not numbers, such as a list of repair costs sampled at repair, are NaN.
+PREGEN_EMIS_DTYPE = np.dtype(
+    [
+        ("site", "i4"),
+        ("equipment_group", "i4"),
+        ("component", "i4"),
+        ("source", "i4"),
+        ("emission_id", "i8"),
+        ("start_day", "i4"),
+        ("rate", "f8"),
+        ("repair_delay", "f8"),
+        ("repair_cost", "f8"),
+        ("nrd", "i8"),
+        ("repairable", "?"),
+        ("persistent", "?"),
+        ("active_duration", "f8"),
+        ("inactive_duration", "f8"),
+    ]
+)
+
+
+def _to_column_value(val) -> float:
+    return val if isinstance(val, (int, float, np.number)) else np.nan
+
+
+def _get_emission_row(emission: emission_types.Emission, sim_start_date: date) -> tuple:
+    if isinstance(emission, emission_types.RepairableEmission):
+        repair_delay, repair_cost = emission._repair_delay, emission._repair_cost
+        nrd: int = emission._nrd
+    else:
+        repair_delay, repair_cost = None, None
+        nrd: int = emission._duration
+    intermittent: bool = isinstance(emission, IntermittencyMixin)
+    return (
+        emission._emissions_id,
+        (emission._start_date - sim_start_date).days,
+        emission._rate,
+        _to_column_value(repair_delay),
+        _to_column_value(repair_cost),
+        nrd,
+        emission._repairable,
+        not intermittent,
+        emission._active_duration if intermittent else np.nan,
+        emission._inactive_duration if intermittent else np.nan,
+    )
+
+
+def gen_emission_rows(emissions: dict, sim_start_date: date) -> np.ndarray:
+    """Rows of the emissions generated for a simulation.
+
+    Args:
+        emissions (dict): The generated emissions of the simulation, by site, equipment group,
+        component and source, as returned by Infrastructure.generate_emissions.
+        sim_start_date (date): The simulation start date.
+
+    Returns:
+        np.ndarray: One row per emission, ordered by source and emission ID.
+    """
+    rows: list[tuple] = []
+    eqg_n: int = -1
+    comp_n: int = -1
+    src_n: int = -1
+    for site_n, site_emissions in enumerate(emissions.values()):
+        for eqg_emissions in site_emissions.values():
+            eqg_n += 1
+            for comp_emissions in eqg_emissions.values():
+                comp_n += 1
+                for src_emissions in comp_emissions.values():
+                    src_n += 1
+                    # The queues hold the emissions in reverse, to be popped in order
+                    rows.extend(
+                        (site_n, eqg_n, comp_n, src_n, *_get_emission_row(emission, sim_start_date))
+                        for emission in reversed(src_emissions)
+                    )
+    return np.array(rows, dtype=PREGEN_EMIS_DTYPE)
+
+
+def iter_source_rows(emission_rows: np.ndarray) -> Iterator[np.ndarray]:
+    """The rows of each source, in the order the sources are numbered. Sources after the last
+    source with emissions get no rows.
+    """
+    sources: np.ndarray = emission_rows["source"]
+    n_sources: int = int(sources[-1]) + 1 if len(sources) else 0
+    bounds: list[int] = np.searchsorted(sources, np.arange(n_sources + 1)).tolist()
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        yield emission_rows[start:end]
+    no_rows: np.ndarray = emission_rows[:0]
+    while True:
+        yield no_rows
+
+
+class PregeneratedEmissions:
+    """Queue of the emissions pregenerated for a source, in place of the list of emission
+    objects. Each emission is created from its row when it is taken from the queue.
+    """
+
+    __slots__ = (
+        "_rows",
+        "_n_remaining",
+        "_sim_start_date",
+        "_tech_spat_cov_probs",
+        "_tech_temp_cov_probs",
+        "_repair_cost",
+    )
+
+    def __init__(
+        self,
+        rows: np.ndarray,
+        sim_start_date: date,
+        tech_spat_cov_probs: dict[str, float],
+        tech_temp_cov_probs: dict[str, float],
+        repair_cost=None,
+    ) -> None:
+        """
+        Args:
+            rows (np.ndarray): The rows of the emissions of the source.
+            sim_start_date (date): The simulation start date.
+            tech_spat_cov_probs (dict[str, float]): The spatial coverages of the source.
+            tech_temp_cov_probs (dict[str, float]): The temporal coverages of the source.
+            repair_cost (optional): The repair cost of the source, for the emissions whose
+            repair cost is not a number.
+        """
+        self._rows: np.ndarray = rows
+        self._n_remaining: int = len(rows)
+        self._sim_start_date: date = sim_start_date
+        self._tech_spat_cov_probs: dict[str, float] = tech_spat_cov_probs
+        self._tech_temp_cov_probs: dict[str, float] = tech_temp_cov_probs
+        self._repair_cost = repair_cost
+
+    def __reduce__(self):
+        args = (
+            np.asarray(self._rows),
+            self._n_remaining,
+            self._sim_start_date,
+            self._tech_spat_cov_probs,
+            self._tech_temp_cov_probs,
+            self._repair_cost,
+        )
+        return (self.__class__._reconstruct, args)
+
+    @classmethod
+    def _reconstruct(
+        cls,
+        rows,
+        n_remaining,
+        sim_start_date,
+        tech_spat_cov_probs,
+        tech_temp_cov_probs,
+        repair_cost,
+    ):
+        instance = cls.__new__(cls)
+        instance._rows = rows
+        instance._n_remaining = n_remaining
+        instance._sim_start_date = sim_start_date
+        instance._tech_spat_cov_probs = tech_spat_cov_probs
+        instance._tech_temp_cov_probs = tech_temp_cov_probs
+        instance._repair_cost = repair_cost
+        return instance
+
+    def __len__(self) -> int:
+        return self._n_remaining
+
+    def program_copy(self) -> "PregeneratedEmissions":
+        """Copy of the queue for a single program, sharing the rows"""
+        return self._reconstruct(
+            self._rows,
+            self._n_remaining,
+            self._sim_start_date,
+            self._tech_spat_cov_probs,
+            self._tech_temp_cov_probs,
+            self._repair_cost,
+        )
+
+    def pop(self) -> emission_types.Emission:
+        """Create the next emission of the source and remove it from the queue"""
+        if not self._n_remaining:
+            raise IndexError("pop from an empty emission queue")
+        row: tuple = self._rows[len(self._rows) - self._n_remaining].item()
+        self._n_remaining -= 1
+        (
+            emission_id,
+            start_day,
+            rate,
+            repair_delay,
+            repair_cost,
+            nrd,
+            repairable,
+            persistent,
+            active_duration,
+            inactive_duration,
+        ) = row[4:]
+        start_date: date = self._sim_start_date + timedelta(days=start_day)
+        if repairable:
+            if np.isnan(repair_cost):
+                repair_cost = self._repair_cost
+            if persistent:
+                return emission_types.RepairableEmission(
+                    emission_n=emission_id,
+                    rate=rate,
+                    start_date=start_date,
+                    simulation_sd=self._sim_start_date,
+                    repairable=repairable,
+                    tech_spat_cov_probs=self._tech_spat_cov_probs,
+                    tech_temp_cov_probs=self._tech_temp_cov_probs,
+                    repair_delay=repair_delay,
+                    repair_cost=repair_cost,
+                    nrd=nrd,
+                )
+            return emission_types.IntermittentRepairableEmission(
+                emission_number=emission_id,
+                emission_rate=rate,
+                start_date=start_date,
+                simulation_start_date=self._sim_start_date,
+                repairable=repairable,
+                tech_spatial_coverage_probabilities=self._tech_spat_cov_probs,
+                tech_temporal_coverage_probabilities=self._tech_temp_cov_probs,
+                repair_delay=repair_delay,
+                repair_cost=repair_cost,
+                duration=nrd,
+                active_duration=active_duration,
+                inactive_duration=inactive_duration,
+            )
+        if persistent:
+            return emission_types.NonRepairableEmission(
+                emission_n=emission_id,
+                rate=rate,
+                start_date=start_date,
+                simulation_sd=self._sim_start_date,
+                repairable=repairable,
+                tech_spat_cov_probs=self._tech_spat_cov_probs,
+                tech_temp_cov_probs=self._tech_temp_cov_probs,
+                duration=nrd,
+            )
+        return emission_types.IntermittentNonRepairableEmission(
+            emission_number=emission_id,
+            emission_rate=rate,
+            start_date=start_date,
+            simulation_start_date=self._sim_start_date,
+            repairable=repairable,
+            tech_spatial_coverage_probabilities=self._tech_spat_cov_probs,
+            tech_temporal_coverage_probabilities=self._tech_temp_cov_probs,
+            duration=nrd,
+            active_duration=active_duration,
+            inactive_duration=inactive_duration,
+        )
@@ -0,0 +1,61 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        propagating_params
+Purpose: Layers of the propagating parameters passed down from the infrastructure to the
+sites, equipment groups, components and sources.
+
+Each level of the infrastructure gets its own layer of the propagating parameters, which
+refers to the values of the level above and only replaces the values it overrides. The values
+and the method specific value dictionaries of a layer are shared with every layer below it,
+so they are never modified in place. The dictionaries that the sites, equipment groups and
+sources keep are shared the same way, and are written once by pickle.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from typing import Any
+
+from constants.param_default_const import Common_Params as cp
+
+
+def copy_propagating_params(prop_params: dict) -> dict:
+    """New layer of the propagating parameters. Parameters can be set, added or removed in the
+    layer and its method specific parameters, without changing the parameters it was made from.
+    Method specific values must be set with set_method_specific_param.
+
+    Args:
+        prop_params (dict): The propagating parameters of the level above.
+
+    Returns:
+        dict: The layer of the propagating parameters.
+    """
+    layer: dict = dict(prop_params)
+    layer[cp.METH_SPECIFIC] = dict(prop_params[cp.METH_SPECIFIC])
+    return layer
+
+
+def set_method_specific_param(
+    meth_specific_params: dict, param: str, method: str, val: Any
+) -> None:
+    """Set the value of a method specific parameter for one method, replacing the values of the
+    parameter in the layer rather than modifying the values shared with other layers.
+
+    Args:
+        meth_specific_params (dict): The method specific parameters of the layer.
+        param (str): The method specific parameter.
+        method (str): The method the value is for.
+        val (Any): The value of the parameter.
+    """
+    meth_specific_params[param] = {**meth_specific_params[param], method: val}
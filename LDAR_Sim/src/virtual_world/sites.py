@@ -18,21 +18,24 @@
 #
 # ------------------------------------------------------------------------------
 
-import copy
 from datetime import date
 import logging
 import math
-from typing import Union
+from typing import Iterator, Union
 import sys
 
+import numpy as np
 import pandas as pd
 from file_processing.output_processing.output_utils import EmisInfo, TsEmisData
 from file_processing.input_processing.emissions_source_processing import (
     EmissionsSource,
 )
+from file_processing.input_processing.infrastructure_processing import get_equipment_group_info
 from scheduling.schedule_dataclasses import TaggingInfo
 from virtual_world.emission_types.emission import Emission
 from virtual_world.equipment_groups import Equipment_Group
+from virtual_world.propagating_params import copy_propagating_params
+from virtual_world.emission_array import EmissionArray
 
 from constants.infrastructure_const import (
     Infrastructure_Constants,
@@ -43,6 +46,23 @@ import constants.param_default_const as pdc
 
 
 class Site:
+    __slots__ = (
+        "_site_ID",
+        "_lat",
+        "_long",
+        "_weather_lat",
+        "_weather_long",
+        "_site_type",
+        "_survey_frequencies",
+        "_deployment_months",
+        "_deployment_years",
+        "_deploy_method",
+        "_equipment_groups",
+        "_survey_costs",
+        "_latest_tagging_survey_date",
+        "_equipment_groups_by_id",
+    )
+
     # TODO its lat and lon not lat and long
     def __init__(
         self,
@@ -78,6 +98,7 @@ class Site:
         self._equipment_groups: list[Equipment_Group] = []
         self._survey_costs: dict[str, float] = {}
         self._create_equipment_groups(equipment_groups, infrastructure_inputs, propagating_params)
+        self._set_equipment_groups_by_id()
         self._set_survey_costs(methods=methods)
         self._latest_tagging_survey_date: date = start_date
 
@@ -123,6 +144,7 @@ class Site:
         instance._weather_lat = weather_lat
         instance._weather_long = weather_long
         instance._equipment_groups = equipment_groups
+        instance._set_equipment_groups_by_id()
         instance._survey_frequencies = survey_frequencies
         instance._deployment_months = deployment_months
         instance._deployment_years = deployment_years
@@ -132,6 +154,29 @@ class Site:
         instance._deploy_method = deploy_method
         return instance
 
+    def program_copy(self) -> "Site":
+        return self._reconstruct(
+            self._site_ID,
+            self._lat,
+            self._long,
+            self._weather_lat,
+            self._weather_long,
+            [eqg.program_copy() for eqg in self._equipment_groups],
+            self._survey_frequencies,
+            self._deployment_months,
+            self._deployment_years,
+            self._site_type,
+            self._latest_tagging_survey_date,
+            self._survey_costs,
+            self._deploy_method,
+        )
+
+    def _set_equipment_groups_by_id(self) -> None:
+        # Index the equipment groups by ID, so that tagging emissions does not scan the list
+        self._equipment_groups_by_id: dict[str, Equipment_Group] = {}
+        for eqg in self._equipment_groups:
+            self._equipment_groups_by_id.setdefault(eqg.get_id(), eqg)
+
     def _create_equipment_groups(
         self,
         equipment_groups: Union[list, str, int, float, None],
@@ -147,32 +192,13 @@ class Site:
             ]
             equipment_groups = split_eqgs
         if isinstance(equipment_groups, list) and len(equipment_groups) > 0:
-            equip_groups_in: pd.DataFrame = infrastructure_inputs[
-                Infrastructure_Constants.Virtual_World_Constants.EQG
-            ]
             equip_count = len(equipment_groups)
             for equipment_group in equipment_groups:
-                site_equipment_group = equip_groups_in.loc[
-                    equip_groups_in[
-                        Infrastructure_Constants.Equipment_Group_File_Constants.EQUIPMENT_GROUP
-                    ]
-                    == equipment_group
-                ].iloc[0]
-                prop_params = copy.deepcopy(propagating_params)
-                for (
-                    param
-                ) in Infrastructure_Constants.Sites_File_Constants.PROPAGATING_PARAMS_TO_SCALE:
-                    if prop_params[param] is not None:
-                        prop_params[param] /= equip_count
-
-                for (
-                    param
-                ) in Infrastructure_Constants.Sites_File_Constants.METH_SPEC_PROP_PARAMS_TO_SCALE:
-                    for method in prop_params[pdc.Common_Params.METH_SPECIFIC][param]:
-                        if prop_params[pdc.Common_Params.METH_SPECIFIC][param][method] is not None:
-                            prop_params[pdc.Common_Params.METH_SPECIFIC][param][
-                                method
-                            ] /= equip_count
+                site_equipment_group: pd.Series = get_equipment_group_info(
+                    infrastructure_inputs, equipment_group
+                )
+                prop_params = copy_propagating_params(propagating_params)
+                self._scale_propagating_params(prop_params, equip_count)
 
                 self._equipment_groups.append(
                     Equipment_Group(
@@ -219,7 +245,7 @@ class Site:
                 placeholder = pc.PLACEHOLDER_EQUIPMENT
             equip_count = math.ceil(prod_rate * 365 * 2)
             equip_group_info = pd.Series({placeholder: equip_count})
-            prop_params = copy.deepcopy(propagating_params)
+            prop_params = copy_propagating_params(propagating_params)
             self._equipment_groups.append(
                 Equipment_Group(
                     equipment_groups, infrastructure_inputs, prop_params, equip_group_info
@@ -262,20 +288,8 @@ class Site:
                 equip_group_info = pd.Series(
                     {placeholder: math.ceil(equip_count / equipment_groups)}
                 )
-                prop_params = copy.deepcopy(propagating_params)
-                for (
-                    param
-                ) in Infrastructure_Constants.Sites_File_Constants.PROPAGATING_PARAMS_TO_SCALE:
-                    if prop_params[param] is not None:
-                        prop_params[param] /= equipment_groups
-                for (
-                    param
-                ) in Infrastructure_Constants.Sites_File_Constants.METH_SPEC_PROP_PARAMS_TO_SCALE:
-                    for method in prop_params[pdc.Common_Params.METH_SPECIFIC][param]:
-                        if prop_params[pdc.Common_Params.METH_SPECIFIC][param][method] is not None:
-                            prop_params[pdc.Common_Params.METH_SPECIFIC][param][
-                                method
-                            ] /= equipment_groups
+                prop_params = copy_propagating_params(propagating_params)
+                self._scale_propagating_params(prop_params, equipment_groups)
 
                 self._equipment_groups.append(
                     Equipment_Group(i, infrastructure_inputs, prop_params, equip_group_info)
@@ -285,6 +299,20 @@ class Site:
             logger.error(im.BAD_EQUIPMENT_INPUT_ERROR.format(equipment_groups))
             sys.exit()
 
+    @staticmethod
+    def _scale_propagating_params(prop_params: dict, equip_count: Union[int, float]) -> None:
+        """Split the propagating parameters that are totals for the site between its
+        equipment groups"""
+        for param in Infrastructure_Constants.Sites_File_Constants.PROPAGATING_PARAMS_TO_SCALE:
+            if prop_params[param] is not None:
+                prop_params[param] /= equip_count
+        meth_specific_params: dict = prop_params[pdc.Common_Params.METH_SPECIFIC]
+        for param in Infrastructure_Constants.Sites_File_Constants.METH_SPEC_PROP_PARAMS_TO_SCALE:
+            meth_specific_params[param] = {
+                method: val / equip_count if val is not None else None
+                for method, val in meth_specific_params[param].items()
+            }
+
     def _set_survey_costs(self, methods: list[str]) -> float:
         for method in methods:
             self._survey_costs[method] = 0
@@ -313,6 +341,7 @@ class Site:
         emission_rate_source_dictionary: dict[str, EmissionsSource],
         repair_delay_dataframe: pd.DataFrame,
         pre_simulation_emissions: bool,
+        rng: np.random.Generator = None,
     ) -> dict:
         site_emissions: dict = {}
         for eqg in self._equipment_groups:
@@ -325,15 +354,18 @@ class Site:
                     emission_rate_source_dictionary,
                     repair_delay_dataframe,
                     pre_simulation_emissions=pre_simulation_emissions,
+                    rng=rng,
                 )
             )
 
         return {self._site_ID: site_emissions}
 
-    def get_detectable_emissions(self, method_name: str) -> dict[str, dict[str, list[Emission]]]:
+    def get_detectable_emissions(
+        self, method_name: str, rng: np.random.Generator = None
+    ) -> dict[str, dict[str, list[Emission]]]:
         detectable_emissions: dict[str, dict[str, Emission]] = {}
         for eqg in self._equipment_groups:
-            detectable_emissions[eqg.get_id()] = eqg.get_detectable_emissions(method_name)
+            detectable_emissions[eqg.get_id()] = eqg.get_detectable_emissions(method_name, rng=rng)
 
         return detectable_emissions
 
@@ -368,11 +400,9 @@ class Site:
     def get_latest_tagging_survey_date(self) -> date:
         return self._latest_tagging_survey_date
 
-    def gen_emis_data(self, emis_df: pd.DataFrame, row_index: int, end_date: date):
-        upd_row_index = row_index
+    def gen_emis_data(self, emis_records: list[dict], end_date: date) -> None:
         for eqg in self._equipment_groups:
-            upd_row_index = eqg.gen_emis_data(emis_df, self._site_ID, upd_row_index, end_date)
-        return upd_row_index
+            eqg.gen_emis_data(emis_records, self._site_ID, end_date)
 
     def get_survey_cost(self, method_name: str) -> float:
         return self._survey_costs[method_name]
@@ -384,17 +414,16 @@ class Site:
         for eqg in self._equipment_groups:
             eqg.set_pregen_emissions(site_emissions[eqg.get_id()], sim_number)
 
+    def set_pregen_emission_rows(
+        self, source_rows: Iterator[np.ndarray], sim_number: int, sim_start_date: date
+    ) -> None:
+        for eqg in self._equipment_groups:
+            eqg.set_pregen_emission_rows(source_rows, sim_number, sim_start_date)
+
     def tag_emissions_at_component(
         self, equipment_group: str, component: str, tagging_info: TaggingInfo
     ) -> None:
-        target_equip_group: Equipment_Group | None = next(
-            (
-                equip_group
-                for equip_group in self._equipment_groups
-                if equip_group.get_id() == equipment_group
-            ),
-            None,
-        )
+        target_equip_group: Equipment_Group = self._equipment_groups_by_id[equipment_group]
         target_equip_group.tag_emissions_at_component(component, tagging_info)
 
     def update_emissions_state(self, emis_rep_info: EmisInfo, emis_data: TsEmisData) -> None:
@@ -405,6 +434,14 @@ class Site:
         for eqg in self._equipment_groups:
             eqg.setup(methods)
 
+    def has_intermittent_sources(self) -> bool:
+        return any(eqg.has_intermittent_sources() for eqg in self._equipment_groups)
+
+    def set_emission_array(self, emis_array: EmissionArray, comp_order: int) -> int:
+        for eqg in self._equipment_groups:
+            comp_order = eqg.set_emission_array(emis_array, comp_order)
+        return comp_order
+
     def set_weather_lat(self, lat: float) -> None:
         self._weather_lat = lat
 
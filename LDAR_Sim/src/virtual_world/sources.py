@@ -22,7 +22,7 @@ from datetime import date, timedelta
 import logging
 import re
 import sys
-from typing import Literal
+from typing import Iterator, Literal
 
 import numpy as np
 import pandas as pd
@@ -36,15 +36,38 @@ from constants.infrastructure_const import (
 )
 from constants.general_const import Emission_Constants as ec
 import constants.param_default_const as pdc
+from utils.rng_registry import get_rng
+from virtual_world.pregenerated_emissions import PregeneratedEmissions
+from virtual_world.propagating_params import set_method_specific_param
 
 
 class Source:
+    __slots__ = (
+        "_source_ID",
+        "_repairable",
+        "_persistent",
+        "_active_duration",
+        "_inactive_duration",
+        "_multi_emissions",
+        "_generated_emissions",
+        "_emis_rate_source",
+        "_emis_prod_rate",
+        "_emis_duration",
+        "_meth_spat_covs",
+        "_meth_temp_covs",
+        "_emis_rep_delay",
+        "_emis_rep_cost",
+        "_prefix",
+        "_next_emission",
+    )
 
     def __init__(self, id: str, info, prop_params) -> None:
         self._source_ID: str = id
         self._set_source_only_properties(info=info)
         self._multi_emissions: bool = None
-        self._generated_emissions: dict[int, list[emission_types.Emission]] = {}
+        self._generated_emissions: dict[
+            int, list[emission_types.Emission] | PregeneratedEmissions
+        ] = {}
         self._emis_rate_source: EmissionsSource = None
         self._emis_prod_rate: float = None
         self._emis_duration: int = None
@@ -74,6 +97,7 @@ class Source:
             self._emis_rep_cost,
             self._next_emission,
             self._prefix,
+            self._meth_temp_covs,
         )
         return (self.__class__._reconstruct, args)
 
@@ -95,6 +119,7 @@ class Source:
         emis_rep_cost,
         next_emission,
         prefix,
+        meth_temp_covs=None,
     ):
         # Create a new instance without invoking __init__
         instance = cls.__new__(cls)
@@ -114,6 +139,7 @@ class Source:
         instance._emis_rep_cost = emis_rep_cost
         instance._next_emission = next_emission
         instance._prefix = prefix
+        instance._meth_temp_covs = meth_temp_covs
         return instance
 
     def _set_source_only_properties(self, info) -> None:
@@ -140,7 +166,7 @@ class Source:
             for method in meth_specific_params[param].keys():
                 src_val = info.get(method + param, None)
                 if src_val is not None:
-                    meth_specific_params[param][method] = src_val
+                    set_method_specific_param(meth_specific_params, param, method, src_val)
 
         prop_params_keys = list(prop_params.keys())
         for param in prop_params_keys:
@@ -192,20 +218,35 @@ class Source:
                 pdc.Common_Params.VAL
             ]
 
-    def _get_rate(self, emission_rate_source_dictionary: dict[str, EmissionsSource]):
-        return emission_rate_source_dictionary[self._emis_rate_source].get_a_rate()
+    def _get_rates(
+        self,
+        emission_rate_source_dictionary: dict[str, EmissionsSource],
+        n_emissions: int,
+        rng: np.random.Generator = None,
+    ) -> list[float]:
+        return (
+            emission_rate_source_dictionary[self._emis_rate_source]
+            .get_rates(n_emissions, rng=rng)
+            .tolist()
+        )
 
     def _get_repairable(self):
         return self._repairable
 
-    def _get_rep_delay(self, repair_delay_dataframe: pd.DataFrame):
+    def _get_rep_delays(
+        self,
+        repair_delay_dataframe: pd.DataFrame,
+        n_emissions: int,
+        rng: np.random.Generator = None,
+    ) -> list:
         if isinstance(self._emis_rep_delay, int):
-            return self._emis_rep_delay
+            return [self._emis_rep_delay] * n_emissions
         elif isinstance(self._emis_rep_delay, list):
-            return np.random.choice(self._emis_rep_delay)
+            return get_rng(rng).choice(self._emis_rep_delay, size=n_emissions).tolist()
         elif isinstance(self._emis_rep_delay, str):
             if self._emis_rep_delay in repair_delay_dataframe:
-                return np.random.choice(repair_delay_dataframe[self._emis_rep_delay])
+                rep_delays: np.ndarray = repair_delay_dataframe[self._emis_rep_delay].to_numpy()
+                return get_rng(rng).choice(rep_delays, size=n_emissions).tolist()
             else:
                 logger: logging.Logger = logging.getLogger(__name__)
                 logger.error(im.INVALID_REPAIR_DELAY_COL_MSG.format(key=self._emis_rep_delay))
@@ -218,6 +259,12 @@ class Source:
     def _get_rep_cost(self):
         return self._emis_rep_cost
 
+    def _get_rep_costs(self, n_emissions: int, rng: np.random.Generator = None) -> list:
+        # Without a dedicated stream, a list of costs is sampled when each emission is repaired
+        if rng is None or not isinstance(self._emis_rep_cost, list):
+            return [self._get_rep_cost()] * n_emissions
+        return rng.choice(self._emis_rep_cost, size=n_emissions).tolist()
+
     def _get_emis_duration(self):
         return self._emis_duration
 
@@ -226,34 +273,37 @@ class Source:
         leak_count,
         start_date,
         sim_start_date,
-        emission_rate_source_dictionary: dict[str, EmissionsSource],
-        repair_delay_dataframe: pd.DataFrame,
+        rate: float,
+        repair_delay: int = None,
+        repair_cost=None,
     ) -> emission_types.Emission:
+        if repair_cost is None:
+            repair_cost = self._get_rep_cost()
         if self._repairable:
             if self._persistent:
                 return emission_types.RepairableEmission(
                     emission_n=leak_count,
-                    rate=self._get_rate(emission_rate_source_dictionary),
+                    rate=rate,
                     start_date=start_date,
                     simulation_sd=sim_start_date,
                     repairable=self._get_repairable(),
                     tech_spat_cov_probs=self._meth_spat_covs,
                     tech_temp_cov_probs=self._meth_temp_covs,
-                    repair_delay=self._get_rep_delay(repair_delay_dataframe),
-                    repair_cost=self._get_rep_cost(),
+                    repair_delay=repair_delay,
+                    repair_cost=repair_cost,
                     nrd=self._get_emis_duration(),
                 )
             else:
                 return emission_types.IntermittentRepairableEmission(
                     emission_number=leak_count,
-                    emission_rate=self._get_rate(emission_rate_source_dictionary),
+                    emission_rate=rate,
                     start_date=start_date,
                     simulation_start_date=sim_start_date,
                     repairable=self._get_repairable(),
                     tech_spatial_coverage_probabilities=self._meth_spat_covs,
                     tech_temporal_coverage_probabilities=self._meth_temp_covs,
-                    repair_delay=self._get_rep_delay(repair_delay_dataframe),
-                    repair_cost=self._get_rep_cost(),
+                    repair_delay=repair_delay,
+                    repair_cost=repair_cost,
                     duration=self._get_emis_duration(),
                     active_duration=self._active_duration,
                     inactive_duration=self._inactive_duration,
@@ -262,7 +312,7 @@ class Source:
             if self._persistent:
                 return emission_types.NonRepairableEmission(
                     emission_n=leak_count,
-                    rate=self._get_rate(emission_rate_source_dictionary),
+                    rate=rate,
                     start_date=start_date,
                     simulation_sd=sim_start_date,
                     repairable=self._get_repairable(),
@@ -273,7 +323,7 @@ class Source:
             else:
                 return emission_types.IntermittentNonRepairableEmission(
                     emission_number=leak_count,
-                    emission_rate=self._get_rate(emission_rate_source_dictionary),
+                    emission_rate=rate,
                     start_date=start_date,
                     simulation_start_date=sim_start_date,
                     repairable=self._get_repairable(),
@@ -292,12 +342,11 @@ class Source:
         emission_rate_source_dictionary: dict[str, EmissionsSource],
         repair_delay_dataframe: pd.DataFrame,
         pre_simulation_emissions: bool,
+        rng: np.random.Generator = None,
     ) -> dict[str, list[emission_types.Emission]]:
-        # Using a list as a FIFO queue for less overhead and to be able to pickle it
-        emissions_fifo: list[emission_types.Emission] = []
-
-        # Initialize a counter to give all emissions for the source a unique "ID"
-        leak_count: int = 0
+        random_source = get_rng(rng)
+        # Start dates of the emissions, in the order the emissions are numbered
+        emission_start_dates: list[date] = []
 
         last_emis_day: date = sim_start_date
 
@@ -310,7 +359,7 @@ class Source:
             )
 
             # Vectorize random number generation
-            pre_existing_emissions = np.random.binomial(
+            pre_existing_emissions = random_source.binomial(
                 1, self._emis_prod_rate, self._emis_duration
             )
 
@@ -329,15 +378,7 @@ class Source:
 
             for day in filtered_emission_dates:
                 emis_start_date: date = day.date()
-                emission: emission_types.Emission = self._create_emission(
-                    leak_count=leak_count,
-                    start_date=emis_start_date,
-                    sim_start_date=sim_start_date,
-                    emission_rate_source_dictionary=emission_rate_source_dictionary,
-                    repair_delay_dataframe=repair_delay_dataframe,
-                )
-                leak_count += 1
-                emissions_fifo.append(emission)
+                emission_start_dates.append(emis_start_date)
                 if not self._multi_emissions:
                     last_emis_day = emis_start_date + timedelta(days=self._emis_duration)
                     # If only one emission is allowed, break the loop
@@ -349,7 +390,7 @@ class Source:
         # Precalculate date
         simulation_dates = pd.date_range(start=sim_start_date, periods=sim_dur, freq="D")
         # Vectorize random number generation
-        simulation_emissions = np.random.binomial(1, self._emis_prod_rate, sim_dur)
+        simulation_emissions = random_source.binomial(1, self._emis_prod_rate, sim_dur)
 
         # Filter dates where emissions should be created
         emission_dates = simulation_dates[simulation_emissions == 1]
@@ -360,19 +401,39 @@ class Source:
             if not self._multi_emissions and emis_start_date <= last_emis_day:
                 continue
 
-            emission: emission_types.Emission = self._create_emission(
-                leak_count=leak_count,
-                start_date=emis_start_date,
-                sim_start_date=sim_start_date,
-                emission_rate_source_dictionary=emission_rate_source_dictionary,
-                repair_delay_dataframe=repair_delay_dataframe,
-            )
-            leak_count += 1
-            emissions_fifo.append(emission)
+            emission_start_dates.append(emis_start_date)
             if not self._multi_emissions:
                 # if only a single emission can be made,
                 # update the last_emis_day based on the new emission
                 last_emis_day = emis_start_date + timedelta(days=self._emis_duration)
+
+        # Draw the rates, repair delays and repair costs of all emissions of the source
+        # in batched calls
+        n_emissions: int = len(emission_start_dates)
+        rates: list[float] = []
+        rep_delays: list = [None] * n_emissions
+        rep_costs: list = [None] * n_emissions
+        if n_emissions > 0:
+            rates = self._get_rates(emission_rate_source_dictionary, n_emissions, rng=rng)
+            if self._repairable:
+                rep_delays = self._get_rep_delays(repair_delay_dataframe, n_emissions, rng=rng)
+                rep_costs = self._get_rep_costs(n_emissions, rng=rng)
+
+        # Using a list as a FIFO queue for less overhead and to be able to pickle it
+        # The counter gives all emissions for the source a unique "ID"
+        emissions_fifo: list[emission_types.Emission] = [
+            self._create_emission(
+                leak_count=leak_count,
+                start_date=emis_start_date,
+                sim_start_date=sim_start_date,
+                rate=rate,
+                repair_delay=rep_delay,
+                repair_cost=rep_cost,
+            )
+            for leak_count, (emis_start_date, rate, rep_delay, rep_cost) in enumerate(
+                zip(emission_start_dates, rates, rep_delays, rep_costs)
+            )
+        ]
         emissions_fifo.reverse()
         self._generated_emissions[sim_number] = emissions_fifo
         return {self._source_ID: emissions_fifo}
@@ -390,7 +451,9 @@ class Source:
             list[Emission]: The list of emissions that are newly active on the current date
         """
         newly_activated_emissions: list[emission_types.Emission] = []
-        sim_emissions: list[emission_types.Emission] = self._generated_emissions[sim_number]
+        sim_emissions: list[emission_types.Emission] | PregeneratedEmissions = (
+            self._generated_emissions[sim_number]
+        )
 
         if self._next_emission is None and sim_emissions:
             focus_emission: emission_types.Emission = sim_emissions.pop()
@@ -408,9 +471,51 @@ class Source:
 
         return newly_activated_emissions
 
+    def program_copy(self) -> "Source":
+        """Copy of the source for a single program. The source properties are shared, the
+        queues of emissions still to be activated hold copies of the emissions.
+        """
+        return self._reconstruct(
+            self._source_ID,
+            self._repairable,
+            self._persistent,
+            self._active_duration,
+            self._inactive_duration,
+            self._multi_emissions,
+            {
+                sim_number: (
+                    emissions.program_copy()
+                    if isinstance(emissions, PregeneratedEmissions)
+                    else [emission.program_copy() for emission in emissions]
+                )
+                for sim_number, emissions in self._generated_emissions.items()
+            },
+            self._emis_rate_source,
+            self._emis_prod_rate,
+            self._emis_duration,
+            self._meth_spat_covs,
+            self._emis_rep_delay,
+            self._emis_rep_cost,
+            self._next_emission.program_copy() if self._next_emission is not None else None,
+            self._prefix,
+            self._meth_temp_covs,
+        )
+
     def set_pregen_emissions(self, src_emissions, sim_number) -> None:
         self._generated_emissions.clear()
         self._generated_emissions[sim_number] = src_emissions
 
+    def set_pregen_emission_rows(
+        self, source_rows: Iterator[np.ndarray], sim_number: int, sim_start_date: date
+    ) -> None:
+        self._generated_emissions.clear()
+        self._generated_emissions[sim_number] = PregeneratedEmissions(
+            next(source_rows),
+            sim_start_date,
+            self._meth_spat_covs,
+            self._meth_temp_covs,
+            self._emis_rep_cost,
+        )
+
     def get_id(self) -> str:
         return self._source_ID
@@ -18,155 +18,124 @@
 #
 # ------------------------------------------------------------------------------
 
-from datetime import date, timedelta, datetime
-import ephem
-
-
-# Calculate the study area average daylight for each day of the simulation
-class DaylightCalculatorAve:
-    def __init__(self, site_lat_lon: tuple, start_date: date, end_date: date):
-        # Get average lat and lon values for the sites in your study area
-
-        lat_ave = site_lat_lon[0]
-        lon_ave = site_lat_lon[1]
-
-        curr_date = start_date
-
-        # Create an empty list to store the daylight hours - rounding down.
-        self.daylight_hours = {}
-        while curr_date <= end_date:
-            # Create ephem object
-            obs = ephem.Observer()
-            # Turn off PyEphem’s native mechanism for computing atmospheric refraction
-            # near the horizon
-            obs.pressure = 0
-            obs.horizon = "-6"  # -6 = civil twilight, -12 = nautical, -18 = astronomical
-            # Set the time
-            obs.date = datetime.combine(curr_date, datetime.min.time())
-            # set the latitude and longitude for object
-            obs.lat = str(lat_ave)
-            obs.lon = str(lon_ave)
-
-            # get the sunset and sunrise UTC time
-            sunrise = obs.previous_rising(ephem.Sun(), use_center=True).datetime()
-            sunset = obs.next_setting(ephem.Sun(), use_center=True).datetime()
-            dif_hours = (sunset - sunrise).total_seconds() / 3600
-            self.daylight_hours[curr_date] = dif_hours
-            curr_date += timedelta(days=1)
-        return
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+from constants.file_name_constants import Generator_Files
+from utils.generic_functions import hash_dict, save_array_atomic
+
+
+# Calculate the daylight for each cell holding sites, for each day of the simulation
+class DaylightCalculatorAll:
+    # Civil twilight
+    HORIZON_DEGREES = -6.0
+
+    def __init__(
+        self,
+        cell_lat_lons: np.ndarray,
+        site_cells: dict[str, int],
+        start_date: date,
+        end_date: date,
+        cache_dir: Path = None,
+    ):
+        """
+        Calculates the daylight hours of every cell for every day of the simulation up front,
+        with the NOAA solar position equations, so each lookup is a single array index.
+        The table is saved in the cache directory, keyed by the cells and dates.
+
+        Args:
+            cell_lat_lons (np.ndarray): The (lat, lon) of each cell, of shape (cells, 2).
+            site_cells (dict[str, int]): The cell of each site, by site ID.
+            start_date (date): The first day of the simulation.
+            end_date (date): The last day of the simulation.
+            cache_dir (Path): The directory the daylight table is saved in.
+        """
+        self._start_date: date = start_date
+        self._site_cells: dict[str, int] = site_cells
+        n_days: int = (end_date - start_date).days + 1
+        cell_lat_lons = np.asarray(cell_lat_lons, dtype=float).reshape(-1, 2)
+
+        cache_file: Path = None
+        if cache_dir is not None:
+            key: str = hash_dict(
+                {
+                    "cells": cell_lat_lons.tolist(),
+                    "start_date": start_date.isoformat(),
+                    "n_days": n_days,
+                    "horizon": self.HORIZON_DEGREES,
+                }
+            )
+            cache_file = cache_dir / Generator_Files.DAYLIGHT_FILE.format(key=key)
+        if cache_file is not None and cache_file.is_file():
+            self.daylight_hours: np.ndarray = np.load(cache_file)
+        else:
+            self.daylight_hours: np.ndarray = calc_daylight_hours(
+                cell_lat_lons[:, 0], cell_lat_lons[:, 1], start_date, n_days, self.HORIZON_DEGREES
+            )
+            if cache_file is not None:
+                save_array_atomic(cache_file, self.daylight_hours)
 
     def __reduce__(self):
-        args = (self.daylight_hours,)
+        args = (self.daylight_hours, self._site_cells, self._start_date)
         return (self.__class__._reconstruct, args)
 
     @classmethod
-    def _reconstruct(cls, daylight_hours):
+    def _reconstruct(cls, daylight_hours, site_cells, start_date):
         # Create a new instance without invoking __init__
         instance = cls.__new__(cls)
         instance.daylight_hours = daylight_hours
+        instance._site_cells = site_cells
+        instance._start_date = start_date
         return instance
 
-    def get_daylight(self, curr_date: date):
-        daylight = self.daylight_hours[curr_date]
-        return daylight
-
-
-# -----------------------------------------------------------------------------#
-# # TODO: Update and add in the functionality later to allow for more granular daylight calc
-# class DaylightCalculatorAll:
-#     def __init__(self, latitude, longitude, date):
-#         self.time = date
-#         self.lat = latitude
-#         self.lon = longitude
-
-#         # create an empty array to store the daylight hours
-#         self.sunrise = np.empty(
-#             (len(self.time), len(self.lat), len(self.lon)), dtype=np.float
-#         )
-#         self.sunset = np.empty(
-#             (len(self.time), len(self.lat), len(self.lon)), dtype=np.float
-#         )
-
-#         for i in range(len(self.time)):
-#             # Create ephem object
-#             obs = ephem.Observer()
-#             # turn off PyEphem’s native mechanism for computing atmospheric refraction
-#             # near the horizon
-#             obs.pressure = 0
-#             obs.horizon = "-6"  # -6=civil twilight, -12=nautical, -18=astronomical
-#             # set the time
-#             obs.date = self.time[i]
-#             # set the latitude and longitude for object
-#             for j in range(len(self.lat)):
-#                 obs.lat = str(self.lat[j])
-#                 for k in range(len(self.lon)):
-#                     obs.lon = str(self.lon[k])
-
-#                     # get the sunset and sunrise UTC time
-#                     sunrise = obs.previous_rising(
-#                         ephem.Sun(), use_center=True
-#                     ).datetime()
-#                     sunset = obs.next_setting(ephem.Sun(), use_center=True).datetime()
-
-#                     # convert to local time
-#                     sr = (sunrise.hour - 7) + (sunrise.minute / 100)
-#                     ss = (sunset.hour + 17) + (sunset.minute / 100)
-
-#                     self.sunrise[i, j, k] = sr
-#                     self.sunset[i, j, k] = ss
-
-#     def get_sunrise(self, day, lat, lon):
-#         # find latitude index
-#         tar_la = lat
-#         lat_index = 0
-#         i = 1
-#         while i < len(self.lat):
-#             if self.lat[i - 1] > tar_la >= self.lat[i]:
-#                 lat_index = i
-#             i = i + 1
-#         self.tar_lo = lon
-#         # find longitude index
-#         lon_index = 0
-#         j = 1
-#         while j < len(self.lon):
-#             if self.lon[j - 1] > tar_la >= self.lon[j]:
-#                 lon_index = j
-#             j = j + 1
-
-#             # find time index
-#         k = 0
-#         for d in np.arange(len(self.time)):
-#             if d == day:
-#                 d_index = k
-#             k = k + 1
-
-#         self.sr = self.sunrise[d_index, lat_index, lon_index]
-#         return self.sr
-
-#     def get_sunset(self, day, lat, lon):
-#         # find latitude index
-#         tar_la = lat
-#         lat_index = 0
-#         i = 1
-#         while i < len(self.lat):
-#             if self.lat[i - 1] > tar_la >= self.lat[i]:
-#                 lat_index = i
-#             i = i + 1
-#         self.tar_lo = lon
-#         # find longitude index
-#         lon_index = 0
-#         j = 1
-#         while j < len(self.lon):
-#             if self.lon[j - 1] > tar_la >= self.lon[j]:
-#                 lon_index = j
-#             j = j + 1
-
-#             # find time index
-#         k = 0
-#         for d in np.arange(len(self.time)):
-#             if day == d + 1:
-#                 d_index = k
-#             k = k + 1
-
-#         self.ss = self.sunset[d_index, lat_index, lon_index]
-#         return self.ss
+    def get_daylight(self, curr_date: date, site=None) -> float:
+        """The daylight hours at the site on the given day,
+        or the average over all cells when no site is given"""
+        day: int = (curr_date - self._start_date).days
+        if site is None:
+            return float(self.daylight_hours[day].mean())
+        return float(self.daylight_hours[day, self._site_cells[site.get_id()]])
+
+
+def calc_daylight_hours(
+    lats: np.ndarray, lons: np.ndarray, start_date: date, n_days: int, horizon: float
+) -> np.ndarray:
+    """
+    Calculate the hours between the sun rising above and setting below the horizon angle,
+    for each of n_days days from the start date, at each location. Uses the NOAA solar
+    position equations (Meeus) for the declination of the sun at local solar noon.
+
+    Returns:
+        np.ndarray: The daylight hours, of shape (n_days, locations).
+    """
+    lats = np.radians(np.asarray(lats, dtype=float))
+    lons = np.asarray(lons, dtype=float)
+    # Julian day of local solar noon of each day, at each location
+    start_jd: float = start_date.toordinal() + 1721424.5
+    julian_days: np.ndarray = (
+        start_jd + np.arange(n_days)[:, np.newaxis] + 0.5 - lons[np.newaxis, :] / 360.0
+    )
+    t: np.ndarray = (julian_days - 2451545.0) / 36525.0  # Julian centuries since J2000
+
+    mean_long: np.ndarray = np.mod(280.46646 + t * (36000.76983 + t * 0.0003032), 360.0)
+    mean_anom: np.ndarray = np.radians(357.52911 + t * (35999.05029 - 0.0001537 * t))
+    center: np.ndarray = (
+        np.sin(mean_anom) * (1.914602 - t * (0.004817 + 0.000014 * t))
+        + np.sin(2 * mean_anom) * (0.019993 - 0.000101 * t)
+        + np.sin(3 * mean_anom) * 0.000289
+    )
+    omega: np.ndarray = np.radians(125.04 - 1934.136 * t)
+    apparent_long: np.ndarray = np.radians(mean_long + center - 0.00569 - 0.00478 * np.sin(omega))
+    mean_obliq: np.ndarray = (
+        23.0 + (26.0 + (21.448 - t * (46.815 + t * (0.00059 - t * 0.001813))) / 60.0) / 60.0
+    )
+    obliq: np.ndarray = np.radians(mean_obliq + 0.00256 * np.cos(omega))
+    declination: np.ndarray = np.arcsin(np.sin(obliq) * np.sin(apparent_long))
+
+    # Hour angle at which the sun crosses the horizon angle, clipped for polar day and night
+    cos_hour_angle: np.ndarray = (
+        np.sin(np.radians(horizon)) - np.sin(lats) * np.sin(declination)
+    ) / (np.cos(lats) * np.cos(declination))
+    hour_angle: np.ndarray = np.degrees(np.arccos(np.clip(cos_hour_angle, -1.0, 1.0)))
+    return 2.0 * hour_angle / 15.0
@@ -1,7 +1,7 @@
 # ------------------------------------------------------------------------------
 # Program:     The LDAR Simulator (LDAR-Sim)
 # File:        Weather lookup
-# Purpose:     Calculate deployment days for a method
+# Purpose:     Look up the weather, and calculate deployment days for a method
 #
 #
 # This program is free software: you can redistribute it and/or modify
@@ -18,14 +18,50 @@
 #
 # ------------------------------------------------------------------------------
 
+import logging
+import sys
+from datetime import date
+from pathlib import Path
+
 import numpy as np
-from netCDF4 import Dataset
+import constants.param_default_const as pdc
+from constants.error_messages import Runtime_Error_Messages as rem
+from constants.file_name_constants import Generator_Files
+from constants.general_const import Weather_Time_Policies
+from netCDF4 import Dataset, num2date
+from utils.generic_functions import find_closest_index_numpy, hash_dict, save_array_atomic
+
+# Gridded weather arrays that can be shared with worker processes through memory mapped files
+SHARED_WEATHER_ARRAYS = ("temps", "u_wind", "v_wind", "winds", "precip")
+
+WEATHER_TIME_POLICIES = (
+    Weather_Time_Policies.CYCLE,
+    Weather_Time_Policies.CLAMP,
+    Weather_Time_Policies.ERROR,
+)
 
 
 class WeatherLookup:
-    def __init__(self, virtual_world, input_directory):
+    def __init__(
+        self,
+        virtual_world,
+        input_directory,
+        cache_dir: Path = None,
+        site_bounds: tuple[float, float, float, float] = None,
+        date_range: tuple[date, date] = None,
+    ):
         """
         Read in NetCDF files and returns the environment at a given place in time.
+        Deployment day masks are saved in the cache directory when one is given.
+
+        Only the window of the weather file covering the site bounds
+        (min lat, max lat, min lon, max lon), padded by one grid cell, and the date range
+        (start date, end date) is read in. The offsets of the window in the file are kept.
+
+        When the time coordinate of the weather file has units, simulation dates are matched
+        to the dates of the file, and dates outside of the file are handled according to
+        the weather_out_of_range policy. Otherwise, the file is assumed to start on
+        January 1st and dates are matched by their day of the year.
         """
         # Initialize attributes to store weather data
         self.temps = None
@@ -39,29 +75,74 @@ class WeatherLookup:
         self.time_length = None
         self.lat_length = None
         self.lon_length = None
+        self.time_hours = None
+        self.days = None
+        self.time_offset = 0
+        self.lat_offset = 0
+        self.lon_offset = 0
+        self.out_of_range_policy = virtual_world.get(
+            pdc.Virtual_World_Params.WEATHER_OUT_OF_RANGE, Weather_Time_Policies.CYCLE
+        )
+        self.shared_dir = None
+        self.cache_dir = cache_dir
+        self.weather_file_key = None
+        self._deployment_days: dict[str, np.ndarray] = {}
+
+        if self.out_of_range_policy not in WEATHER_TIME_POLICIES:
+            logger = logging.getLogger(__name__)
+            logger.error(
+                rem.INVALID_WEATHER_OUT_OF_RANGE_ERROR.format(
+                    policy=self.out_of_range_policy, policies=", ".join(WEATHER_TIME_POLICIES)
+                )
+            )
+            sys.exit()
 
         # Load weather data
-        self.load_weather_data(virtual_world, input_directory)
+        self.load_weather_data(virtual_world, input_directory, site_bounds, date_range)
+        if cache_dir is not None:
+            self.weather_file_key = self._gen_weather_file_key(
+                input_directory / virtual_world["weather_file"]
+            )
 
-    def load_weather_data(self, virtual_world, in_dir):
+    def load_weather_data(self, virtual_world, in_dir, site_bounds=None, date_range=None):
         # Read in weather data as NetCDF file(s)
         with Dataset(in_dir / virtual_world["weather_file"], "r") as weather_data:
+            latitude = weather_data.variables["latitude"][:]
+            longitude = weather_data.variables["longitude"][:]
+            time_hours = self._read_time_hours(weather_data.variables["time"])
+
+            # Only read in the window of the file covering the sites and simulated dates
+            lat_end, lon_end = len(latitude), len(longitude)
+            if site_bounds is not None:
+                min_lat, max_lat, min_lon, max_lon = site_bounds
+                self.lat_offset, lat_end = _grid_window(latitude, min_lat, max_lat)
+                self.lon_offset, lon_end = _grid_window(longitude, min_lon, max_lon)
+            self.time_offset, time_end = _time_window(time_hours, date_range)
+            window = (
+                slice(self.time_offset, time_end),
+                slice(self.lat_offset, lat_end),
+                slice(self.lon_offset, lon_end),
+            )
+
             # Extract temperatures
-            self.temps = np.array(weather_data.variables["t2m"]) - 273.15
+            self.temps = np.array(weather_data.variables["t2m"][window]) - 273.15
             # Extract u wind component
-            self.u_wind = np.array(weather_data.variables["u10"])
+            self.u_wind = np.array(weather_data.variables["u10"][window])
             # Extract v wind component
-            self.v_wind = np.array(weather_data.variables["v10"])
+            self.v_wind = np.array(weather_data.variables["v10"][window])
             # Calculate the net wind speed
             self.winds = np.sqrt(np.square(self.u_wind) + np.square(self.v_wind))
             # Extract precipitation values and convert to mm
-            self.precip = np.array(weather_data.variables["tp"]) * 1000
+            self.precip = np.array(weather_data.variables["tp"][window]) * 1000
             # Extract time values
-            self.time_total = weather_data.variables["time"][:]
+            self.time_total = weather_data.variables["time"][window[0]]
+            if time_hours is not None:
+                self.time_hours = time_hours[window[0]]
+                self.days = np.unique(self.time_hours.astype("datetime64[D]"))
             # Extract latitude values
-            self.latitude = weather_data.variables["latitude"][:]
+            self.latitude = latitude[window[1]]
             # Extract longitude values
-            self.longitude = weather_data.variables["longitude"][:]
+            self.longitude = longitude[window[2]]
 
             self.lat_sort = np.argsort(self.latitude, kind="mergesort")
             self.lon_sort = np.argsort(self.longitude, kind="mergesort")
@@ -76,19 +157,70 @@ class WeatherLookup:
             # Length of longitude dimension - n cells
             self.lon_length = len(self.longitude)
 
+    def _gen_weather_file_key(self, weather_file: Path) -> str:
+        """Key of the weather file for the deployment day cache, made from the file's metadata
+        and time axis rather than its contents, so that large weather files are not read in full.
+        """
+        file_stats = weather_file.stat()
+        return hash_dict(
+            {
+                "file": weather_file.name,
+                "size": file_stats.st_size,
+                "mtime": file_stats.st_mtime_ns,
+                "time": np.asarray(self.time_total, dtype=float).tolist(),
+            }
+        )
+
+    @staticmethod
+    def _read_time_hours(time_variable) -> np.ndarray:
+        """Convert the time coordinate to hourly datetimes, or None if it has no units"""
+        if "units" not in time_variable.ncattrs():
+            return None
+        time_dates = num2date(
+            time_variable[:],
+            time_variable.units,
+            calendar=getattr(time_variable, "calendar", "standard"),
+            only_use_cftime_datetimes=False,
+            only_use_python_datetimes=True,
+        )
+        return np.array(time_dates, dtype="datetime64[h]")
+
+    def share_arrays(self, directory: Path) -> None:
+        """Write the gridded weather arrays to .npy files in the given directory and replace
+        them with read-only memory mapped views. Once shared, pickling the lookup only sends the
+        directory, and every process that unpickles it maps the same files instead of receiving
+        a copy of the arrays.
+
+        Args:
+            directory (Path): The directory in which to write the weather arrays.
+        """
+        for name in SHARED_WEATHER_ARRAYS:
+            array_file = directory / Generator_Files.WEATHER_ARRAY_FILE.format(name=name)
+            np.save(array_file, getattr(self, name))
+            setattr(self, name, np.load(array_file, mmap_mode="r"))
+        self.shared_dir = directory
+
     def __reduce__(self):
+        shared: bool = self.shared_dir is not None
         args = (
-            self.temps,
-            self.u_wind,
-            self.v_wind,
-            self.winds,
-            self.precip,
+            None if shared else self.temps,
+            None if shared else self.u_wind,
+            None if shared else self.v_wind,
+            None if shared else self.winds,
+            None if shared else self.precip,
             self.time_total,
             self.latitude,
             self.longitude,
             self.time_length,
             self.lat_length,
             self.lon_length,
+            self.shared_dir,
+            self.cache_dir,
+            self.weather_file_key,
+            self.time_hours,
+            self.days,
+            self.out_of_range_policy,
+            (self.time_offset, self.lat_offset, self.lon_offset),
         )
         return (self.__class__._reconstruct, args)
 
@@ -106,6 +238,13 @@ class WeatherLookup:
         time_length,
         lat_length,
         lon_length,
+        shared_dir=None,
+        cache_dir=None,
+        weather_file_key=None,
+        time_hours=None,
+        days=None,
+        out_of_range_policy=Weather_Time_Policies.CYCLE,
+        offsets=(0, 0, 0),
     ):
         # Create a new instance without invoking __init__
         instance = cls.__new__(cls)
@@ -120,50 +259,184 @@ class WeatherLookup:
         instance.time_length = time_length
         instance.lat_length = lat_length
         instance.lon_length = lon_length
+        instance.shared_dir = shared_dir
+        instance.cache_dir = cache_dir
+        instance.weather_file_key = weather_file_key
+        instance.time_hours = time_hours
+        instance.days = days
+        instance.out_of_range_policy = out_of_range_policy
+        instance.time_offset, instance.lat_offset, instance.lon_offset = offsets
+        instance._deployment_days = {}
+        if shared_dir is not None:
+            for name in SHARED_WEATHER_ARRAYS:
+                array_file = shared_dir / Generator_Files.WEATHER_ARRAY_FILE.format(name=name)
+                setattr(instance, name, np.load(array_file, mmap_mode="r"))
         return instance
 
-    def deployment_days(
-        self, method_name, config, start_date, start_work_hour=0, consider_weather=False
-    ):
+    def deployment_days(self, weather_envs: dict, hour: int = 8) -> np.ndarray:
         """
         Generate a 3D space-time matrix of all days on which weather
-        conditions are suitable for a given method to conduct LDAR.
-        Should only be called once/method during initialization.
-        DD = deployment day
+        conditions are suitable for a method to conduct LDAR.
+        Each day is judged on the weather at the given hour of the day.
+
+        Masks are kept for the lifetime of the lookup, and saved in the cache directory
+        under a key made from the weather file's metadata, the window of the file read in
+        and the weather envelopes, so later runs
+        with the same weather and envelopes load them instead of recomputing them.
+
+        Args:
+            weather_envs (dict): The method's temperature, wind and precipitation envelopes.
+            hour (int): The hour of the day at which the weather is checked.
+
+        Returns:
+            np.ndarray: Boolean array of shape (days, lat, lon), with a row for each day
+            of the weather file, as indexed by day_index. True where all of temperature,
+            wind and precipitation fall within the method's envelopes.
+        """
+        key: str = hash_dict(
+            {
+                "weather_file": self.weather_file_key,
+                "window": [
+                    self.time_offset,
+                    self.time_length,
+                    self.lat_offset,
+                    self.lat_length,
+                    self.lon_offset,
+                    self.lon_length,
+                ],
+                "weather_envelopes": weather_envs,
+                "hour": hour,
+            }
+        )
+        if key in self._deployment_days:
+            return self._deployment_days[key]
+
+        cache_file: Path = None
+        if self.cache_dir is not None and self.weather_file_key is not None:
+            cache_file = self.cache_dir / Generator_Files.DEPLOYMENT_DAYS_FILE.format(key=key)
+        if cache_file is not None and cache_file.is_file():
+            deployment_days: np.ndarray = np.load(cache_file)
+        else:
+            deployment_days: np.ndarray = self._calculate_deployment_days(weather_envs, hour)
+            if cache_file is not None:
+                save_array_atomic(cache_file, deployment_days)
+        self._deployment_days[key] = deployment_days
+        return deployment_days
+
+    def _calculate_deployment_days(self, weather_envs: dict, hour: int) -> np.ndarray:
+        hours: np.ndarray = self._daily_time_indices(hour)
+        deployment_days: np.ndarray = np.ones((len(hours), self.lat_length, self.lon_length), bool)
+        for weather_values, envelope in (
+            (self.temps, weather_envs[pdc.Method_Params.TEMP]),
+            (self.winds, weather_envs[pdc.Method_Params.WIND]),
+            (self.precip, weather_envs[pdc.Method_Params.PRECIP]),
+        ):
+            daily_values: np.ndarray = weather_values[hours]
+            deployment_days &= (envelope[0] <= daily_values) & (daily_values <= envelope[1])
+        return deployment_days
+
+    def _daily_time_indices(self, hour: int) -> np.ndarray:
+        """The time index of the given hour on each day of the weather file"""
+        if self.days is None:
+            # Only whole days of the weather file are considered
+            return np.arange(self.time_length // 24) * 24 + hour
+        # The last time step at or before the hour, for files that are not hourly
+        day_hours: np.ndarray = self.days.astype("datetime64[h]") + np.timedelta64(hour, "h")
+        time_indices: np.ndarray = np.searchsorted(self.time_hours, day_hours, side="right") - 1
+        return np.maximum(time_indices, 0)
+
+    def day_index(self, curr_date: date) -> int:
+        """
+        Get the day of the weather file to use for the given simulation date.
+        This is the row of the date in the deployment days matrices.
+
+        Dates outside of the weather file are cycled onto the same day of a year covered
+        by the file, clamped to the first or last day of the file, or raise an error,
+        depending on the weather_out_of_range policy.
         """
+        if self.days is None:
+            day: int = curr_date.timetuple().tm_yday - 1  # 0 indexed.
+            n_days: int = self.time_length // 24
+            if day < n_days:
+                return day
+            if self.out_of_range_policy == Weather_Time_Policies.CYCLE:
+                return day % n_days
+            if self.out_of_range_policy == Weather_Time_Policies.CLAMP:
+                return n_days - 1
+            self._date_out_of_range(curr_date)
+
+        first_day: date = self.days[0].item()
+        last_day: date = self.days[-1].item()
+        if curr_date < first_day or curr_date > last_day:
+            if self.out_of_range_policy == Weather_Time_Policies.CYCLE:
+                curr_date = self._cycle_date(curr_date, first_day, last_day)
+            elif self.out_of_range_policy == Weather_Time_Policies.ERROR:
+                self._date_out_of_range(curr_date)
+            curr_date = min(max(curr_date, first_day), last_day)
+        return int(np.searchsorted(self.days, np.datetime64(curr_date, "D")))
+
+    @staticmethod
+    def _cycle_date(curr_date: date, first_day: date, last_day: date) -> date:
+        """Move the date by whole years onto the years covered by the weather file"""
+        n_years: int = last_day.year - first_day.year + 1
+        year: int = first_day.year + (curr_date.year - first_day.year) % n_years
+        cycled_date: date = _replace_year(curr_date, year)
+        # The first and last years of the file may only be partly covered
+        if cycled_date < first_day and year < last_day.year:
+            cycled_date = _replace_year(curr_date, year + 1)
+        elif cycled_date > last_day and year > first_day.year:
+            cycled_date = _replace_year(curr_date, year - 1)
+        return cycled_date
+
+    def _date_out_of_range(self, curr_date: date) -> None:
+        if self.days is None:
+            start, end = "day 1", f"day {self.time_length // 24} of the year"
+        else:
+            start, end = self.days[0], self.days[-1]
+        logger = logging.getLogger(__name__)
+        logger.error(
+            rem.WEATHER_DATE_OUT_OF_RANGE_ERROR.format(date=curr_date, start=start, end=end)
+        )
+        sys.exit()
+
+
+def _grid_window(coordinates: np.ndarray, low: float, high: float) -> tuple[int, int]:
+    """
+    The start and end index of the grid cells from the one closest to the low bound
+    to the one closest to the high bound, padded by one cell on each side.
+    The coordinates may be in ascending or descending order.
+    """
+    coord_sort: np.ndarray = np.argsort(coordinates, kind="mergesort")
+    sorted_coords: np.ndarray = coordinates[coord_sort]
+    low_ind: int = coord_sort[find_closest_index_numpy(sorted_coords, low)]
+    high_ind: int = coord_sort[find_closest_index_numpy(sorted_coords, high)]
+    start: int = max(min(low_ind, high_ind) - 1, 0)
+    end: int = min(max(low_ind, high_ind) + 2, len(coordinates))
+    return int(start), int(end)
+
+
+def _time_window(time_hours: np.ndarray, date_range: tuple[date, date]) -> tuple[int, int]:
+    """
+    The start and end index of the time steps covering the date range. The whole time axis
+    is kept when the file has no calendar, or does not cover the date range, as dates are
+    then looked up by their day of the year or moved onto the days of the file.
+    """
+    if time_hours is None or date_range is None:
+        return 0, None
+    file_days: np.ndarray = time_hours[[0, -1]].astype("datetime64[D]")
+    if file_days[0] > np.datetime64(date_range[0]) or file_days[1] < np.datetime64(date_range[1]):
+        return 0, None
+    start: np.datetime64 = np.datetime64(date_range[0], "h")
+    end: np.datetime64 = np.datetime64(date_range[1], "h") + np.timedelta64(24, "h")
+    # The last time step at or before the start, for files that are not hourly
+    start_ind: int = max(int(np.searchsorted(time_hours, start, side="right")) - 1, 0)
+    end_ind: int = int(np.searchsorted(time_hours, end, side="left"))
+    return start_ind, end_ind
+
 
-        # Initialize empty boolean arrays for threshold pass(1)/fail(0)
-        bool_temp = np.zeros((self.lon_length, self.lat_length, self.virtual_world["timesteps"]))
-        bool_wind = np.zeros((self.lon_length, self.lat_length, self.virtual_world["timesteps"]))
-        bool_precip = np.zeros((self.lon_length, self.lat_length, self.virtual_world["timesteps"]))
-
-        # For each day...
-        for day in range(self.virtual_world["timesteps"]):
-            # Count DDs for each criteria
-            for lat in range(self.lat_length):
-                for lon in range(self.lon_length):
-                    # Check daily weather variables are within method range
-                    if (
-                        config["weather_envs"]["temp"][0]
-                        <= self.temps[day, lat, lon]
-                        <= config["weather_envs"]["temp"][1]
-                    ):
-                        bool_temp[lon, lat, day] = 1
-                    if (
-                        config["weather_envs"]["wind"][0]
-                        <= self.winds[day, lat, lon]
-                        <= config["weather_envs"]["wind"][1]
-                    ):
-                        bool_wind[lon, lat, day] = 1
-                    if (
-                        config["weather_envs"]["precip"][0]
-                        <= self.precip[day, lat, lon]
-                        <= config["weather_envs"]["precip"][1]
-                    ):
-                        bool_precip[lon, lat, day] = 1
-
-        # Check to see if all criteria (temp, wind, and precip) were met...
-        bool_sum = np.add(bool_temp, np.add(bool_wind, bool_precip))
-        DD_all = bool_sum == 3
-
-        return DD_all
+def _replace_year(curr_date: date, year: int) -> date:
+    # February 29th becomes February 28th in years that are not leap years
+    try:
+        return curr_date.replace(year=year)
+    except ValueError:
+        return curr_date.replace(year=year, day=28)
@@ -0,0 +1,47 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_get_rates.py
+Purpose: Contains unit tests for drawing batches of emission rates from emissions sources.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import numpy as np
+from scipy import stats
+
+from file_processing.input_processing.emissions_source_processing import (
+    EmissionsSourceDist,
+    EmissionsSourceSample,
+)
+from utils.unit_converter import gas_convert
+
+
+def test_000_dist_get_rates_matches_get_a_rate_distribution():
+    emis_source = EmissionsSourceDist("test", "gram", "hour", "lognorm", ["1.5"], "2.0", 100.0)
+    np.random.seed(0)
+    rates = emis_source.get_rates(2000)
+    single_rates = [emis_source.get_a_rate() for _ in range(2000)]
+    assert rates.shape == (2000,)
+    assert rates.max() <= gas_convert(100.0, input_metric="gram", input_increment="hour")
+    assert stats.ks_2samp(rates, single_rates).pvalue > 0.01
+
+
+def test_000_sample_get_rates_draws_capped_samples():
+    emis_source = EmissionsSourceSample("test", "gram", "second", ["1", "2", "3", "50"], 10)
+    np.random.seed(0)
+    rates = emis_source.get_rates(500)
+    assert rates.shape == (500,)
+    assert set(rates.tolist()) == {1.0, 2.0, 3.0, 10.0}
+    assert emis_source.get_rates(0).shape == (0,)
@@ -0,0 +1,100 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_infrastructure_lookups.py
+Purpose: Contains unit tests for the site type, equipment group and source lookups used
+when generating the sites.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import pandas as pd
+import pytest
+
+from constants.infrastructure_const import Infrastructure_Constants as IC
+from file_processing.input_processing.infrastructure_processing import (
+    check_site_types,
+    get_component_sources,
+    get_equipment_group_info,
+    get_first_site_types,
+    get_site_type_values,
+)
+
+
+def sites_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "site_ID": [1, 2, 3],
+            "lat": [55.0, 55.1, 55.2],
+            "lon": [-119.0, -119.1, -119.2],
+            "site_type": ["type2", "type1", "type2"],
+        }
+    )
+
+
+def site_types_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "site_type": ["type1", "type2", "type1"],
+            "equipment": ["equip1;", "equip2;equip3;", "duplicate;"],
+        }
+    )
+
+
+def test_000_site_type_values_use_the_first_row_of_each_type() -> None:
+    site_types: pd.DataFrame = get_first_site_types(site_types_df())
+    equipment: pd.Series = get_site_type_values(sites_df(), site_types, IC.Sites_File_Constants.EQG)
+    assert equipment.to_list() == ["equip2;equip3;", "equip1;", "equip2;equip3;"]
+
+
+def test_000_missing_site_type_exits() -> None:
+    sites: pd.DataFrame = sites_df()
+    sites.loc[1, "site_type"] = "type3"
+    with pytest.raises(SystemExit):
+        check_site_types(sites, get_first_site_types(site_types_df()))
+
+
+def test_000_equipment_group_info_matches_the_first_row_of_the_group() -> None:
+    equipment_df = pd.DataFrame(
+        {
+            "equipment": ["equip1", "equip2", "equip1"],
+            "Valve": [2, 1, 5],
+            "Flange": [0, 3, 5],
+        }
+    )
+    infrastructure_inputs: dict = {IC.Virtual_World_Constants.EQG: equipment_df}
+    for equipment_group in ["equip1", "equip2"]:
+        expected: pd.Series = equipment_df.loc[equipment_df["equipment"] == equipment_group].iloc[0]
+        info: pd.Series = get_equipment_group_info(infrastructure_inputs, equipment_group)
+        pd.testing.assert_series_equal(info, expected)
+    assert IC.Virtual_World_Constants.EQG_ROWS in infrastructure_inputs
+
+
+def test_000_component_sources_match_the_rows_of_the_component() -> None:
+    sources_df = pd.DataFrame(
+        {
+            "source_ID": ["leak", "vent", "leak"],
+            "component": ["Valve", "Valve", "Flange"],
+            "repairable": [True, False, True],
+            "emissions_production_rate": [0.01, 0.02, 0.03],
+        }
+    )
+    infrastructure_inputs: dict = {IC.Virtual_World_Constants.SOURCES: sources_df}
+    for component in ["Valve", "Flange"]:
+        expected: list[dict] = [
+            row.to_dict()
+            for _, row in sources_df.loc[sources_df["component"] == component].iterrows()
+        ]
+        assert get_component_sources(infrastructure_inputs, component) == expected
+    assert get_component_sources(infrastructure_inputs, "Connector") == []
@@ -0,0 +1,94 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_build_ts_dataframe.py
+Purpose: Contains unit tests for the preallocated timeseries buffer of the
+ProgramOutputManager class.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from constants.output_file_constants import TIMESERIES_COL_ACCESSORS as tca
+from constants.param_default_const import Output_Params as op
+from file_processing.output_processing.output_utils import EmisInfo, TsEmisData, TsMethodData
+from file_processing.output_processing.program_output_manager import ProgramOutputManager
+
+
+def gen_output_manager() -> ProgramOutputManager:
+    return ProgramOutputManager(
+        path=Path("."),
+        name_str="test",
+        method_names=["M1", "M2"],
+        output_config={op.PROGRAM_VISUALIZATIONS: {}},
+    )
+
+
+def gen_rows(output_manager: ProgramOutputManager, n_days: int) -> list[dict]:
+    rows = []
+    for day in range(n_days):
+        new_row = output_manager._init_ts_row(date(2020, 1, 1) + timedelta(days=day))
+        output_manager._update_ts_row_w_emis_info(
+            new_row, TsEmisData(daily_emis=1.5 * day, active_leaks=day), EmisInfo()
+        )
+        output_manager._update_ts_row_w_methods_info(
+            new_row,
+            [
+                TsMethodData("M1", daily_deployment_cost=10.0, daily_tags=day, sites_visited=1),
+                TsMethodData("M2", daily_flags=np.nan, travel_time=12.5),
+            ],
+            include_upfront_cost=day == 0,
+        )
+        rows.append(new_row)
+    return rows
+
+
+def test_000_build_ts_dataframe_matches_row_appends():
+    output_manager = gen_output_manager()
+    ts_columns = output_manager._init_ts_columns()
+    rows = gen_rows(output_manager, 5)
+    expected = pd.DataFrame(columns=ts_columns)
+    ts_buffer = output_manager._init_ts_buffer(ts_columns, len(rows))
+    for day, new_row in enumerate(rows):
+        expected.loc[len(expected)] = new_row
+        output_manager._write_ts_row(ts_buffer, day, new_row)
+
+    timeseries = output_manager._build_ts_dataframe(ts_buffer)
+
+    assert list(timeseries.columns) == ts_columns
+    assert timeseries[tca.DATE].tolist() == expected[tca.DATE].tolist()
+    for column in ts_columns[1:]:
+        np.testing.assert_allclose(timeseries[column].astype(float), expected[column].astype(float))
+
+
+def test_000_build_ts_dataframe_keeps_integer_columns_integral():
+    output_manager = gen_output_manager()
+    ts_columns = output_manager._init_ts_columns()
+    rows = gen_rows(output_manager, 3)
+    ts_buffer = output_manager._init_ts_buffer(ts_columns, len(rows))
+    for day, new_row in enumerate(rows):
+        output_manager._write_ts_row(ts_buffer, day, new_row)
+
+    timeseries = output_manager._build_ts_dataframe(ts_buffer)
+
+    assert timeseries[tca.ACT_LEAKS].dtype == "Int64"
+    assert timeseries[tca.METH_DAILY_TAGS.format(method="M1")].dtype == "Int64"
+    assert timeseries[tca.METH_DAILY_FLAGS.format(method="M2")].isna().all()
+    assert timeseries[tca.METH_DAILY_TRAVEL_TIME.format(method="M2")].dtype == "float64"
+    assert timeseries[tca.EMIS].dtype == "float64"
@@ -0,0 +1,127 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_save_emissions_summary.py
+Purpose: Contains end to end tests of the emissions summary written by the
+ProgramOutputManager class, from the emissions to the written file.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+from constants.file_name_constants import Output_Files
+from constants.output_file_constants import (
+    EMIS_DATA_COL_ACCESSORS as eca,
+    EMIS_DATA_FINAL_COL_ORDER,
+)
+from constants.param_default_const import Output_Params as op
+from file_processing.output_processing.program_output_manager import ProgramOutputManager
+from virtual_world.component import Component
+from virtual_world.emission_types.emission import Emission
+from virtual_world.emission_types.intermittent_non_repairable_emission import (
+    IntermittentNonRepairableEmission,
+)
+from virtual_world.emission_types.intermittent_repairable_emission import (
+    IntermittentRepairableEmission,
+)
+from virtual_world.emission_types.non_repairable_emissions import NonRepairableEmission
+from virtual_world.emission_types.repairable_emission import RepairableEmission
+from virtual_world.equipment_groups import Equipment_Group
+from virtual_world.infrastructure import Infrastructure
+from virtual_world.sites import Site
+
+SIM_START = date(2020, 1, 1)
+SIM_END = date(2020, 12, 31)
+COVS = {"M_OGI": 1.0}
+
+
+def gen_emissions() -> list[Emission]:
+    emissions: list[Emission] = [
+        RepairableEmission(0, 0.5, date(2020, 2, 1), SIM_START, True, COVS, COVS, 14, 200.0, 365),
+        NonRepairableEmission(7, 0.25, date(2020, 3, 1), SIM_START, False, COVS, COVS, 30),
+        IntermittentRepairableEmission(
+            12345, 0.5, date(2019, 12, 1), SIM_START, True, COVS, COVS, 14, 200.0, 365, 2, 5
+        ),
+        IntermittentNonRepairableEmission(
+            9999999999, 0.1, date(2020, 6, 1), SIM_START, False, COVS, COVS, 365, 2, 5
+        ),
+    ]
+    for emission in emissions:
+        emission.activate(SIM_START)
+    return emissions
+
+
+def gen_infrastructure() -> Infrastructure:
+    component = Component._reconstruct("comp", "comp_0", [], gen_emissions(), [], {})
+    sites: list[Site] = [
+        Site._reconstruct(
+            site_id,
+            0,
+            0,
+            0,
+            0,
+            [Equipment_Group._reconstruct(0, {}, {}, components)],
+            {},
+            {},
+            {},
+            "type",
+            SIM_START,
+            {},
+            {},
+        )
+        for site_id, components in (("861.0", [component]), ("2.0", []))
+    ]
+    return Infrastructure._reconstruct({}, None, sites)
+
+
+def gen_output_manager(path: Path) -> ProgramOutputManager:
+    return ProgramOutputManager(
+        path=path,
+        name_str="test",
+        method_names=["M_OGI"],
+        output_config={op.PROGRAM_VISUALIZATIONS: {}},
+    )
+
+
+def test_000_emission_ids_are_int64_in_the_emissions_summary() -> None:
+    emis_data: pd.DataFrame = gen_infrastructure().gen_summary_emis_data(SIM_END)
+    assert emis_data[eca.EMIS_ID].dtype == "int64"
+    assert emis_data[eca.EMIS_ID].tolist() == [0, 7, 12345, 9999999999]
+
+
+def test_000_emissions_summary_file_is_unchanged_by_integer_ids(tmp_path: Path) -> None:
+    output_manager: ProgramOutputManager = gen_output_manager(tmp_path)
+    output_manager.save_emissions_summary(gen_infrastructure().gen_summary_emis_data(SIM_END))
+    summary_file: Path = tmp_path / output_manager.generate_file_names(
+        Output_Files.EMISSIONS_SUMMARY_FILE
+    )
+
+    # The emissions summary as written when emission IDs were zero-filled strings
+    emis_records: list[dict] = []
+    for site in gen_infrastructure()._sites:
+        site.gen_emis_data(emis_records, SIM_END)
+    for summary_dict in emis_records:
+        summary_dict[eca.EMIS_ID] = str(summary_dict[eca.EMIS_ID]).zfill(10)
+    string_id_data = pd.DataFrame(emis_records, columns=EMIS_DATA_FINAL_COL_ORDER, dtype=object)
+    string_id_dir: Path = tmp_path / "string_ids"
+    string_id_dir.mkdir()
+    gen_output_manager(string_id_dir).save_results(string_id_data, summary_file.name)
+
+    assert summary_file.read_bytes() == (string_id_dir / summary_file.name).read_bytes()
+    emis_ids: list[str] = [line.split(",")[0] for line in summary_file.read_text().splitlines()]
+    assert emis_ids == [eca.EMIS_ID, "0000000000", "0000000007", "0000012345", "9999999999"]
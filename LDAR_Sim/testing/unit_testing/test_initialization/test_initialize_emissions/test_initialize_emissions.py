@@ -0,0 +1,147 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_initialize_emissions.py
+Purpose: Contains unit tests for generating the emissions files of the simulations.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from pathlib import Path
+import pickle
+
+import numpy as np
+import pytest
+
+from constants.file_name_constants import Generator_Files
+from file_processing.input_processing.input_manager import InputManager
+from initialization.initialize_emissions import initialize_emissions, read_in_emissions
+from simulation.simulation_manager import SimulationManager
+from virtual_world.emission_types.emission import Emission
+from virtual_world.infrastructure import Infrastructure
+
+LDAR_SIM_ROOT = Path(__file__).resolve().parents[4]
+EMIS_PRESEED_VAL = [11, 22, 33, 44]
+
+
+@pytest.fixture(scope="module")
+def sim_manager(tmp_path_factory) -> SimulationManager:
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(LDAR_SIM_ROOT)
+        parameter_files = list((LDAR_SIM_ROOT / "simulations" / "simple_test_case1").glob("*.yaml"))
+        sim_manager = SimulationManager(InputManager(), parameter_files)
+        sim_manager.generator_dir = tmp_path_factory.mktemp("generator")
+        sim_manager.preseed_random = False
+        np.random.seed(0)
+        sim_manager.setup_infrastructure()
+    return sim_manager
+
+
+def run_initialize_emissions(
+    sim_manager: SimulationManager,
+    generator_dir: Path,
+    n_sims: int,
+    n_processes: int,
+    hash_file_exist: bool = False,
+    columnar_cache: bool = False,
+) -> None:
+    initialize_emissions(
+        n_sims,
+        True,
+        EMIS_PRESEED_VAL,
+        hash_file_exist,
+        sim_manager.infrastructure,
+        sim_manager.sim_start_date,
+        sim_manager.sim_end_date,
+        generator_dir,
+        pre_simulation_emissions=sim_manager.pre_simulation_emissions,
+        n_processes=n_processes,
+        columnar_cache=columnar_cache,
+    )
+
+
+def read_emissions_files(generator_dir: Path, n_sims: int) -> list[bytes]:
+    return [
+        (generator_dir / Generator_Files.GEN_INFRA_EMISS.format(i=i)).read_bytes()
+        for i in range(n_sims)
+    ]
+
+
+def read_n_sims_saved(generator_dir: Path) -> int:
+    with open(generator_dir / Generator_Files.N_SIM_SAVE_FILE, "rb") as f:
+        return pickle.load(f)
+
+
+def read_source_emissions(infrastructure: Infrastructure, sim_number: int) -> list[list[tuple]]:
+    # The state of the emissions of every source, in the order the sources activate them
+    source_emissions: list[list[tuple]] = []
+    for site in infrastructure._sites:
+        for eqg in site._equipment_groups:
+            for comp in eqg._component:
+                for src in comp._sources:
+                    queue = src._generated_emissions[sim_number]
+                    emissions: list[Emission] = [queue.pop() for _ in range(len(queue))]
+                    source_emissions.append(
+                        [(type(emission), emission._get_state()) for emission in emissions]
+                    )
+    return source_emissions
+
+
+def test_000_parallel_emissions_match_sequential_emissions(sim_manager, tmp_path):
+    sequential_dir = tmp_path / "sequential"
+    parallel_dir = tmp_path / "parallel"
+    sequential_dir.mkdir()
+    parallel_dir.mkdir()
+    run_initialize_emissions(sim_manager, sequential_dir, 3, n_processes=1)
+    run_initialize_emissions(sim_manager, parallel_dir, 3, n_processes=3)
+    assert read_emissions_files(sequential_dir, 3) == read_emissions_files(parallel_dir, 3)
+    assert read_n_sims_saved(parallel_dir) == 3
+
+
+def test_001_extending_generated_emissions_only_generates_new_simulations(sim_manager, tmp_path):
+    run_initialize_emissions(sim_manager, tmp_path, 2, n_processes=2)
+    first_files = read_emissions_files(tmp_path, 2)
+    run_initialize_emissions(sim_manager, tmp_path, 4, n_processes=2, hash_file_exist=True)
+    assert read_emissions_files(tmp_path, 2) == first_files
+    assert read_n_sims_saved(tmp_path) == 4
+
+    reference_dir = tmp_path / "reference"
+    reference_dir.mkdir()
+    run_initialize_emissions(sim_manager, reference_dir, 4, n_processes=1)
+    assert read_emissions_files(tmp_path, 4) == read_emissions_files(reference_dir, 4)
+
+
+def test_002_columnar_emissions_cache_reads_the_same_emissions(sim_manager, tmp_path):
+    pickle_dir = tmp_path / "pickle"
+    columnar_dir = tmp_path / "columnar"
+    pickle_dir.mkdir()
+    columnar_dir.mkdir()
+    run_initialize_emissions(sim_manager, pickle_dir, 2, n_processes=1)
+    run_initialize_emissions(sim_manager, columnar_dir, 2, n_processes=2, columnar_cache=True)
+    for i in range(2):
+        assert not (columnar_dir / Generator_Files.GEN_INFRA_EMISS.format(i=i)).exists()
+        infrastructure = sim_manager.infrastructure
+        read_in_emissions(infrastructure, pickle_dir, i, sim_manager.sim_start_date)
+        pickled_emissions = read_source_emissions(infrastructure, i)
+        read_in_emissions(infrastructure, columnar_dir, i, sim_manager.sim_start_date)
+        columnar_emissions = read_source_emissions(infrastructure, i)
+        assert any(pickled_emissions)
+        assert columnar_emissions == pickled_emissions
+
+
+def test_003_regenerated_emissions_replace_the_other_format(sim_manager, tmp_path):
+    run_initialize_emissions(sim_manager, tmp_path, 1, n_processes=1, columnar_cache=True)
+    run_initialize_emissions(sim_manager, tmp_path, 1, n_processes=1)
+    assert (tmp_path / Generator_Files.GEN_INFRA_EMISS.format(i=0)).exists()
+    assert not (tmp_path / Generator_Files.GEN_INFRA_EMISS_ARRAY.format(i=0)).exists()
@@ -77,18 +77,21 @@ def mock_create_emission(
     leak_count,
     start_date,
     sim_start_date,
-    emission_rate_source_dictionary,
-    repair_delay_dataframe,
+    rate,
+    repair_delay=None,
+    repair_cost=None,
 ):
     return start_date
 
 
 def setup_mock_source(mocker):
     mocker.patch.object(Source, "__init__", mock_source)
-    mocker.patch.object(Source, "_get_rate", return_value=1)
+    mocker.patch.object(Source, "_get_rates", side_effect=lambda rate_dict, n, rng=None: [1] * n)
     mocker.patch.object(Source, "_get_repairable", return_value=False)
-    mocker.patch.object(Source, "_get_rate", return_value=1)
-    mocker.patch.object(Source, "_get_rep_delay", return_value=10)
+    mocker.patch.object(Source, "_get_rates", side_effect=lambda rate_dict, n, rng=None: [1] * n)
+    mocker.patch.object(
+        Source, "_get_rep_delays", side_effect=lambda delay_df, n, rng=None: [10] * n
+    )
     mocker.patch.object(Source, "_get_rep_cost", return_value=1)
     mocker.patch.object(Source, "_get_emis_duration", return_value=10)
     mocker.patch.object(Source, "_create_emission", mock_create_emission)
@@ -96,10 +99,12 @@ def setup_mock_source(mocker):
 
 def setup_mock_source2(mocker):
     mocker.patch.object(Source, "__init__", mock_source2)
-    mocker.patch.object(Source, "_get_rate", return_value=1)
+    mocker.patch.object(Source, "_get_rates", side_effect=lambda rate_dict, n, rng=None: [1] * n)
     mocker.patch.object(Source, "_get_repairable", return_value=False)
-    mocker.patch.object(Source, "_get_rate", return_value=1)
-    mocker.patch.object(Source, "_get_rep_delay", return_value=10)
+    mocker.patch.object(Source, "_get_rates", side_effect=lambda rate_dict, n, rng=None: [1] * n)
+    mocker.patch.object(
+        Source, "_get_rep_delays", side_effect=lambda delay_df, n, rng=None: [10] * n
+    )
     mocker.patch.object(Source, "_get_rep_cost", return_value=1)
     mocker.patch.object(Source, "_get_emis_duration", return_value=10)
     mocker.patch.object(Source, "_create_emission", mock_create_emission)
@@ -107,10 +112,12 @@ def setup_mock_source2(mocker):
 
 def setup_mock_source3(mocker):
     mocker.patch.object(Source, "__init__", mock_source3)
-    mocker.patch.object(Source, "_get_rate", return_value=1)
+    mocker.patch.object(Source, "_get_rates", side_effect=lambda rate_dict, n, rng=None: [1] * n)
     mocker.patch.object(Source, "_get_repairable", return_value=False)
-    mocker.patch.object(Source, "_get_rate", return_value=1)
-    mocker.patch.object(Source, "_get_rep_delay", return_value=10)
+    mocker.patch.object(Source, "_get_rates", side_effect=lambda rate_dict, n, rng=None: [1] * n)
+    mocker.patch.object(
+        Source, "_get_rep_delays", side_effect=lambda delay_df, n, rng=None: [10] * n
+    )
     mocker.patch.object(Source, "_get_rep_cost", return_value=1)
     mocker.patch.object(Source, "_get_emis_duration", return_value=365)
     mocker.patch.object(Source, "_create_emission", mock_create_emission)
@@ -118,10 +125,12 @@ def setup_mock_source3(mocker):
 
 def setup_mock_source4(mocker):
     mocker.patch.object(Source, "__init__", mock_source4)
-    mocker.patch.object(Source, "_get_rate", return_value=1)
+    mocker.patch.object(Source, "_get_rates", side_effect=lambda rate_dict, n, rng=None: [1] * n)
     mocker.patch.object(Source, "_get_repairable", return_value=False)
-    mocker.patch.object(Source, "_get_rate", return_value=1)
-    mocker.patch.object(Source, "_get_rep_delay", return_value=10)
+    mocker.patch.object(Source, "_get_rates", side_effect=lambda rate_dict, n, rng=None: [1] * n)
+    mocker.patch.object(
+        Source, "_get_rep_delays", side_effect=lambda delay_df, n, rng=None: [10] * n
+    )
     mocker.patch.object(Source, "_get_rep_cost", return_value=1)
     mocker.patch.object(Source, "_get_emis_duration", return_value=365)
     mocker.patch.object(Source, "_create_emission", mock_create_emission)
@@ -28,7 +28,9 @@ def mock_average_t_btw_site(self):
 def mock_values_for_simple_site_level_method_construction_fix(
     mocker,
 ) -> Tuple[str, dict]:
-    mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    mocker.patch.object(
+        Site, "__init__", lambda self, *args, **kwargs: setattr(self, "_site_ID", 1)
+    )
     mocker.patch.object(
         Method,
         "_get_average_method_surveys_required",
@@ -20,7 +20,7 @@ along with this program.  If not, see <https://opensource.org/licenses/MIT>.
 
 import pytest
 from datetime import date
-from src.weather.daylight_calculator import DaylightCalculatorAve
+from src.weather.daylight_calculator import DaylightCalculatorAll
 from src.programs.component_level_method import ComponentLevelMethod
 from src.virtual_world.infrastructure import Site
 from collections import defaultdict
@@ -39,7 +39,9 @@ def mocker_fixture(mocker):
     def mock_initialize_sensor(properties):
         return {}
 
-    mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    mocker.patch.object(
+        Site, "__init__", lambda self, *args, **kwargs: setattr(self, "_site_ID", 1)
+    )
     mocker.patch.object(
         ComponentLevelMethod,
         "_initialize_sensor",
@@ -150,8 +152,14 @@ def mock_get_detectable_emissions(method_name):
     }
 
 
-def mock_daylight_calculator_ave_init(self):
-    return
+def gen_daylight(sites) -> DaylightCalculatorAll:
+    # Every site is in a single cell
+    return DaylightCalculatorAll(
+        [[56.0, -111.0]],
+        {site.get_id(): 0 for site in sites},
+        date(2023, 1, 1),
+        date(2025, 12, 31),
+    )
 
 
 @pytest.fixture(name="deploy_crews_testing3")
@@ -208,8 +216,7 @@ def deploy_crews_testing3_fix(mocker):
     }
     weather = create_random_state()
     sites = [site_mock]
-    mocker.patch.object(DaylightCalculatorAve, "__init__", mock_daylight_calculator_ave_init)
-    daylight: DaylightCalculatorAve = DaylightCalculatorAve()
+    daylight: DaylightCalculatorAll = gen_daylight(sites)
 
     survey_plans = [
         ScheduledSurveyPlanner(
@@ -297,8 +304,7 @@ def deploy_crews_testing4_fix(mocker):
         },
     }
     weather = create_random_state()
-    mocker.patch.object(DaylightCalculatorAve, "__init__", mock_daylight_calculator_ave_init)
-    daylight: DaylightCalculatorAve = DaylightCalculatorAve()
+    daylight: DaylightCalculatorAll = gen_daylight(mock_sites)
 
     survey_plans = [
         ScheduledSurveyPlanner(
@@ -389,8 +395,7 @@ def deploy_crews_testing5_fix(mocker):
         },
     }
     weather = create_random_state()
-    mocker.patch.object(DaylightCalculatorAve, "__init__", mock_daylight_calculator_ave_init)
-    daylight: DaylightCalculatorAve = DaylightCalculatorAve()
+    daylight: DaylightCalculatorAll = gen_daylight(mock_sites)
 
     survey_plans = [
         ScheduledSurveyPlanner(
@@ -483,8 +488,7 @@ def deploy_crews_testing6_fix(mocker):
         },
     }
     weather = create_random_state()
-    mocker.patch.object(DaylightCalculatorAve, "__init__", mock_daylight_calculator_ave_init)
-    daylight: DaylightCalculatorAve = DaylightCalculatorAve()
+    daylight: DaylightCalculatorAll = gen_daylight(mock_sites)
 
     survey_plans = [
         ScheduledSurveyPlanner(
@@ -31,8 +31,8 @@ from constants import param_default_const as pdc
 
 
 def mock_site_initialization(self, site_properties: dict):
-    for property, value in site_properties.items():
-        setattr(self, property, value)
+    # The survey time is patched onto the class, the ID is the only site property set
+    self._site_ID = site_properties["_id"]
 
 
 def mock_method_initialization(self, name: str, method_properties: dict, mock_sensor):
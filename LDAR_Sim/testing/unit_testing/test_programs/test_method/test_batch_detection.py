@@ -0,0 +1,62 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_batch_detection
+Purpose: Unit test for the batch detection of the sites surveyed by a method in a day
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date
+
+import pytest
+
+from constants.param_default_const import Method_Params as mp
+from scheduling.schedule_dataclasses import CrewDailyReport, SiteSurveyReport
+from src.programs.method import Method
+from testing.unit_testing.test_programs.test_method.method_testing_fixtures import (  # noqa
+    deploy_crews_testing2_fix,
+)
+
+
+@pytest.mark.parametrize("batch_detection", [False, True])
+def test_000_detect_emissions_detects_the_days_sites_in_one_call_in_batch_mode(
+    mocker, deploy_crews_testing2, batch_detection
+):
+    (sites, properties, weather, workplan, daylight) = deploy_crews_testing2
+    properties[mp.BATCH_DETECTION] = batch_detection
+    method = Method("test_method", properties, True, sites, None)
+    detect_emissions = mocker.patch.object(method._sensor, "detect_emissions")
+    detect_emissions_many = mocker.patch.object(method._sensor, "detect_emissions_many")
+    process_detections = mocker.patch.object(method, "_process_detections")
+    crew = CrewDailyReport(0, 480)
+    surveys = [(SiteSurveyReport(site_id), sites[0]) for site_id in range(3)]
+
+    for survey_report, site in surveys:
+        method._detect_emissions(crew, survey_report, site, date(2023, 1, 1))
+    method._detect_pending_emissions()
+
+    if batch_detection:
+        detect_emissions.assert_not_called()
+        detect_emissions_many.assert_called_once_with(
+            sites=[site for _, site in surveys],
+            meth_name="test_method",
+            survey_reports=[survey_report for survey_report, _ in surveys],
+        )
+    else:
+        assert detect_emissions.call_count == 3
+        detect_emissions_many.assert_not_called()
+    assert [call.args[1] for call in process_detections.call_args_list] == [
+        survey_report for survey_report, _ in surveys
+    ]
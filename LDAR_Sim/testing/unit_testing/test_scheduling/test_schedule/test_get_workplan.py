@@ -0,0 +1,154 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_get_workplan.py
+Purpose: Contains unit tests to check that the survey calendar used by get_workplan
+gives the same workplans as checking every survey plan each day, and that completed
+scheduled surveys of follow-up methods are scheduled again.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, timedelta
+import random
+
+import pytest
+
+from scheduling.follow_up_mobile_schedule import FollowUpMobileSchedule
+from scheduling.generic_schedule import GenericSchedule
+from scheduling.schedule_dataclasses import SiteSurveyReport
+from scheduling.stationary_schedule import StationarySchedule
+from scheduling.workplan import Workplan
+from virtual_world.sites import Site
+
+SIM_START = date(2020, 3, 15)
+SIM_END = date(2023, 12, 31)
+METHOD = "test"
+
+
+def get_workplan_checking_every_plan(self, current_date) -> Workplan:
+    for survey_plan in self._survey_plans:
+        survey_plan.update_date(current_date)
+        if survey_plan.queue_site_for_survey():
+            self.add_to_survey_queue(survey_plan)
+    sites_to_survey = self.get_daily_sites_to_survey()
+    return Workplan(site_survey_plan_list=sites_to_survey, date=current_date)
+
+
+def gen_sites(mocker, n_sites: int) -> list[Site]:
+    rng = random.Random(42)
+    sites = []
+    for i in range(n_sites):
+        site = mocker.Mock(spec=Site)
+        site.get_id.return_value = f"site_{i}"
+        site.do_site_deployment.return_value = rng.random() > 0.1
+        site._survey_frequencies = {METHOD: rng.choice([None, 0, 1, 2, 3, 4, 6, 12])}
+        first_month = rng.randint(1, 12)
+        site._deployment_months = {
+            METHOD: rng.choice(
+                [
+                    list(range(1, 13)),
+                    list(range(first_month, 13)),
+                    list(range(first_month, min(first_month + 3, 12) + 1)),
+                ]
+            )
+        }
+        site._deployment_years = {METHOD: rng.choice([[], [2021], [2020, 2022, 2023]])}
+        sites.append(site)
+    return sites
+
+
+def run_schedule(schedule: GenericSchedule) -> list[tuple[date, list[str]]]:
+    """Run the schedule over the simulation, completing, continuing or returning
+    the planned surveys in a reproducible way, and return the daily workplans.
+    """
+    rng = random.Random(7)
+    workplans = []
+    current_date = SIM_START
+    while current_date <= SIM_END:
+        workplan: Workplan = schedule.get_workplan(current_date)
+        site_ids = list(workplan.site_survey_planners)
+        workplans.append((current_date, site_ids))
+        for site_id, planner in list(workplan.site_survey_planners.items()):
+            outcome = rng.random()
+            report = SiteSurveyReport(
+                site_id=site_id,
+                survey_complete=outcome < 0.6,
+                survey_in_progress=0.6 <= outcome < 0.8,
+                survey_completion_date=current_date,
+            )
+            workplan.add_survey_report(report, planner)
+        schedule.update(workplan, current_date, False)
+        current_date += timedelta(days=1)
+    return workplans
+
+
+@pytest.mark.parametrize(
+    "schedule_class, daily_surveys, crews",
+    [(GenericSchedule, 3, 2), (GenericSchedule, 50, 4), (StationarySchedule, 5, 1)],
+)
+def test_000_get_workplan_matches_checking_every_survey_plan(
+    mocker, schedule_class, daily_surveys, crews
+):
+    sites = gen_sites(mocker, 60)
+    schedule = schedule_class(METHOD, sites, SIM_START, SIM_END, daily_surveys, crews)
+    expected_schedule = schedule_class(METHOD, sites, SIM_START, SIM_END, daily_surveys, crews)
+    mocker.patch.object(
+        expected_schedule,
+        "get_workplan",
+        get_workplan_checking_every_plan.__get__(expected_schedule),
+    )
+
+    result = run_schedule(schedule)
+    expected = run_schedule(expected_schedule)
+
+    assert any(site_ids for _, site_ids in expected)
+    assert result == expected
+
+
+def test_000_get_workplan_schedules_follow_up_method_surveys_again_once_completed(mocker):
+    site = mocker.Mock(spec=Site)
+    site.get_id.return_value = "site_0"
+    site.do_site_deployment.return_value = True
+    site._survey_frequencies = {METHOD: 2}
+    site._deployment_months = {METHOD: list(range(1, 13))}
+    site._deployment_years = {METHOD: [2021]}
+    schedule = FollowUpMobileSchedule(METHOD, [site], SIM_START, SIM_END, 1, 1)
+    # Scheduled survey plans are taken off the survey queue as soon as they are queued
+    queued_dates: list[date] = []
+    mocker.patch.object(
+        schedule,
+        "add_to_survey_queue",
+        lambda survey_plan: queued_dates.append(survey_plan._current_date),
+    )
+
+    current_date = SIM_START
+    while current_date <= SIM_END:
+        n_queued: int = len(queued_dates)
+        schedule.get_workplan(current_date)
+        if len(queued_dates) > n_queued:
+            survey_plan = schedule._survey_plans[0]
+            workplan = Workplan(site_survey_plan_list=[survey_plan], date=current_date)
+            report = SiteSurveyReport(
+                site_id="site_0",
+                survey_complete=True,
+                survey_in_progress=False,
+                survey_completion_date=current_date,
+            )
+            workplan.add_survey_report(report, survey_plan)
+            schedule.update(workplan, current_date, False)
+        current_date += timedelta(days=1)
+
+    assert len(queued_dates) == 2
+    assert all(queued_date.year == 2021 for queued_date in queued_dates)
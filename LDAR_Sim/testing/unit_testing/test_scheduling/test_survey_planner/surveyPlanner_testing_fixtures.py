@@ -25,7 +25,9 @@ from scheduling.scheduled_survey_planner import Survey_Counter
 
 @pytest.fixture()
 def mocker_fixture(mocker):
-    mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    mocker.patch.object(
+        Site, "__init__", lambda self, *args, **kwargs: setattr(self, "_site_ID", 1)
+    )
     return mocker
 
 
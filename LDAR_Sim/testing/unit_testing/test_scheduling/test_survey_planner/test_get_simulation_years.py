@@ -54,7 +54,9 @@ def test_000_get_simulation_years(date_range: Tuple[date, date, int, int], mocke
     mocker = mocker_fixture
 
     # Your existing test code here
-    mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    mocker.patch.object(
+        Site, "__init__", lambda self, *args, **kwargs: setattr(self, "_site_ID", 1)
+    )
     mocker.patch.object(ScheduledSurveyPlanner, "_gen_survey_plan", return_value=[date(2023, 1, 1)])
     deploy_years = list(range(start_year, end_year + 1))
     deploy_months = list(range(1, 13))
@@ -24,7 +24,9 @@ from scheduling.scheduled_survey_planner import ScheduledSurveyPlanner
 
 
 def test_000_queue_site_for_survey_returns_true_first_survey(mocker):
-    mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    mocker.patch.object(
+        Site, "__init__", lambda self, *args, **kwargs: setattr(self, "_site_ID", 1)
+    )
     start_year, end_year = 2020, 2025
     deploy_years = list(range(start_year, end_year + 1))
     RS = 5
@@ -43,7 +45,9 @@ def test_000_queue_site_for_survey_returns_true_first_survey(mocker):
 
 
 def test_000_queue_site_for_survey_returns_false_when_site_it_has_yet_to_reach_survey_date(mocker):
-    mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    mocker.patch.object(
+        Site, "__init__", lambda self, *args, **kwargs: setattr(self, "_site_ID", 1)
+    )
     start_year, end_year = 2020, 2025
     deploy_years = list(range(start_year, end_year + 1))
     RS = 5
@@ -63,7 +67,9 @@ def test_000_queue_site_for_survey_returns_false_when_site_it_has_yet_to_reach_s
 def test_000_queue_site_for_survey_returns_false_when_site_is_not_due_to_be_queued_for_survey(
     mocker,
 ):
-    mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    mocker.patch.object(
+        Site, "__init__", lambda self, *args, **kwargs: setattr(self, "_site_ID", 1)
+    )
     start_year, end_year = 2020, 2023
     deploy_years = [2021, 2022, 2023]
     RS = 5
@@ -0,0 +1,78 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_rolling_average.py
+Purpose: Module for testing the rolling averages of StationaryFollowUpSurveyPlanner against
+the pandas rolling mean
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scheduling.follow_up_survey_planner import StationaryFollowUpSurveyPlanner, _RollingMean
+from scheduling.surveying_dataclasses import DetectionRecord
+
+
+def pandas_rolling_mean(rates: list[float], window: int) -> float:
+    mean = pd.Series(rates).rolling(window=window, min_periods=window).mean().iloc[-1]
+    return 0 if np.isnan(mean) else mean
+
+
+@pytest.mark.parametrize("window", [1, 3, 7, 30])
+def test_000_rolling_mean_matches_pandas(window):
+    rng = np.random.default_rng(window)
+    rolling_mean = _RollingMean(window)
+    values: list[float] = []
+    for value in rng.exponential(scale=2.0, size=200):
+        rolling_mean.add(value)
+        values.append(value)
+        assert rolling_mean.mean == pytest.approx(pandas_rolling_mean(values, window))
+
+
+def test_000_rolling_mean_is_zero_until_window_fills():
+    rolling_mean = _RollingMean(5)
+    for value in [1.0, 2.0, 3.0, 4.0]:
+        rolling_mean.add(value)
+        assert rolling_mean.mean == 0
+    rolling_mean.add(5.0)
+    assert rolling_mean.mean == pytest.approx(3.0)
+
+
+@pytest.mark.parametrize("small_window, long_window", [(7, 30), (3, 10), (2, 50)])
+def test_000_planner_rolling_averages_match_pandas(mocker, small_window, long_window):
+    rng = np.random.default_rng(small_window * long_window)
+    rates = list(rng.exponential(scale=1.0, size=60))
+    detect_date = date(2021, 1, 1)
+    planner = StationaryFollowUpSurveyPlanner(
+        DetectionRecord(site_id=1, site=mocker, rate_detected=rates[0]),
+        detect_date,
+        small_window,
+        long_window,
+    )
+    for day, rate in enumerate(rates[1:], start=1):
+        planner.update_with_latest_survey(
+            DetectionRecord(site_id=1, site=mocker, rate_detected=rate),
+            "rolling_average",
+            "test_method",
+            detect_date + timedelta(days=day),
+        )
+        history = rates[: day + 1]
+        assert planner.rate_at_site == pytest.approx(pandas_rolling_mean(history, small_window))
+        assert planner.rate_at_site_long == pytest.approx(pandas_rolling_mean(history, long_window))
+    assert planner._detected_rates == rates
@@ -30,7 +30,9 @@ from testing.unit_testing.test_scheduling.test_survey_planner.surveyPlanner_test
 
 
 def test_000_set_survey_per_year_dictionary_simple(mocker):
-    mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    mocker.patch.object(
+        Site, "__init__", lambda self, *args, **kwargs: setattr(self, "_site_ID", 1)
+    )
     start_year, end_year = 2020, 2025
     deploy_years = list(range(start_year, end_year + 1))
     RS = 5
@@ -31,7 +31,9 @@ def test_update_with_latest_survey(mocker):
     """
     Function to test the update_with_latest_survey function in FollowUpSurveyPlanner
     """
-    mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    mocker.patch.object(
+        Site, "__init__", lambda self, *args, **kwargs: setattr(self, "_site_ID", 1)
+    )
     detection_record = DetectionRecord(site_id=1, site=mocker, rate_detected=0.1)
     detect_date = date(2021, 1, 1)
     follow_up_survey_planner = FollowUpSurveyPlanner(detection_record, detect_date)
@@ -81,7 +83,9 @@ def test_update_with_avrg_survey(mocker):
     """
     Function to test the update_with_latest_survey function in FollowUpSurveyPlanner
     """
-    mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    mocker.patch.object(
+        Site, "__init__", lambda self, *args, **kwargs: setattr(self, "_site_ID", 1)
+    )
     detection_record = DetectionRecord(site_id=1, site=mocker, rate_detected=0.1)
     detect_date = date(2021, 1, 1)
     follow_up_survey_planner = FollowUpSurveyPlanner(detection_record, detect_date)
@@ -134,7 +138,9 @@ def test_update_with_max_survey(mocker):
     """
     Function to test the update_with_latest_survey function in FollowUpSurveyPlanner
     """
-    mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    mocker.patch.object(
+        Site, "__init__", lambda self, *args, **kwargs: setattr(self, "_site_ID", 1)
+    )
     detection_record = DetectionRecord(site_id=1, site=mocker, rate_detected=0.1)
     detect_date = date(2021, 1, 1)
     follow_up_survey_planner = FollowUpSurveyPlanner(detection_record, detect_date)
@@ -184,7 +190,9 @@ def test_update_with_rolling_survey(mocker):
     """
     Function to test the update_with_latest_survey function in FollowUpSurveyPlanner
     """
-    mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    mocker.patch.object(
+        Site, "__init__", lambda self, *args, **kwargs: setattr(self, "_site_ID", 1)
+    )
     detection_record = DetectionRecord(site_id=1, site=mocker, rate_detected=0.1)
     detect_date = date(2021, 1, 1)
     stationary_survey_planner = StationaryFollowUpSurveyPlanner(
@@ -0,0 +1,85 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_detect_many.py
+Purpose:    To test the batch detection of sensors against their per rate detection.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import numpy as np
+import pytest
+
+from sensors.default_site_level_sensor import DefaultSiteLevelSensor
+from sensors.METEC_NoWind_sensor import METECNWComponent, METECNWEquipmentGroup, METECNWSite
+from sensors.OGI_camera_rk import OGICameraRKSensor
+from sensors.OGI_camera_zim import OGICameraZimSensor
+from utils.rng_registry import RNGRegistry
+
+SENSORS = [
+    (DefaultSiteLevelSensor, 0.5),
+    (METECNWSite, [0.47, 0.9]),
+    (METECNWEquipmentGroup, [0.47, 0.9, 0.0, 0.2]),
+    (METECNWComponent, [-2.0, 3.0]),
+    (OGICameraZimSensor, [0.24, 0.39]),
+    (OGICameraZimSensor, [0.24]),
+]
+
+
+def gen_rates() -> np.ndarray:
+    rates = np.random.default_rng(0).lognormal(mean=-1.0, sigma=2.0, size=500)
+    rates[::50] = 0.0
+    return rates
+
+
+@pytest.mark.parametrize("sensor_class, mdl", SENSORS)
+def test_000_detect_many_matches_rate_detected_with_rng_streams(sensor_class, mdl):
+    rates = gen_rates()
+    scalar_sensor = sensor_class(mdl, [0.0, 0.0], rng_registry=RNGRegistry(7))
+    batch_sensor = sensor_class(mdl, [0.0, 0.0], rng_registry=RNGRegistry(7))
+    expected = [bool(scalar_sensor._rate_detected(rate)) for rate in rates]
+    detected = batch_sensor.detect_many(rates)
+    assert detected.dtype == bool
+    assert detected.tolist() == expected
+
+
+@pytest.mark.parametrize("sensor_class, mdl", SENSORS)
+def test_000_detect_many_matches_rate_detected_with_global_rng(sensor_class, mdl):
+    rates = gen_rates()
+    sensor = sensor_class(mdl, [0.0, 0.0])
+    np.random.seed(11)
+    expected = [bool(sensor._rate_detected(rate)) for rate in rates]
+    np.random.seed(11)
+    assert sensor.detect_many(rates).tolist() == expected
+
+
+def test_000_detect_many_applies_min_threshold_only_to_rolled_rates():
+    sensor = METECNWSite([0.47, 0.9, 0.0, 1.0], [0.0, 0.0], rng_registry=RNGRegistry(3))
+    rates = np.array([0.001, 0.5, 5000.0])
+    prob_detect = 1 / (1 + np.exp(0.47 - 0.9 * (rates * 3.6)))
+    assert prob_detect[-1] >= 1
+    detected = sensor.detect_many(rates)
+    # Below the minimum threshold, rolled rates are never detected
+    assert not detected[0] and not detected[1]
+    assert detected[2]
+
+
+@pytest.mark.parametrize("mdl", [[0.01275], [0.01275, 0.00000278]])
+def test_000_ogi_rk_detect_many_draws_a_detection_curve_for_every_rate(mdl):
+    sensor = OGICameraRKSensor(mdl, [0.0, 0.0], rng_registry=RNGRegistry(5))
+    rates = np.array([0.0, 1e-6, 1e-6, 100.0, 100.0, 0.0])
+    detected = sensor.detect_many(rates)
+    assert detected.dtype == bool
+    # Zero rates are never detected, and the curve is near 0 or 1 far from the MDL
+    assert detected.tolist() == [False, False, False, True, True, False]
@@ -0,0 +1,60 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_quantify_many.py
+Purpose:    To test the quantify_many method of the quantification predictor classes.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import numpy as np
+import pytest
+from sensors.quantification.default_quantification_predictor import DefaultQuantificationPredictor
+from sensors.quantification.sampling_quantification_predictor import SamplingQuantificationPredictor
+from sensors.quantification.uniform_quantification_predictor import UniformQuantificationPredictor
+
+TRUE_RATES: np.ndarray = np.random.default_rng(0).lognormal(mean=0.0, sigma=1.5, size=200)
+QUANTIFICATION_ERRORS: np.ndarray = np.random.default_rng(5).normal(-10.0, 40.0, size=300)
+
+
+def gen_sampling_predictor(rng: np.random.Generator = None) -> SamplingQuantificationPredictor:
+    predictor = SamplingQuantificationPredictor.__new__(SamplingQuantificationPredictor)
+    predictor._quantification_errors = QUANTIFICATION_ERRORS
+    predictor._rng = rng
+    return predictor
+
+
+@pytest.mark.parametrize(
+    "gen_predictor",
+    [
+        lambda rng=None: DefaultQuantificationPredictor(-120.0, 80.0, rng=rng),
+        lambda rng=None: UniformQuantificationPredictor(-120.0, 80.0, rng=rng),
+        gen_sampling_predictor,
+    ],
+    ids=["default", "uniform", "sampling"],
+)
+@pytest.mark.parametrize("use_generator", [True, False])
+def test_000_quantify_many_draws_same_errors_as_predict(gen_predictor, use_generator):
+    if use_generator:
+        scalar_predictor = gen_predictor(np.random.default_rng(3))
+        batch_predictor = gen_predictor(np.random.default_rng(3))
+    else:
+        scalar_predictor = batch_predictor = gen_predictor()
+        np.random.seed(3)
+    expected = [scalar_predictor.predict(rate) for rate in TRUE_RATES]
+    if not use_generator:
+        np.random.seed(3)
+    measured_rates = batch_predictor.quantify_many(TRUE_RATES)
+    assert measured_rates.tolist() == expected
+    assert (measured_rates >= 0).all()
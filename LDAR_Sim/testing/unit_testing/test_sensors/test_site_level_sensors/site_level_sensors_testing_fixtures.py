@@ -82,7 +82,9 @@ def mock_site_emis_for_detect_emissions_testing_fix(mocker):
 
 @pytest.fixture(name="mock_site_for_detect_emissions_testing")
 def mock_site_for_detect_emissions_testing_fix(mocker, mock_site_emis_for_detect_emissions_testing):
-    mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    mocker.patch.object(
+        Site, "__init__", lambda self, *args, **kwargs: setattr(self, "_site_ID", 1)
+    )
     mocker.patch.object(
         Site,
         "get_detectable_emissions",
@@ -146,7 +148,9 @@ def mock_site_emis_for_detect_emissions_testing_lower_emis_fix(mocker):
 def mock_site_for_detect_emissions_testing_lower_emissions_fix(
     mocker, mock_site_emis_for_detect_emissions_testing_lower_emis
 ) -> Tuple[Any, float, float]:
-    mocker.patch.object(Site, "__init__", lambda self, *args, **kwargs: setattr(self, "id", 1))
+    mocker.patch.object(
+        Site, "__init__", lambda self, *args, **kwargs: setattr(self, "_site_ID", 1)
+    )
     mocker.patch.object(
         Site,
         "get_detectable_emissions",
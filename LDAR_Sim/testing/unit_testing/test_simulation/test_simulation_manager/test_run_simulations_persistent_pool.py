@@ -0,0 +1,64 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_run_simulations_persistent_pool.py
+Purpose: Contains unit tests for running simulations on a persistent worker pool.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date
+from pathlib import Path
+import random
+
+import numpy as np
+
+from file_processing.input_processing.input_manager import InputManager
+from simulation.simulation_manager import SimulationManager
+
+LDAR_SIM_ROOT = Path(__file__).resolve().parents[4]
+
+
+def run_simple_test_case(tmp_path: Path, name: str, persistent_pool: bool) -> dict[str, str]:
+    parameter_files = list((LDAR_SIM_ROOT / "simulations" / "simple_test_case1").glob("*.yaml"))
+    sim_manager = SimulationManager(InputManager(), parameter_files)
+    sim_manager.virtual_world["consider_weather"] = False
+    sim_manager.virtual_world["end_date"] = [2017, 12, 31]
+    sim_manager.sim_end_date = date(2017, 12, 31)
+    sim_manager.simulation_count = 2
+    sim_manager.sim_params["persistent_worker_pool"] = persistent_pool
+    sim_manager.sim_params["processes_count"] = 2
+    sim_manager.out_dir = tmp_path / name
+    sim_manager.generator_dir = tmp_path / f"{name}_generator"
+    sim_manager.initialize_outputs(InputManager(), write_parameters=False)
+    sim_manager.initialize_summary_managers()
+    np.random.seed(0)
+    random.seed(0)
+    sim_manager.check_generator_files()
+    sim_manager.setup_infrastructure()
+    sim_manager.setup_emissions()
+    sim_manager.setup_daylight()
+    sim_manager.run_simulations(DEBUG=False)
+    return {
+        str(file.relative_to(sim_manager.out_dir)): file.read_text()
+        for file in sim_manager.out_dir.rglob("*.csv")
+    }
+
+
+def test_000_persistent_pool_outputs_match_pool_per_simulation(tmp_path, monkeypatch):
+    monkeypatch.chdir(LDAR_SIM_ROOT)
+    per_sim_outputs = run_simple_test_case(tmp_path, "per_sim", persistent_pool=False)
+    persistent_outputs = run_simple_test_case(tmp_path, "persistent", persistent_pool=True)
+    assert len(persistent_outputs) > 0
+    assert per_sim_outputs == persistent_outputs
@@ -0,0 +1,122 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_indexed_priority_queue_with_fifo.py
+Purpose: Contains unit tests for the IndexedPriorityQueueWithFIFO class.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from dataclasses import dataclass
+import random
+
+import pytest
+
+from utils.queue import IndexedPriorityQueueWithFIFO, PriorityQueueWithFIFO
+
+
+@dataclass
+class Plan:
+    site_id: str
+
+
+def gen_queue() -> IndexedPriorityQueueWithFIFO:
+    return IndexedPriorityQueueWithFIFO(key=lambda plan: plan.site_id)
+
+
+def drain(plan_queue) -> list[str]:
+    site_ids = []
+    while not plan_queue.empty():
+        _, _, plan = plan_queue.get()
+        site_ids.append(plan.site_id)
+    return site_ids
+
+
+def remove_by_draining(plan_queue: PriorityQueueWithFIFO, site_id: str):
+    """Reference lookup, rebuilding the queue without the plan of the given site"""
+    new_queue = PriorityQueueWithFIFO()
+    target_plan = None
+    while not plan_queue.empty():
+        prio, _, plan = plan_queue.get()
+        if plan.site_id == site_id:
+            target_plan = plan
+        else:
+            new_queue.put(prio, plan)
+    return new_queue, target_plan
+
+
+def test_000_equal_priorities_are_first_in_first_out():
+    plan_queue = gen_queue()
+    for site_id, prio in [("a", (3, 1.0)), ("b", (2, 5.0)), ("c", (3, 1.0)), ("d", (2, 5.0))]:
+        plan_queue.put(prio, Plan(site_id))
+    assert drain(plan_queue) == ["b", "d", "a", "c"]
+
+
+def test_000_remove_returns_plan_and_keeps_order_of_others():
+    plan_queue = gen_queue()
+    plans = [Plan(site_id) for site_id in "abcde"]
+    for plan in plans:
+        plan_queue.put((3, 0.0), plan)
+    assert plan_queue.remove("c") is plans[2]
+    assert "c" not in plan_queue
+    assert plan_queue.remove("c") is None
+    assert len(plan_queue) == 4
+    assert drain(plan_queue) == ["a", "b", "d", "e"]
+
+
+def test_000_put_with_queued_key_replaces_entry():
+    plan_queue = gen_queue()
+    plan_queue.put((3, 0.0), Plan("a"))
+    plan_queue.put((3, 0.0), Plan("b"))
+    plan_queue.put((2, 0.0), Plan("a"))
+    assert plan_queue.qsize() == 2
+    assert drain(plan_queue) == ["a", "b"]
+
+
+def test_000_get_from_empty_queue_raises():
+    plan_queue = gen_queue()
+    plan_queue.put((3, 0.0), Plan("a"))
+    plan_queue.remove("a")
+    assert plan_queue.empty()
+    with pytest.raises(IndexError):
+        plan_queue.get()
+
+
+def test_000_matches_draining_lookup_for_random_operations():
+    rng = random.Random(0)
+    indexed_queue = gen_queue()
+    reference_queue = PriorityQueueWithFIFO()
+    queued: set[str] = set()
+    for step in range(3000):
+        operation = rng.random()
+        if operation < 0.5 or not queued:
+            site_id = f"site_{step}"
+            prio = (rng.randint(1, 3), rng.choice([0.0, 1.0, 2.5]))
+            indexed_queue.put(prio, Plan(site_id))
+            reference_queue.put(prio, Plan(site_id))
+            queued.add(site_id)
+        elif operation < 0.8:
+            site_id = rng.choice(sorted(queued))
+            plan = indexed_queue.remove(site_id)
+            reference_queue, reference_plan = remove_by_draining(reference_queue, site_id)
+            assert plan.site_id == reference_plan.site_id == site_id
+            prio = (rng.randint(1, 3), rng.choice([0.0, 1.0, 2.5]))
+            indexed_queue.put(prio, plan)
+            reference_queue.put(prio, reference_plan)
+        else:
+            _, _, plan = indexed_queue.get()
+            _, _, reference_plan = reference_queue.get()
+            assert plan.site_id == reference_plan.site_id
+            queued.remove(plan.site_id)
+    assert drain(indexed_queue) == drain(reference_queue)
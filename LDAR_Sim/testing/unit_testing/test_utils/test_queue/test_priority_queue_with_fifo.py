@@ -0,0 +1,59 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_priority_queue_with_fifo.py
+Purpose: Contains unit tests for the PriorityQueueWithFIFO class.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import queue
+import random
+
+import pytest
+
+from utils.queue import PriorityQueueWithFIFO
+
+
+def test_000_equal_priorities_are_first_in_first_out():
+    test_queue = PriorityQueueWithFIFO()
+    for item in ["a", "b", "c"]:
+        test_queue.put(1, item)
+    test_queue.put(0, "d")
+    assert test_queue.qsize() == 4
+    assert [test_queue.get()[2] for _ in range(4)] == ["d", "a", "b", "c"]
+    assert test_queue.empty()
+
+
+def test_000_get_from_empty_queue_raises():
+    with pytest.raises(IndexError):
+        PriorityQueueWithFIFO().get()
+
+
+def test_000_matches_queue_priority_queue_order():
+    rng = random.Random(0)
+    test_queue = PriorityQueueWithFIFO()
+    reference_queue = queue.PriorityQueue()
+    put_count = 0
+    for _ in range(1000):
+        if rng.random() < 0.4 and not test_queue.empty():
+            assert test_queue.get() == reference_queue.get()
+        else:
+            priority = (rng.randint(0, 3), rng.randint(0, 3))
+            test_queue.put(priority, f"item_{put_count}")
+            reference_queue.put((priority, put_count, f"item_{put_count}"))
+            put_count += 1
+    while not test_queue.empty():
+        assert test_queue.get() == reference_queue.get()
+    assert reference_queue.empty()
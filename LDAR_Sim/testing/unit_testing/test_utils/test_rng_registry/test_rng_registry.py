@@ -0,0 +1,88 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_rng_registry.py
+Purpose: Contains unit tests for the RNG registry.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import pickle
+
+import numpy as np
+
+from constants.general_const import RNG_Purposes
+from utils.rng_registry import RNGRegistry, get_rng
+
+ENTROPY = 123456789
+
+
+def draw(registry: RNGRegistry, purpose: str = RNG_Purposes.SENSOR_DETECTION) -> np.ndarray:
+    return registry.generator(purpose).random(5)
+
+
+def test_000_same_entropy_and_keys_give_same_stream():
+    first = RNGRegistry(ENTROPY).spawn(3, "P_OGI", "OGI")
+    second = RNGRegistry(ENTROPY).spawn(3, "P_OGI", "OGI")
+    np.testing.assert_array_equal(draw(first), draw(second))
+
+
+def test_000_streams_do_not_depend_on_spawn_order():
+    registry = RNGRegistry(ENTROPY)
+    sim_1_first = draw(registry.spawn(1))
+    draw(registry.spawn(0))
+
+    registry = RNGRegistry(ENTROPY)
+    draw(registry.spawn(0))
+    sim_1_second = draw(registry.spawn(1))
+    np.testing.assert_array_equal(sim_1_first, sim_1_second)
+
+
+def test_000_keys_and_purposes_give_distinct_streams():
+    registry = RNGRegistry(ENTROPY)
+    streams = [
+        draw(registry.spawn(0)),
+        draw(registry.spawn(1)),
+        draw(registry.spawn(0, "P_OGI")),
+        draw(registry.spawn(0, "P_air")),
+        draw(registry.spawn(0), RNG_Purposes.QUANTIFICATION),
+    ]
+    for i, stream in enumerate(streams):
+        for other in streams[i + 1 :]:
+            assert not np.array_equal(stream, other)
+
+
+def test_000_generator_is_shared_for_a_purpose():
+    registry = RNGRegistry(ENTROPY)
+    assert registry.generator(RNG_Purposes.COVERAGE) is registry.generator(RNG_Purposes.COVERAGE)
+
+
+def test_000_pickled_registry_gives_same_streams():
+    registry = RNGRegistry(ENTROPY).spawn(2, "P_OGI")
+    unpickled = pickle.loads(pickle.dumps(registry))
+    assert unpickled.spawn_key == registry.spawn_key
+    np.testing.assert_array_equal(draw(registry), draw(unpickled))
+
+
+def test_000_registry_streams_leave_global_state_untouched():
+    np.random.seed(0)
+    state_before = np.random.get_state()[1].copy()
+    draw(RNGRegistry(ENTROPY).spawn(0))
+    np.testing.assert_array_equal(state_before, np.random.get_state()[1])
+
+
+def test_000_get_rng_falls_back_to_global_state():
+    assert get_rng(None) is np.random
+    generator = np.random.default_rng(0)
+    assert get_rng(generator) is generator
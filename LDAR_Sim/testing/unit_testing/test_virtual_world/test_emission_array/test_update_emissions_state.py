@@ -0,0 +1,162 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_update_emissions_state.py
+Purpose: Contains unit tests for testing the columnar emission array against the
+object based emissions update.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+import random
+
+import numpy as np
+import pytest
+
+from file_processing.input_processing.input_manager import InputManager
+from file_processing.output_processing.output_utils import EmisInfo, TsEmisData
+from scheduling.schedule_dataclasses import TaggingInfo
+from simulation.simulation_helpers import simulate
+from simulation.simulation_manager import SimulationManager
+from virtual_world.component import Component
+from virtual_world.emission_array import EmissionArray
+from virtual_world.emission_types.emission import Emission
+from virtual_world.emission_types.non_repairable_emissions import NonRepairableEmission
+from virtual_world.emission_types.repairable_emission import RepairableEmission
+
+SIM_START = date(2020, 1, 1)
+LDAR_SIM_ROOT = Path(__file__).resolve().parents[4]
+
+
+def mock_component_initialization(self, emissions: list[Emission]):
+    self._component_ID = "test"
+    self._active_emissions = emissions
+    self._inactive_emissions = []
+    self._emis_array = None
+    self._comp_order = None
+
+
+def gen_emissions() -> list[Emission]:
+    emissions: list[Emission] = []
+    for i in range(20):
+        if i % 4 == 3:
+            emission = NonRepairableEmission(
+                i, 0.5 + i, SIM_START - timedelta(days=i), SIM_START, False, {}, {}, duration=30
+            )
+        else:
+            emission = RepairableEmission(
+                i,
+                1.0 + i,
+                SIM_START - timedelta(days=2 * i),
+                SIM_START,
+                True,
+                {},
+                {},
+                repair_delay=i % 5,
+                repair_cost=100.0 + i,
+                nrd=40,
+            )
+        emission.activate(SIM_START)
+        emissions.append(emission)
+    return emissions
+
+
+def run_days(components: list[Component], update) -> list[tuple]:
+    results: list[tuple] = []
+    for day in range(45):
+        if day in (2, 9):
+            tagging_info = TaggingInfo(
+                measured_rate=10.0,
+                curr_date=SIM_START + timedelta(days=day),
+                t_since_LDAR=day,
+                company="test",
+                crew="crew",
+                report_delay=1,
+            )
+            components[day % 2].tag_emissions(tagging_info)
+        emis_rep_info = EmisInfo()
+        emis_data = TsEmisData()
+        update(emis_rep_info, emis_data)
+        results.append((emis_rep_info, emis_data))
+    return results
+
+
+def test_000_emission_array_matches_object_update(monkeypatch):
+    monkeypatch.setattr("virtual_world.component.Component.__init__", mock_component_initialization)
+    object_emissions: list[Emission] = gen_emissions()
+    array_emissions: list[Emission] = gen_emissions()
+    object_comps = [Component(object_emissions[:10]), Component(object_emissions[10:])]
+    array_comps = [Component(array_emissions[:10]), Component(array_emissions[10:])]
+
+    def object_update(emis_rep_info, emis_data):
+        for comp in object_comps:
+            comp.update_emissions_state(emis_rep_info, emis_data)
+
+    emis_array = EmissionArray()
+    for order, comp in enumerate(array_comps):
+        comp.set_emission_array(emis_array, order)
+
+    object_results = run_days(object_comps, object_update)
+    array_results = run_days(array_comps, emis_array.update_emissions_state)
+    emis_array.sync_emissions()
+
+    for (object_rep_info, object_emis), (array_rep_info, array_emis) in zip(
+        object_results, array_results
+    ):
+        assert object_rep_info == array_rep_info
+        assert object_emis.active_leaks == array_emis.active_leaks
+        assert object_emis.daily_emis == pytest.approx(array_emis.daily_emis)
+        assert object_emis.daily_emis_mit == pytest.approx(array_emis.daily_emis_mit)
+        assert object_emis.daily_emis_non_mit == pytest.approx(array_emis.daily_emis_non_mit)
+    for object_comp, array_comp in zip(object_comps, array_comps):
+        for attr in ("_active_emissions", "_inactive_emissions"):
+            object_summaries = [
+                emis.get_summary_dict(SIM_START) for emis in getattr(object_comp, attr)
+            ]
+            array_summaries = [
+                emis.get_summary_dict(SIM_START) for emis in getattr(array_comp, attr)
+            ]
+            assert object_summaries == array_summaries
+
+
+def run_simple_test_case(out_dir: Path, columnar_emissions: bool) -> str:
+    parameter_files = list((LDAR_SIM_ROOT / "simulations" / "simple_test_case1").glob("*.yaml"))
+    sim_manager = SimulationManager(InputManager(), parameter_files)
+    sim_manager.virtual_world["consider_weather"] = False
+    sim_manager.virtual_world["end_date"] = [2018, 12, 31]
+    sim_manager.sim_end_date = date(2018, 12, 31)
+    sim_manager.simulation_count = 1
+    sim_manager.sim_params["columnar_emissions"] = columnar_emissions
+    sim_manager.out_dir = out_dir
+    sim_manager.generator_dir = out_dir / "generator"
+    sim_manager.initialize_outputs(InputManager(), write_parameters=False)
+    np.random.seed(0)
+    random.seed(0)
+    sim_manager.check_generator_files()
+    sim_manager.setup_infrastructure()
+    sim_manager.setup_emissions()
+    sim_manager.setup_daylight()
+    for program_data in sim_manager._setup_programs(0):
+        if program_data[3] == "P_OGI":
+            simulate(*program_data)
+    return (out_dir / "P_OGI" / "P_OGI_0_timeseries.csv").read_text()
+
+
+def test_000_columnar_emissions_timeseries_matches_object_emissions(tmp_path, monkeypatch):
+    monkeypatch.chdir(LDAR_SIM_ROOT)
+    object_timeseries = run_simple_test_case(tmp_path / "object", columnar_emissions=False)
+    columnar_timeseries = run_simple_test_case(tmp_path / "columnar", columnar_emissions=True)
+    assert object_timeseries == columnar_timeseries
@@ -0,0 +1,54 @@
+import pickle
+from datetime import date
+
+import pytest
+
+from virtual_world.emission_types.emission import Emission
+from virtual_world.emission_types.intermittent_non_repairable_emission import (
+    IntermittentNonRepairableEmission,
+)
+from virtual_world.emission_types.intermittent_repairable_emission import (
+    IntermittentRepairableEmission,
+)
+from virtual_world.emission_types.non_repairable_emissions import NonRepairableEmission
+from virtual_world.emission_types.repairable_emission import RepairableEmission
+
+SIM_START = date(2020, 1, 1)
+START_DATE = date(2019, 12, 1)
+COVS = {"M_OGI": 1.0}
+
+
+def gen_emissions() -> list[Emission]:
+    return [
+        RepairableEmission(1, 0.5, START_DATE, SIM_START, True, COVS, COVS, 14, 200.0, 365),
+        NonRepairableEmission(2, 0.5, START_DATE, SIM_START, False, COVS, COVS, 365),
+        IntermittentRepairableEmission(
+            3, 0.5, START_DATE, SIM_START, True, COVS, COVS, 14, 200.0, 365, 2, 5
+        ),
+        IntermittentNonRepairableEmission(
+            4, 0.5, START_DATE, SIM_START, False, COVS, COVS, 365, 2, 5
+        ),
+    ]
+
+
+@pytest.mark.parametrize("emission", gen_emissions())
+def test_000_emissions_have_no_instance_dictionary(emission: Emission) -> None:
+    assert not hasattr(emission, "__dict__")
+
+
+@pytest.mark.parametrize("emission", gen_emissions())
+def test_000_pickled_emissions_keep_their_state(emission: Emission) -> None:
+    emission.activate(SIM_START)
+    emission.check_spatial_cov("M_OGI")
+    unpickled: Emission = pickle.loads(pickle.dumps(emission))
+    assert type(unpickled) is type(emission)
+    assert unpickled._get_state() == emission._get_state()
+    end_date = date(2020, 12, 31)
+    assert unpickled.get_summary_dict(end_date) == emission.get_summary_dict(end_date)
+
+
+@pytest.mark.parametrize("emission", gen_emissions())
+def test_000_emissions_pickled_with_a_dictionary_are_restored(emission: Emission) -> None:
+    state: dict = dict(zip(emission._STATE_SLOTS, emission._get_state()))
+    reconstructed: Emission = emission._reconstruct_emissions(state)
+    assert reconstructed._get_state() == emission._get_state()
@@ -59,6 +59,7 @@ def mock_non_rep_emission_init(self, *args, **kwargs):
 
 def mock_equipment_init(self, *args, **kwargs):
     self._active_emissions = kwargs["emissions"] if kwargs else []
+    self._emis_array = None
 
 
 def setup_mock_equipment(mocker):
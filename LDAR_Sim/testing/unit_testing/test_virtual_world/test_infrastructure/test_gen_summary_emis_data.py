@@ -0,0 +1,107 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_gen_summary_emis_data.py
+Purpose: Contains unit tests for testing the gen_summary_emis_data method in the
+Infrastructure class.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, timedelta
+
+import pandas as pd
+
+from constants.output_file_constants import (
+    EMIS_DATA_COL_ACCESSORS as eca,
+    EMIS_DATA_FINAL_COL_ORDER,
+)
+from file_processing.output_processing.output_utils import EmisInfo
+from virtual_world.component import Component
+from virtual_world.emission_types.non_repairable_emissions import NonRepairableEmission
+from virtual_world.emission_types.repairable_emission import RepairableEmission
+from virtual_world.equipment_groups import Equipment_Group
+from virtual_world.infrastructure import Infrastructure
+from virtual_world.sites import Site
+
+SIM_START = date(2020, 1, 1)
+SIM_END = date(2020, 12, 31)
+
+
+def gen_component(comp_number: int) -> Component:
+    active, inactive = [], []
+    for i in range(4):
+        start_date = SIM_START - timedelta(days=10 * i)
+        if i % 2:
+            emission = NonRepairableEmission(
+                i, 0.25 * i, start_date, SIM_START, False, {}, {}, duration=25
+            )
+        else:
+            emission = RepairableEmission(
+                i, 1.0 + i, start_date, SIM_START, True, {}, {}, 0, 100.0, nrd=365
+            )
+            emission.tag_leak(2.0, SIM_START, 5, "test", "crew", 0)
+        emission.activate(SIM_START)
+        emission.update(EmisInfo())
+        (inactive if i == 3 else active).append(emission)
+    return Component._reconstruct("comp", f"comp_{comp_number}", [], active, inactive, {})
+
+
+def gen_infrastructure() -> Infrastructure:
+    sites = []
+    for site_number in range(2):
+        eqgs = [
+            Equipment_Group._reconstruct(eqg, {}, {}, [gen_component(0), gen_component(1)])
+            for eqg in range(2)
+        ]
+        sites.append(
+            Site._reconstruct(
+                str(site_number), 0, 0, 0, 0, eqgs, {}, {}, {}, "type", SIM_START, {}, {}
+            )
+        )
+    return Infrastructure._reconstruct({}, None, sites)
+
+
+def gen_expected_emis_data(infrastructure: Infrastructure) -> pd.DataFrame:
+    # Summary as built before, with one .loc assignment per emission
+    rows = []
+    for site in infrastructure._sites:
+        for eqg in site._equipment_groups:
+            for comp in eqg._component:
+                for emission in comp._active_emissions + comp._inactive_emissions:
+                    summary_dict = emission.get_summary_dict(SIM_END)
+                    summary_dict.update(
+                        {eca.SITE_ID: site.get_id(), eca.EQG: eqg.get_id(), eca.COMP: comp.get_id()}
+                    )
+                    rows.append(summary_dict)
+    emis_df = pd.DataFrame(columns=EMIS_DATA_FINAL_COL_ORDER, index=range(len(rows)))
+    for row_index, summary_dict in enumerate(rows):
+        emis_df.loc[row_index] = summary_dict
+    # Emission IDs are kept as int64 until the summary is written
+    emis_df[eca.EMIS_ID] = emis_df[eca.EMIS_ID].astype("int64")
+    return emis_df
+
+
+def test_000_gen_summary_emis_data_matches_row_by_row_construction():
+    infrastructure = gen_infrastructure()
+    expected = gen_expected_emis_data(infrastructure)
+
+    emis_df = infrastructure.gen_summary_emis_data(SIM_END)
+
+    assert list(emis_df.columns) == EMIS_DATA_FINAL_COL_ORDER
+    assert emis_df.dtypes.equals(expected.dtypes)
+    pd.testing.assert_frame_equal(emis_df, expected)
+    assert emis_df.to_csv(index=False, float_format="%.5f") == expected.to_csv(
+        index=False, float_format="%.5f"
+    )
@@ -0,0 +1,148 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_program_copy.py
+Purpose: Contains unit tests for testing the program_copy method in the
+Infrastructure class.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date, timedelta
+
+from file_processing.output_processing.output_utils import EmisInfo
+from scheduling.schedule_dataclasses import TaggingInfo
+from virtual_world.component import Component
+from virtual_world.emission_types.repairable_emission import RepairableEmission
+from virtual_world.equipment_groups import Equipment_Group
+from virtual_world.infrastructure import Infrastructure
+from virtual_world.sites import Site
+from virtual_world.sources import Source
+
+SIM_START = date(2020, 1, 1)
+SIM_NUMBER = 0
+
+
+def gen_infrastructure() -> Infrastructure:
+    emissions = [
+        RepairableEmission(
+            i,
+            1.0 + i,
+            SIM_START + timedelta(days=i),
+            SIM_START,
+            True,
+            {"M_OGI": 1.0},
+            {"M_OGI": 1.0},
+            repair_delay=30,
+            repair_cost=100.0,
+            nrd=365,
+        )
+        for i in range(5)
+    ]
+    # Sources pop emissions from the end of the queue as they activate
+    emissions.reverse()
+    source = Source._reconstruct(
+        "source",
+        True,
+        True,
+        1,
+        0,
+        True,
+        {SIM_NUMBER: emissions},
+        None,
+        None,
+        None,
+        {"M_OGI": 1.0},
+        None,
+        None,
+        None,
+        "repairable",
+    )
+    component = Component._reconstruct("comp", "comp_0", [source], [], [], {})
+    equipment_group = Equipment_Group._reconstruct(
+        "eqg", {"M_OGI": 60}, {"M_OGI": 100}, [component]
+    )
+    site = Site._reconstruct(
+        "site", 50.0, -114.0, 50.0, -114.0, [equipment_group], {}, {}, {}, "type", SIM_START, {}, {}
+    )
+    return Infrastructure._reconstruct({}, None, [site])
+
+
+def run_program(infrastructure: Infrastructure, tag: bool) -> None:
+    site: Site = infrastructure._sites[0]
+    for day in range(5):
+        curr_date = SIM_START + timedelta(days=day)
+        infrastructure.activate_emissions(curr_date, SIM_NUMBER)
+        if tag and day == 2:
+            site.set_latest_tagging_survey_date(curr_date)
+            site.tag_emissions_at_component(
+                "eqg",
+                "comp_0",
+                TaggingInfo(
+                    measured_rate=6.0,
+                    curr_date=curr_date,
+                    t_since_LDAR=2,
+                    company="OGI company",
+                    crew="crew_1",
+                    report_delay=0,
+                ),
+            )
+        infrastructure.update_emissions_state(EmisInfo())
+
+
+def get_component(infrastructure: Infrastructure) -> Component:
+    return infrastructure._sites[0]._equipment_groups[0]._component[0]
+
+
+def test_000_programs_do_not_share_tagging_state():
+    infrastructure: Infrastructure = gen_infrastructure()
+    tagging_program: Infrastructure = infrastructure.program_copy()
+    other_program: Infrastructure = infrastructure.program_copy()
+
+    run_program(tagging_program, tag=True)
+    run_program(other_program, tag=False)
+
+    tagged = [emis._tagged for emis in get_component(tagging_program)._active_emissions]
+    assert tagged == [True, True, True, False, False]
+    other_comp: Component = get_component(other_program)
+    assert len(other_comp._active_emissions) == 5
+    assert not any(emis._tagged for emis in other_comp._active_emissions)
+    assert not any(emis._init_detect_by for emis in other_comp._active_emissions)
+    assert other_program._sites[0].get_latest_tagging_survey_date() == SIM_START
+    assert tagging_program._sites[0].get_latest_tagging_survey_date() == SIM_START + timedelta(
+        days=2
+    )
+
+    # The original infrastructure is left untouched for the next program
+    original_comp: Component = get_component(infrastructure)
+    assert original_comp._active_emissions == []
+    original_queue = original_comp._sources[0]._generated_emissions[SIM_NUMBER]
+    assert len(original_queue) == 5
+    assert not any(emis._tagged or emis._active_days for emis in original_queue)
+
+
+def test_001_program_copy_shares_static_properties():
+    infrastructure: Infrastructure = gen_infrastructure()
+    program_infra: Infrastructure = infrastructure.program_copy()
+    site, program_site = infrastructure._sites[0], program_infra._sites[0]
+    assert program_site is not site
+    assert program_site._survey_frequencies is site._survey_frequencies
+    eqg, program_eqg = site._equipment_groups[0], program_site._equipment_groups[0]
+    assert program_eqg is not eqg
+    assert program_eqg._meth_survey_times is eqg._meth_survey_times
+    source: Source = get_component(infrastructure)._sources[0]
+    program_source: Source = get_component(program_infra)._sources[0]
+    assert program_source is not source
+    assert program_source._meth_spat_covs is source._meth_spat_covs
+    assert program_source._generated_emissions is not source._generated_emissions
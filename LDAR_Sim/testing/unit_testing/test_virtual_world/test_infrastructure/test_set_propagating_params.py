@@ -1,8 +1,8 @@
 """
 ------------------------------------------------------------------------------
 Program:     The LDAR Simulator (LDAR-Sim)
-File:        test_update_propagating_params
-Purpose: Contains unit tests for updating the propagating parameters
+File:        test_set_propagating_params
+Purpose: Contains unit tests for setting the propagating parameters of a site
 
 This program is free software: you can redistribute it and/or modify
 it under the terms of the MIT License as published
@@ -122,13 +122,17 @@ def generate_test_data(draw):
 
 
 @given(generate_test_data())
-def test_000_generate_propagating_params_correctly_updates_prop_params_dict_w_only_ints(
+def test_000_set_propagating_params_correctly_updates_prop_params_dict_w_only_ints(
     inputs: Tuple[list[str], dict, pd.Series, pd.Series]
 ):
     methods, prop_params, site_info, site_type_info = inputs
     result = copy.deepcopy(prop_params)
-    infra = Infrastructure.__new__(Infrastructure)
-    infra.update_propagating_params(result, site_info, site_type_info, methods)
+    param_sources = Infrastructure._get_propagating_param_sources(
+        site_info.index.to_list(), site_type_info.index.to_list(), methods
+    )
+    Infrastructure._set_propagating_params(
+        result, param_sources, site_info.to_numpy(), site_type_info.to_numpy()
+    )
     meth_spec_prop_params = prop_params.pop(cp.METH_SPECIFIC)
 
     for param in prop_params:
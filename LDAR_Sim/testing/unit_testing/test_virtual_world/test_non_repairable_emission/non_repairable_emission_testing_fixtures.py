@@ -47,7 +47,7 @@ def mock_simple_emission_for_get_summary_dict_1_fix() -> (
             365,
         ),
         {
-            "Emissions ID": "0000000001",
+            "Emissions ID": 1,
             "Status": ec.INACTIVE,
             "Days Active": 0,
             "Days Emitting": 0,
@@ -99,7 +99,7 @@ def test_000_record_correctly_calls_estimate_start_days(
     ],
 ) -> None:
     nonrep_emis: NonRepairableEmission = mock_simple_nonfugitive_emission_for_record_testing_1[0]
-    mocker.patch.object(nonrep_emis, "estimate_start_date")
+    mocker.patch.object(NonRepairableEmission, "estimate_start_date")
     (
         measured_rate,
         cur_date,
@@ -0,0 +1,140 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_pregenerated_emissions.py
+Purpose: Contains unit tests for the columnar file format of the pregenerated
+emissions and the queues that create emissions from its rows.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date
+from pathlib import Path
+import pickle
+
+import numpy as np
+
+from virtual_world.emission_types.emission import Emission
+from virtual_world.emission_types.intermittent_non_repairable_emission import (
+    IntermittentNonRepairableEmission,
+)
+from virtual_world.emission_types.intermittent_repairable_emission import (
+    IntermittentRepairableEmission,
+)
+from virtual_world.emission_types.non_repairable_emissions import NonRepairableEmission
+from virtual_world.emission_types.repairable_emission import RepairableEmission
+from virtual_world.pregenerated_emissions import (
+    PregeneratedEmissions,
+    gen_emission_rows,
+    iter_source_rows,
+)
+
+SIM_START = date(2020, 1, 1)
+SPAT_COVS = {"M_OGI": 1.0}
+TEMP_COVS = {"M_OGI": 0.5}
+REPAIR_COSTS = [100.0, 200.0]
+
+
+def gen_source_emissions() -> list[list[Emission]]:
+    """Emissions of four sources, in the order they are numbered"""
+    return [
+        [
+            RepairableEmission(
+                0, 0.5, date(2019, 12, 1), SIM_START, True, SPAT_COVS, TEMP_COVS, 14, 200.0, 365
+            ),
+            RepairableEmission(
+                1, 0.7, date(2020, 3, 1), SIM_START, True, SPAT_COVS, TEMP_COVS, 7, 200.0, 365
+            ),
+        ],
+        [
+            IntermittentRepairableEmission(
+                0, 0.5, SIM_START, SIM_START, True, SPAT_COVS, TEMP_COVS, 14, REPAIR_COSTS, 30, 2, 5
+            ),
+        ],
+        [],
+        [
+            NonRepairableEmission(
+                0, 0.25, date(2020, 2, 1), SIM_START, False, SPAT_COVS, TEMP_COVS, 30
+            ),
+            IntermittentNonRepairableEmission(
+                1, 0.1, date(2020, 6, 1), SIM_START, False, SPAT_COVS, TEMP_COVS, 365, 3, 4
+            ),
+        ],
+    ]
+
+
+def gen_emissions_dict(source_emissions: list[list[Emission]]) -> dict:
+    # Two sites, the second with two equipment groups, and queues in reverse as generated
+    def queue(emissions: list[Emission]) -> list[Emission]:
+        return list(reversed(emissions))
+
+    return {
+        "site_1": {0: {"comp_1": {"src_1": queue(source_emissions[0])}}},
+        "site_2": {
+            0: {"comp_1": {"src_1": queue(source_emissions[1]), "src_2": []}},
+            1: {"comp_2": {"src_1": queue(source_emissions[3])}},
+        },
+    }
+
+
+def gen_queues(emission_rows: np.ndarray) -> list[PregeneratedEmissions]:
+    source_rows = iter_source_rows(emission_rows)
+    return [
+        PregeneratedEmissions(next(source_rows), SIM_START, SPAT_COVS, TEMP_COVS, REPAIR_COSTS)
+        for _ in range(5)
+    ]
+
+
+def test_000_rows_are_numbered_by_infrastructure_level() -> None:
+    emission_rows: np.ndarray = gen_emission_rows(
+        gen_emissions_dict(gen_source_emissions()), SIM_START
+    )
+    assert emission_rows["site"].tolist() == [0, 0, 1, 1, 1]
+    assert emission_rows["equipment_group"].tolist() == [0, 0, 1, 2, 2]
+    assert emission_rows["component"].tolist() == [0, 0, 1, 2, 2]
+    assert emission_rows["source"].tolist() == [0, 0, 1, 3, 3]
+    assert emission_rows["emission_id"].tolist() == [0, 1, 0, 0, 1]
+    assert emission_rows["start_day"].tolist() == [-31, 60, 0, 31, 152]
+    assert emission_rows["persistent"].tolist() == [True, True, False, True, False]
+    assert np.isnan(emission_rows["repair_cost"][2])
+
+
+def test_000_queues_create_the_emissions_from_memory_mapped_rows(tmp_path: Path) -> None:
+    source_emissions: list[list[Emission]] = gen_source_emissions()
+    rows_file: Path = tmp_path / "emissions.npy"
+    np.save(rows_file, gen_emission_rows(gen_emissions_dict(source_emissions), SIM_START))
+    queues = gen_queues(np.load(rows_file, mmap_mode="r"))
+
+    for emissions, queue in zip(source_emissions + [[]], queues):
+        assert len(queue) == len(emissions)
+        for emission in emissions:
+            created: Emission = queue.pop()
+            assert type(created) is type(emission)
+            assert created._get_state() == emission._get_state()
+        assert not queue
+
+
+def test_000_program_copies_and_pickles_keep_their_own_position() -> None:
+    emission_rows: np.ndarray = gen_emission_rows(
+        gen_emissions_dict(gen_source_emissions()), SIM_START
+    )
+    queue: PregeneratedEmissions = gen_queues(emission_rows)[0]
+    queue.pop()
+    program_queue: PregeneratedEmissions = queue.program_copy()
+    unpickled: PregeneratedEmissions = pickle.loads(pickle.dumps(queue))
+
+    assert queue.pop()._emissions_id == 1
+    assert len(queue) == 0
+    assert len(program_queue) == len(unpickled) == 1
+    assert program_queue.pop()._get_state() == unpickled.pop()._get_state()
@@ -0,0 +1,64 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_propagating_params_layers.py
+Purpose: Contains unit tests for the layers of the propagating parameters.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import pickle
+
+from constants.param_default_const import Common_Params as cp
+from virtual_world.propagating_params import copy_propagating_params, set_method_specific_param
+
+
+def prop_params() -> dict:
+    return {
+        "repairable_emissions_production_rate": 0.01,
+        "repairable_repair_delay": {"val": [14]},
+        cp.METH_SPECIFIC: {
+            "spatial": {"M_OGI": 1.0, "M_aircraft": 0.5},
+            "survey_cost": {"M_OGI": 100, "M_aircraft": 200},
+        },
+    }
+
+
+def test_000_layer_changes_do_not_change_the_parameters_above() -> None:
+    parent: dict = prop_params()
+    layer: dict = copy_propagating_params(parent)
+    layer["repairable_emissions_production_rate"] = 0.02
+    layer["emissions_production_rate"] = 0.02
+    set_method_specific_param(layer[cp.METH_SPECIFIC], "spatial", "M_OGI", 0.25)
+    layer[cp.METH_SPECIFIC].pop("survey_cost")
+
+    assert parent == prop_params()
+    assert layer[cp.METH_SPECIFIC]["spatial"] == {"M_OGI": 0.25, "M_aircraft": 0.5}
+
+
+def test_000_layer_shares_the_values_it_does_not_override() -> None:
+    parent: dict = prop_params()
+    layer: dict = copy_propagating_params(parent)
+    set_method_specific_param(layer[cp.METH_SPECIFIC], "spatial", "M_OGI", 0.25)
+
+    assert layer["repairable_repair_delay"] is parent["repairable_repair_delay"]
+    assert layer[cp.METH_SPECIFIC]["survey_cost"] is parent[cp.METH_SPECIFIC]["survey_cost"]
+    assert layer[cp.METH_SPECIFIC]["spatial"] is not parent[cp.METH_SPECIFIC]["spatial"]
+
+
+def test_000_shared_values_are_pickled_once() -> None:
+    parent: dict = prop_params()
+    layers: list[dict] = [copy_propagating_params(parent) for _ in range(10)]
+    deep_copies: list[dict] = [prop_params() for _ in range(10)]
+    assert len(pickle.dumps(layers)) < len(pickle.dumps(deep_copies))
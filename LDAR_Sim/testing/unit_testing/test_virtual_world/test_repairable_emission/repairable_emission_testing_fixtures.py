@@ -69,7 +69,7 @@ def mock_simple_emission_for_get_summary_dict_1_fix() -> Tuple[RepairableEmissio
             365,
         ),
         {
-            "Emissions ID": "0000000001",
+            "Emissions ID": 1,
             "Status": ec.INACTIVE,
             "Days Active": 0,
             "Days Emitting": 0,
@@ -76,7 +76,7 @@ def test_000_tag_leak_correctly_calls_estimate_start_days(
     ],
 ) -> None:
     fug_emis: RepairableEmission = mock_simple_fugitive_emission_for_tag_leak_testing_1[0]
-    mocker.patch.object(fug_emis, "estimate_start_date")
+    mocker.patch.object(RepairableEmission, "estimate_start_date")
     (
         measured_rate,
         cur_date,
@@ -83,10 +83,6 @@ def get_mock_propagating_params_and_expected_equipment_split(
     )
 
 
-def mock_equipment_group_init(self, id, infrastructure_inputs, prop_params, info):
-    self.propagating_params = prop_params
-
-
 def test_000_simple_site_is_properly_constructed(
     mock_values_for_simple_site_construction: Tuple[str, float, float, int, dict, dict]
 ):
@@ -109,6 +105,13 @@ def test_000_simple_site_is_properly_constructed(
 def test_000_site_properties_properly_split_among_equipment_groups(
     monkeypatch, mock_values_for_simple_site_construction: Tuple[str, float, float, int, dict, dict]
 ):
+    # The propagating parameters each equipment group is created with, by equipment group ID
+    eqg_prop_params: dict[str, dict] = {}
+
+    def mock_equipment_group_init(self, id, infrastructure_inputs, prop_params, info):
+        self._id = id
+        eqg_prop_params[id] = prop_params
+
     monkeypatch.setattr(Equipment_Group, "__init__", mock_equipment_group_init)
 
     id, lat, lon, start_date, _, _, site_info, method = mock_values_for_simple_site_construction
@@ -130,4 +133,4 @@ def test_000_site_properties_properly_split_among_equipment_groups(
 
     for equip_group in test_site.equipment_groups:
         for key, param in split_params.items():
-            assert equip_group.propagating_params[key] == param
+            assert eqg_prop_params[equip_group.get_id()][key] == param
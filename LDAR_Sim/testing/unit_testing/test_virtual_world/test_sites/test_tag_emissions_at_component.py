@@ -0,0 +1,74 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_tag_emissions_at_component.py
+Purpose: Contains unit tests for tagging emissions at a component of a site
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+from datetime import date
+import pickle
+
+import pytest
+
+from virtual_world.component import Component
+from virtual_world.equipment_groups import Equipment_Group
+from virtual_world.sites import Site
+
+SIM_START = date(2020, 1, 1)
+
+
+def gen_site() -> Site:
+    equipment_groups = [
+        Equipment_Group._reconstruct(
+            f"eqg_{eqg}",
+            {},
+            {},
+            [Component._reconstruct("comp", f"comp_{comp}", [], [], [], {}) for comp in range(3)],
+        )
+        for eqg in range(3)
+    ]
+    return Site._reconstruct(
+        "site", 50.0, -114.0, 50.0, -114.0, equipment_groups, {}, {}, {}, "type", SIM_START, {}, {}
+    )
+
+
+@pytest.mark.parametrize(
+    "copy_site",
+    [
+        lambda site: site,
+        lambda site: pickle.loads(pickle.dumps(site)),
+        lambda site: site.program_copy(),
+    ],
+)
+def test_000_tag_emissions_at_component_tags_the_matching_component(mocker, copy_site):
+    tagged: list[tuple[Component, str]] = []
+    mocker.patch.object(
+        Component,
+        "tag_emissions",
+        lambda self, tagging_info: tagged.append((self, tagging_info)),
+    )
+    original_site: Site = gen_site()
+    # Tag the original site first, so that a copy using its lookups would tag its components
+    original_site.tag_emissions_at_component("eqg_0", "comp_0", "info")
+    tagged.clear()
+
+    site: Site = copy_site(original_site)
+    site.tag_emissions_at_component("eqg_1", "comp_2", "info_a")
+    site.tag_emissions_at_component("eqg_2", "comp_0", "info_b")
+    assert tagged == [
+        (site.equipment_groups[1].component[2], "info_a"),
+        (site.equipment_groups[2].component[0], "info_b"),
+    ]
@@ -0,0 +1,50 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_get_rep_delays.py
+Purpose: Contains unit tests for drawing batches of repair delays for a source.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import numpy as np
+import pandas as pd
+
+from virtual_world.sources import Source
+
+
+def gen_source(rep_delay) -> Source:
+    source = Source.__new__(Source)
+    source._emis_rep_delay = rep_delay
+    return source
+
+
+def test_000_get_rep_delays_repeats_constant_delay():
+    assert gen_source(7)._get_rep_delays(pd.DataFrame(), 3) == [7, 7, 7]
+
+
+def test_000_get_rep_delays_draws_from_list():
+    np.random.seed(0)
+    rep_delays = gen_source([1, 5, 9])._get_rep_delays(pd.DataFrame(), 300)
+    assert len(rep_delays) == 300
+    assert set(rep_delays) == {1, 5, 9}
+
+
+def test_000_get_rep_delays_draws_from_repair_delay_column():
+    repair_delay_dataframe = pd.DataFrame({"delays": [2, 4], "other": [100, 200]})
+    np.random.seed(0)
+    rep_delays = gen_source("delays")._get_rep_delays(repair_delay_dataframe, 300)
+    assert len(rep_delays) == 300
+    assert set(rep_delays) == {2, 4}
+    assert all(isinstance(delay, int) for delay in rep_delays)
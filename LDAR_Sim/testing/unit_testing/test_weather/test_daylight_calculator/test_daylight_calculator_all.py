@@ -0,0 +1,113 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_daylight_calculator_all.py
+Purpose: Contains unit tests for the per cell daylight calculation.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import pickle
+from datetime import date, datetime, timedelta
+
+import ephem
+import numpy as np
+
+from constants.file_name_constants import Generator_Files
+from virtual_world.infrastructure import Infrastructure
+from weather.daylight_calculator import DaylightCalculatorAll, calc_daylight_hours
+
+
+class MockSite:
+    def __init__(self, site_id, lat, lon):
+        self._id = site_id
+        self._lat = lat
+        self._lon = lon
+
+    def get_id(self):
+        return self._id
+
+    def get_loc(self):
+        return self._lat, self._lon
+
+    def get_weather_lat(self):
+        return self._lat
+
+    def get_weather_long(self):
+        return self._lon
+
+
+def ephem_daylight_hours(lat: float, lon: float, day: date) -> float:
+    obs = ephem.Observer()
+    obs.pressure = 0
+    obs.horizon = "-6"
+    obs.lat = str(lat)
+    obs.lon = str(lon)
+    # Local solar noon, so the sunrise and sunset are those of the same local day
+    obs.date = datetime.combine(day, datetime.min.time()) + timedelta(hours=12 - lon / 15)
+    sunrise = obs.previous_rising(ephem.Sun(), use_center=True).datetime()
+    sunset = obs.next_setting(ephem.Sun(), use_center=True).datetime()
+    return (sunset - sunrise).total_seconds() / 3600
+
+
+def test_000_daylight_hours_match_ephem():
+    lats = np.array([31.0, 51.0, 60.0, -33.9])
+    lons = np.array([-102.0, -114.0, 25.0, 151.2])
+    start_date = date(2020, 1, 1)
+    daylight_hours = calc_daylight_hours(lats, lons, start_date, 366, -6.0)
+    assert daylight_hours.shape == (366, 4)
+    for cell, (lat, lon) in enumerate(zip(lats, lons)):
+        for day in range(0, 366, 15):
+            expected = ephem_daylight_hours(lat, lon, start_date + timedelta(days=day))
+            # Within a minute
+            assert abs(daylight_hours[day, cell] - expected) < 1 / 60
+
+
+def test_000_daylight_hours_in_polar_day_and_night():
+    daylight_hours = calc_daylight_hours(
+        np.array([80.0]), np.array([0.0]), date(2020, 6, 21), 1, -6.0
+    )
+    assert daylight_hours[0, 0] == 24
+    daylight_hours = calc_daylight_hours(
+        np.array([-80.0]), np.array([0.0]), date(2020, 6, 21), 1, -6.0
+    )
+    assert daylight_hours[0, 0] == 0
+
+
+def test_000_daylight_is_looked_up_by_site_and_cached(tmp_path):
+    sites = [MockSite("1", 51.0, -114.0), MockSite("2", 31.0, -102.0), MockSite("3", 51.0, -114.0)]
+    infrastructure = Infrastructure.__new__(Infrastructure)
+    infrastructure._sites = sites
+    cell_lat_lons, site_cells = infrastructure.get_daylight_cells()
+    np.testing.assert_array_equal(cell_lat_lons, [[51.0, -114.0], [31.0, -102.0]])
+    assert site_cells == {"1": 0, "2": 1, "3": 0}
+
+    start_date, end_date = date(2020, 1, 1), date(2020, 12, 31)
+    daylight = DaylightCalculatorAll(
+        cell_lat_lons, site_cells, start_date, end_date, cache_dir=tmp_path
+    )
+    assert daylight.daylight_hours.shape == (366, 2)
+    june = date(2020, 6, 21)
+    assert daylight.get_daylight(june, sites[0]) > daylight.get_daylight(june, sites[1])
+    assert daylight.get_daylight(june, sites[2]) == daylight.get_daylight(june, sites[0])
+    june_day = (june - start_date).days
+    assert daylight.get_daylight(june) == np.mean(daylight.daylight_hours[june_day])
+    unpickled = pickle.loads(pickle.dumps(daylight))
+    assert unpickled.get_daylight(june, sites[1]) == daylight.get_daylight(june, sites[1])
+
+    cache_files = list(tmp_path.glob(Generator_Files.DAYLIGHT_FILE.format(key="*")))
+    assert len(cache_files) == 1
+    np.save(cache_files[0], daylight.daylight_hours + 1)
+    cached = DaylightCalculatorAll(cell_lat_lons, site_cells, start_date, end_date, tmp_path)
+    np.testing.assert_array_equal(cached.daylight_hours, daylight.daylight_hours + 1)
@@ -0,0 +1,114 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_day_index.py
+Purpose: Contains unit tests for matching simulation dates to the days of the weather file.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import pickle
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pytest
+from netCDF4 import Dataset
+
+from weather.weather_lookup import WeatherLookup
+from testing.unit_testing.test_weather.test_weather_lookup.test_share_arrays import (
+    WEATHER_FILE,
+    write_weather_file,
+)
+
+CALENDAR_WEATHER_FILE = "weather_calendar_test.nc"
+WEATHER_ENVS = {"temperature": [-100, 0], "wind": [0, 6], "precipitation": [0, 0.6]}
+
+
+def write_calendar_weather_file(in_dir: Path) -> None:
+    # Three days of hourly weather, from December 31st 2019 to January 2nd 2020
+    rng = np.random.default_rng(1)
+    n_time, n_lat, n_lon = 72, 2, 2
+    with Dataset(in_dir / CALENDAR_WEATHER_FILE, "w") as weather_data:
+        weather_data.createDimension("time", n_time)
+        weather_data.createDimension("latitude", n_lat)
+        weather_data.createDimension("longitude", n_lon)
+        time = weather_data.createVariable("time", "i4", ("time",))
+        time.units = "hours since 2019-12-31 00:00:00"
+        time.calendar = "gregorian"
+        time[:] = np.arange(n_time)
+        weather_data.createVariable("latitude", "f8", ("latitude",))[:] = [51.0, 50.0]
+        weather_data.createVariable("longitude", "f8", ("longitude",))[:] = [-114.0, -113.0]
+        for var, scale in (("t2m", 270.0), ("u10", 5.0), ("v10", 5.0), ("tp", 0.001)):
+            weather_data.createVariable(var, "f8", ("time", "latitude", "longitude"))[:] = (
+                rng.random((n_time, n_lat, n_lon)) * scale
+            )
+
+
+def calendar_weather(in_dir: Path, policy: str) -> WeatherLookup:
+    write_calendar_weather_file(in_dir)
+    return WeatherLookup(
+        {"weather_file": CALENDAR_WEATHER_FILE, "weather_out_of_range": policy}, in_dir
+    )
+
+
+def test_000_dates_in_the_weather_file_use_their_calendar_day(tmp_path):
+    weather = calendar_weather(tmp_path, "error")
+    assert weather.day_index(date(2019, 12, 31)) == 0
+    assert weather.day_index(date(2020, 1, 1)) == 1
+    assert weather.day_index(date(2020, 1, 2)) == 2
+
+    deployment_days = weather.deployment_days(WEATHER_ENVS, 8)
+    assert deployment_days.shape == (3, 2, 2)
+    for day in range(3):
+        hour = day * 24 + 8
+        temps, winds, precip = weather.temps[hour], weather.winds[hour], weather.precip[hour]
+        np.testing.assert_array_equal(
+            deployment_days[day],
+            (-100 <= temps) & (temps <= 0) & (winds <= 6) & (precip <= 0.6),
+        )
+
+
+def test_000_dates_outside_the_weather_file_are_cycled_by_year(tmp_path):
+    weather = calendar_weather(tmp_path, "cycle")
+    assert weather.day_index(date(2021, 1, 2)) == 2
+    assert weather.day_index(date(2022, 12, 31)) == 0
+    assert weather.day_index(date(2017, 1, 1)) == 1
+    # Days of the year that are not in the weather file fall back to its closest day
+    assert weather.day_index(date(2023, 6, 1)) == 2
+    assert pickle.loads(pickle.dumps(weather)).day_index(date(2021, 1, 2)) == 2
+
+
+def test_000_dates_outside_the_weather_file_are_clamped(tmp_path):
+    weather = calendar_weather(tmp_path, "clamp")
+    assert weather.day_index(date(2021, 1, 2)) == 2
+    assert weather.day_index(date(2019, 1, 1)) == 0
+
+
+def test_000_dates_outside_the_weather_file_raise_an_error(tmp_path):
+    weather = calendar_weather(tmp_path, "error")
+    with pytest.raises(SystemExit):
+        weather.day_index(date(2020, 1, 3))
+
+
+def test_000_invalid_out_of_range_policy_raises_an_error(tmp_path):
+    with pytest.raises(SystemExit):
+        calendar_weather(tmp_path, "wrap")
+
+
+def test_000_weather_files_without_time_units_use_the_day_of_the_year(tmp_path):
+    write_weather_file(tmp_path)
+    weather = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path)
+    assert weather.day_index(date(2020, 1, 2)) == 1
+    assert weather.day_index(date(2020, 1, 3)) == 0
@@ -0,0 +1,100 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_deployment_days.py
+Purpose: Contains unit tests for the weather lookup deployment day masks.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import os
+import pickle
+
+import numpy as np
+
+from constants.file_name_constants import Generator_Files
+from weather.weather_lookup import WeatherLookup
+from testing.unit_testing.test_weather.test_weather_lookup.test_share_arrays import (
+    WEATHER_FILE,
+    write_weather_file,
+)
+
+HOUR = 8
+WEATHER_ENVS = {"temperature": [-100, 0], "wind": [0, 6], "precipitation": [0, 0.6]}
+
+
+def scalar_deployment_days(weather: WeatherLookup, weather_envs: dict) -> np.ndarray:
+    n_days = weather.time_length // 24
+    expected = np.zeros((n_days, weather.lat_length, weather.lon_length), bool)
+    for day in range(n_days):
+        for lat in range(weather.lat_length):
+            for lon in range(weather.lon_length):
+                time = day * 24 + HOUR
+                expected[day, lat, lon] = (
+                    weather_envs["temperature"][0]
+                    <= weather.temps[time, lat, lon]
+                    <= weather_envs["temperature"][1]
+                    and weather_envs["wind"][0]
+                    <= weather.winds[time, lat, lon]
+                    <= weather_envs["wind"][1]
+                    and weather_envs["precipitation"][0]
+                    <= weather.precip[time, lat, lon]
+                    <= weather_envs["precipitation"][1]
+                )
+    return expected
+
+
+def test_000_deployment_days_match_scalar_weather_checks(tmp_path):
+    write_weather_file(tmp_path)
+    weather = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path)
+    deployment_days = weather.deployment_days(WEATHER_ENVS, HOUR)
+    expected = scalar_deployment_days(weather, WEATHER_ENVS)
+    assert deployment_days.shape == (2, 3, 4)
+    assert expected.any() and not expected.all()
+    np.testing.assert_array_equal(deployment_days, expected)
+
+
+def test_000_deployment_days_are_cached_by_weather_and_envelopes(tmp_path):
+    write_weather_file(tmp_path)
+    cache_dir = tmp_path / "generator"
+    weather = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path, cache_dir=cache_dir)
+    deployment_days = weather.deployment_days(WEATHER_ENVS, HOUR)
+    cache_files = list(cache_dir.glob(Generator_Files.DEPLOYMENT_DAYS_FILE.format(key="*")))
+    assert len(cache_files) == 1
+    np.testing.assert_array_equal(np.load(cache_files[0]), deployment_days)
+
+    # A new lookup on the same weather file loads the saved mask
+    reloaded = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path, cache_dir=cache_dir)
+    np.save(cache_files[0], ~deployment_days)
+    np.testing.assert_array_equal(reloaded.deployment_days(WEATHER_ENVS, HOUR), ~deployment_days)
+
+    # Unpickled lookups keep the cache location and weather file key
+    unpickled = pickle.loads(pickle.dumps(weather))
+    assert unpickled.weather_file_key == weather.weather_file_key
+    np.testing.assert_array_equal(unpickled.deployment_days(WEATHER_ENVS, HOUR), ~deployment_days)
+
+    # Different envelopes are saved under a different key
+    wider_envs = {**WEATHER_ENVS, "wind": [0, 100]}
+    np.testing.assert_array_equal(
+        weather.deployment_days(wider_envs, HOUR), scalar_deployment_days(weather, wider_envs)
+    )
+    assert len(list(cache_dir.glob(Generator_Files.DEPLOYMENT_DAYS_FILE.format(key="*")))) == 2
+
+    # The weather file key changes when the file is modified
+    file_stats = os.stat(tmp_path / WEATHER_FILE)
+    os.utime(tmp_path / WEATHER_FILE, ns=(file_stats.st_atime_ns, file_stats.st_mtime_ns + 10**9))
+    modified = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path, cache_dir=cache_dir)
+    assert modified.weather_file_key != weather.weather_file_key
+    np.testing.assert_array_equal(modified.deployment_days(WEATHER_ENVS, HOUR), deployment_days)
+    assert len(list(cache_dir.glob(Generator_Files.DEPLOYMENT_DAYS_FILE.format(key="*")))) == 3
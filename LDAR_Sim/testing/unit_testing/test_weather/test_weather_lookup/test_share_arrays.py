@@ -0,0 +1,72 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_share_arrays.py
+Purpose: Contains unit tests for sharing the weather arrays through memory mapped files.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import pickle
+from pathlib import Path
+
+import numpy as np
+from netCDF4 import Dataset
+
+from weather.weather_lookup import SHARED_WEATHER_ARRAYS, WeatherLookup
+
+WEATHER_FILE = "weather_test.nc"
+
+
+def write_weather_file(in_dir: Path) -> None:
+    rng = np.random.default_rng(0)
+    n_time, n_lat, n_lon = 48, 3, 4
+    with Dataset(in_dir / WEATHER_FILE, "w") as weather_data:
+        weather_data.createDimension("time", n_time)
+        weather_data.createDimension("latitude", n_lat)
+        weather_data.createDimension("longitude", n_lon)
+        weather_data.createVariable("time", "f8", ("time",))[:] = np.arange(n_time)
+        weather_data.createVariable("latitude", "f8", ("latitude",))[:] = [52.0, 51.0, 50.0]
+        weather_data.createVariable("longitude", "f8", ("longitude",))[:] = [
+            -114.0,
+            -113.0,
+            -112.0,
+            -111.0,
+        ]
+        for var, scale in (("t2m", 270.0), ("u10", 5.0), ("v10", 5.0), ("tp", 0.001)):
+            weather_data.createVariable(var, "f8", ("time", "latitude", "longitude"))[:] = (
+                rng.random((n_time, n_lat, n_lon)) * scale
+            )
+
+
+def test_000_shared_weather_arrays_match_and_are_not_pickled(tmp_path):
+    write_weather_file(tmp_path)
+    weather = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path)
+    in_memory = {name: np.array(getattr(weather, name)) for name in SHARED_WEATHER_ARRAYS}
+    in_memory_pickle_size = len(pickle.dumps(weather))
+
+    shared_dir = tmp_path / "generator"
+    shared_dir.mkdir()
+    weather.share_arrays(shared_dir)
+    shared_pickle = pickle.dumps(weather)
+    unpickled = pickle.loads(shared_pickle)
+
+    assert len(shared_pickle) < in_memory_pickle_size
+    for name in SHARED_WEATHER_ARRAYS:
+        array = getattr(unpickled, name)
+        assert isinstance(array, np.memmap)
+        assert not array.flags.writeable
+        np.testing.assert_array_equal(array, in_memory[name])
+    np.testing.assert_array_equal(unpickled.latitude, weather.latitude)
+    assert unpickled.time_length == weather.time_length
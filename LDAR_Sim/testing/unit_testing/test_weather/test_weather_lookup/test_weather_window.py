@@ -0,0 +1,118 @@
+"""
+------------------------------------------------------------------------------
+Program:     The LDAR Simulator (LDAR-Sim)
+File:        test_weather_window.py
+Purpose: Contains unit tests for reading in the window of the weather file covering the
+sites and simulated dates.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the MIT License as published
+by the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+MIT License for more details.
+You should have received a copy of the MIT License
+along with this program.  If not, see <https://opensource.org/licenses/MIT>.
+
+------------------------------------------------------------------------------
+"""
+
+import pickle
+from datetime import date
+
+import numpy as np
+
+from virtual_world.infrastructure import Infrastructure
+from weather.weather_lookup import SHARED_WEATHER_ARRAYS, WeatherLookup
+from testing.unit_testing.test_weather.test_weather_lookup.test_day_index import (
+    CALENDAR_WEATHER_FILE,
+    write_calendar_weather_file,
+)
+from testing.unit_testing.test_weather.test_weather_lookup.test_share_arrays import (
+    WEATHER_FILE,
+    write_weather_file,
+)
+
+
+class MockSite:
+    def __init__(self, lat, lon):
+        self._lat = lat
+        self._lon = lon
+
+    def get_loc(self):
+        return self._lat, self._lon
+
+    def set_weather_lat(self, lat):
+        self.weather_lat = lat
+
+    def set_weather_long(self, lon):
+        self.weather_long = lon
+
+
+def set_weather_index(weather: WeatherLookup, sites: list[MockSite]) -> list[tuple[int, int]]:
+    infrastructure = Infrastructure.__new__(Infrastructure)
+    infrastructure._sites = sites
+    infrastructure.set_weather_index(weather)
+    return [(site.weather_lat, site.weather_long) for site in sites]
+
+
+def test_000_weather_is_windowed_to_the_site_bounds(tmp_path):
+    write_weather_file(tmp_path)
+    sites = [MockSite(50.9, -113.1), MockSite(51.2, -112.8)]
+    infrastructure = Infrastructure.__new__(Infrastructure)
+    infrastructure._sites = sites
+    site_bounds = infrastructure.get_site_bounds()
+    assert site_bounds == (50.9, 51.2, -113.1, -112.8)
+
+    full = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path)
+    windowed = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path, site_bounds=site_bounds)
+    assert (windowed.lat_offset, windowed.lat_length) == (0, 3)
+    assert (windowed.lon_offset, windowed.lon_length) == (0, 3)
+    assert windowed.time_length == full.time_length
+    for name in SHARED_WEATHER_ARRAYS:
+        np.testing.assert_array_equal(getattr(windowed, name), getattr(full, name)[:, :3, :3])
+
+    full_index = set_weather_index(full, sites)
+    windowed_index = set_weather_index(windowed, sites)
+    for (full_lat, full_lon), (lat, lon) in zip(full_index, windowed_index):
+        assert full_lat == lat + windowed.lat_offset
+        assert full_lon == lon + windowed.lon_offset
+        np.testing.assert_array_equal(
+            windowed.temps[:, lat, lon], full.temps[:, full_lat, full_lon]
+        )
+
+
+def test_000_weather_window_offsets_are_kept(tmp_path):
+    write_weather_file(tmp_path)
+    site_bounds = (50.0, 50.0, -111.2, -111.0)
+    full = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path)
+    windowed = WeatherLookup({"weather_file": WEATHER_FILE}, tmp_path, site_bounds=site_bounds)
+    # Latitudes are descending in the file
+    assert (windowed.lat_offset, windowed.lat_length) == (1, 2)
+    assert (windowed.lon_offset, windowed.lon_length) == (2, 2)
+    np.testing.assert_array_equal(windowed.precip, full.precip[:, 1:3, 2:4])
+    unpickled = pickle.loads(pickle.dumps(windowed))
+    assert (unpickled.time_offset, unpickled.lat_offset, unpickled.lon_offset) == (0, 1, 2)
+
+
+def test_000_weather_is_windowed_to_the_simulated_dates(tmp_path):
+    write_calendar_weather_file(tmp_path)
+    virtual_world = {"weather_file": CALENDAR_WEATHER_FILE}
+    full = WeatherLookup(virtual_world, tmp_path)
+    windowed = WeatherLookup(
+        virtual_world, tmp_path, date_range=(date(2020, 1, 1), date(2020, 1, 1))
+    )
+    assert (windowed.time_offset, windowed.time_length) == (24, 24)
+    np.testing.assert_array_equal(windowed.days, [np.datetime64("2020-01-01")])
+    np.testing.assert_array_equal(windowed.temps, full.temps[24:48])
+    assert windowed.day_index(date(2020, 1, 1)) == 0
+    weather_envs = {"temperature": [-100, 0], "wind": [0, 6], "precipitation": [0, 1]}
+    np.testing.assert_array_equal(
+        windowed.deployment_days(weather_envs), full.deployment_days(weather_envs)[1:2]
+    )
+
+    # Simulations reaching past the weather file keep the whole file to cycle onto
+    cycled = WeatherLookup(virtual_world, tmp_path, date_range=(date(2020, 1, 1), date(2021, 1, 1)))
+    assert (cycled.time_offset, cycled.time_length) == (0, 72)